@@ -22,10 +22,13 @@ logger = logging.getLogger('main')
 
 # Import the enhanced animated UI
 from terminal.animated_ui import AnimatedTerminalUI
-from api.tutorials import TutorialClient
+from api.tutorials import TutorialClient, TutorialPrefetcher, describe_cache_age
+from api.prefetch import SpeculativePrefetcher
+from api.outbox import get_outbox
 from api.auth import login, load_api_key
 import powershell.executor as ps_executor
-from utils.config import API_BASE_URL
+from utils.config import API_BASE_URL, OFFLINE_FIRST
+from content.models import Tutorial, TutorialStep
 
 def check_command(user_input: str, expected_command: str, validation_type: str = 'exact', 
                  case_sensitive: bool = False, output_check: str = None) -> Tuple[bool, str]:
@@ -178,10 +181,12 @@ def run_animated_tutorial_step(ui: AnimatedTerminalUI, step: Dict[str, Any],
         return False
     
     # Extract step details
-    step_id = step.get('id', f'step{step_number}')
-    expected_command = step.get('expectedCommand', '')
-    hint = step.get('hint', 'Try reading the instructions carefully.')
-    ascii_art = step.get('ascii_art', None)
+    step = TutorialStep.from_dict(step)
+    step_id = step.id or f'step{step_number}'
+    expected_command = step.command if step.command is not None else "Get-Help"
+    hint = step.hint if step.hint is not None else "Type the command shown in the instructions."
+    ascii_art = step.ascii_art
+    xp_reward = step.xp_reward if step.xp_reward is not None else 10
     
     # Look for success_message and failure_message (newer format) 
     # These might be embedded in the hint field
@@ -204,7 +209,7 @@ def run_animated_tutorial_step(ui: AnimatedTerminalUI, step: Dict[str, Any],
                 break
     
     # Get validation settings
-    validation = step.get('validation', {})
+    validation = step.validation or {}
     if isinstance(validation, dict):
         validation_type = validation.get('type', 'exact')
         case_sensitive = validation.get('caseSensitive', False)
@@ -280,10 +285,10 @@ def run_animated_tutorial_step(ui: AnimatedTerminalUI, step: Dict[str, Any],
             
             # Report step completion to the API
             tutorial_client = TutorialClient()
-            tutorial_client.report_step_completion(tutorial_id, step_id, step.get('xpReward', step.get('xp', 10)))
+            tutorial_client.report_step_completion(tutorial_id, step_id, xp_reward)
             
             # Show XP animation
-            ui.animate_xp_gain(step.get('xpReward', step.get('xp', 10)))
+            ui.animate_xp_gain(xp_reward)
             
             # Display ASCII art if available
             if ascii_art:
@@ -338,38 +343,72 @@ def run_animated_tutorial(ui: AnimatedTerminalUI, tutorial: Dict[str, Any]) -> N
     
     total_xp = 0
     
+    # Normalize once so the step loop works on typed steps
+    tutorial = Tutorial.from_dict(tutorial)
+    steps = tutorial.steps or []
+    
     # Run each step with animations
-    for i, step in enumerate(tutorial.get('steps', []), 1):
-        # Ensure step is a dictionary
-        if not isinstance(step, dict):
+    for i, step in enumerate(steps, 1):
+        # Ensure step is a mapping
+        if not isinstance(step, TutorialStep):
             ui.display_error(f"Step {i} has an invalid format. Skipping.")
             continue
-            
-        # Ensure step has the expected keys
-        if 'instructions' not in step:
-            step['instructions'] = f"Step {i} of the tutorial."
-            
-        if 'expectedCommand' not in step:
-            step['expectedCommand'] = "Get-Help"
-            
-        if 'hint' not in step:
-            step['hint'] = "Type the command shown in the instructions."
         
-        if not run_animated_tutorial_step(ui, step, i, len(tutorial.get('steps', [])), tutorial.get('id')):
+        if step.content is None:
+            step = step.copy()
+            step.content = f"Step {i} of the tutorial."
+        
+        if not run_animated_tutorial_step(ui, step, i, len(steps), tutorial.id):
             # Step failed or user quit
             ui.display_error("Tutorial stopped. You can try again later.")
             return
         
         # Add XP for the step
-        step_xp = step.get('xpReward', step.get('xp', 10))
-        total_xp += step_xp
+        total_xp += step.xp_reward if step.xp_reward is not None else 10
     
     # Report tutorial completion to the API
     tutorial_client = TutorialClient()
-    tutorial_client.report_tutorial_completion(tutorial.get('id'), total_xp)
+    tutorial_client.report_tutorial_completion(tutorial.id, total_xp)
     
     # Celebrate tutorial completion with animations
-    ui.celebrate_tutorial_completion(tutorial.get('title', 'Tutorial'), total_xp)
+    ui.celebrate_tutorial_completion(tutorial.title or 'Tutorial', total_xp)
+
+
+def display_tutorial_list(ui: AnimatedTerminalUI, tutorials: List[Dict[str, Any]],
+                          default_tutorial_id: str, animate: bool = True) -> None:
+    """
+    Display the numbered tutorial menu.
+    
+    Args:
+        ui: Animated terminal UI
+        tutorials: Tutorials to list
+        default_tutorial_id: ID of the tutorial marked as default
+        animate: Type out each line (False prints the list at once, e.g. on refresh)
+    """
+    for i, tutorial in enumerate(tutorials, 1):
+        title = tutorial.get('title', 'Untitled')
+        difficulty = tutorial.get('difficulty', 'Unknown')
+        id = tutorial.get('id', 'unknown')
+        
+        # Create a colorful display based on difficulty
+        if difficulty.lower() == 'beginner':
+            diff_color = "green"
+        elif difficulty.lower() == 'intermediate':
+            diff_color = "yellow"
+        else:
+            diff_color = "red"
+        
+        # Mark default tutorial
+        if tutorial.get('id') == default_tutorial_id:
+            tutorial_text = f"[cyan]{i}.[/cyan] [bold][yellow]* DEFAULT *[/yellow] {title}[/bold] [[{diff_color}]{difficulty}[/{diff_color}]] (ID: {id})"
+        else:
+            tutorial_text = f"[cyan]{i}.[/cyan] [bold]{title}[/bold] [[{diff_color}]{difficulty}[/{diff_color}]] (ID: {id})"
+        
+        if animate:
+            ui.animated_rich_text(tutorial_text, delay=0.01)
+            time.sleep(0.1)  # Slight pause between tutorials
+        else:
+            ui.console.print(tutorial_text)
 
 
 def animated_main():
@@ -403,8 +442,12 @@ def animated_main():
     )
     ui.console.print()
     
-    # Create tutorial client with the API key
-    tutorial_client = TutorialClient(api_key)
+    # Deliver progress that was saved while offline in earlier sessions
+    get_outbox().register(api_key)
+    
+    # Create tutorial client with the API key; offline-first (opt-in) shows the
+    # last known tutorials at once and revalidates them in the background
+    tutorial_client = TutorialClient(api_key, offline_first=OFFLINE_FIRST)
     
     try:
         # Fetch tutorials with loading animation
@@ -418,6 +461,10 @@ def animated_main():
             ui.display_error("Failed to retrieve tutorials from the API. Please check your API configuration.")
             sys.exit(1)
         
+        # Fetch the details of every tutorial in the background while the menu is shown
+        prefetcher = TutorialPrefetcher(api_key)
+        prefetcher.start(tutorials)
+        
         # Log the tutorials received
         logger.info(f"Fetched {len(tutorials)} tutorials from API")
         for tutorial in tutorials:
@@ -439,8 +486,23 @@ def animated_main():
         
         # Display available tutorials with animation
         ui.console.rule("[bold blue]Available Tutorials[/bold blue]")
+        if tutorial_client.cache_age is not None:
+            notice = f"Showing tutorials saved {describe_cache_age(tutorial_client.cache_age)}"
+            if tutorial_client.revalidating:
+                notice += "; checking for updates in the background"
+            ui.console.print(f"[dim]{notice}[/dim]")
         ui.console.print()
         
+        # Runs on the revalidation thread: keep the fresh list for the main thread,
+        # which shows it the next time the menu is rendered
+        updates = {}
+        
+        def on_update(kind, tutorial_id, data):
+            if kind == 'tutorials' and data:
+                updates['tutorials'] = data
+        
+        tutorial_client.on_update(on_update)
+        
         # Create and display tutorial table with animations
         if default_tutorial:
             table_title = "Choose a tutorial or press Enter to start the default tutorial"
@@ -451,27 +513,7 @@ def animated_main():
         ui.console.print()
         
         # Display tutorials one by one with a subtle animation
-        for i, tutorial in enumerate(tutorials, 1):
-            title = tutorial.get('title', 'Untitled')
-            difficulty = tutorial.get('difficulty', 'Unknown')
-            id = tutorial.get('id', 'unknown')
-            
-            # Create a colorful display based on difficulty
-            if difficulty.lower() == 'beginner':
-                diff_color = "green"
-            elif difficulty.lower() == 'intermediate':
-                diff_color = "yellow"
-            else:
-                diff_color = "red"
-            
-            # Mark default tutorial
-            if tutorial.get('id') == default_tutorial_id:
-                tutorial_text = f"[cyan]{i}.[/cyan] [bold][yellow]* DEFAULT *[/yellow] {title}[/bold] [[{diff_color}]{difficulty}[/{diff_color}]] (ID: {id})"
-            else:
-                tutorial_text = f"[cyan]{i}.[/cyan] [bold]{title}[/bold] [[{diff_color}]{difficulty}[/{diff_color}]] (ID: {id})"
-                
-            ui.animated_rich_text(tutorial_text, delay=0.01)
-            time.sleep(0.1)  # Slight pause between tutorials
+        display_tutorial_list(ui, tutorials, default_tutorial_id)
         
         # Prompt for tutorial selection with animation
         ui.console.print()
@@ -519,26 +561,51 @@ def animated_main():
                     selected_tutorial = tutorials[0]
                     tutorial_id = selected_tutorial.get('id')
         
-        # Loading animation for tutorial
-        ui.console.print()
-        loading_text = f"Loading tutorial [bold]{tutorial_id}[/bold]..."
-        ui.animated_rich_text(loading_text, style="italic", delay=0.02)
-        
-        # Fetch the full tutorial details with loading animation
-        full_tutorial = ui.display_loading(
-            f"Fetching tutorial data from API...",
-            lambda: tutorial_client.get_tutorial_by_id(tutorial_id)
-        )
-        
-        if full_tutorial:
+        # While a tutorial runs, the ones likely to come next are fetched in the background
+        speculative = SpeculativePrefetcher(prefetcher)
+        while selected_tutorial:
+            tutorial_id = selected_tutorial.get('id')
+            
+            # Loading animation for tutorial
+            ui.console.print()
+            loading_text = f"Loading tutorial [bold]{tutorial_id}[/bold]..."
+            ui.animated_rich_text(loading_text, style="italic", delay=0.02)
+            
+            # Fetch the full tutorial details with loading animation
+            full_tutorial = ui.display_loading(
+                f"Fetching tutorial data from API...",
+                lambda: (tutorial_client.get_cached_tutorial(tutorial_id)
+                         or prefetcher.get(tutorial_id, timeout=10.0)
+                         or tutorial_client.get_tutorial_by_id(tutorial_id))
+            )
+            
+            if not full_tutorial:
+                ui.display_error(f"Failed to load tutorial {tutorial_id} from API. Please check your connection.")
+                sys.exit(1)
+            
             # Log successful tutorial load
             logger.info(f"Successfully loaded tutorial from API: ID={tutorial_id}, Title={full_tutorial.get('title', 'Unknown')}")
             
             # Run the interactive tutorial with animations
+            speculative.warm(full_tutorial, tutorials)
             run_animated_tutorial(ui, full_tutorial)
-        else:
-            ui.display_error(f"Failed to load tutorial {tutorial_id} from API. Please check your connection.")
-            sys.exit(1)
+            
+            fresh = updates.pop('tutorials', None)
+            if fresh:
+                tutorials[:] = fresh
+                ui.console.print()
+                ui.console.rule("[bold blue]Available Tutorials (updated)[/bold blue]")
+                display_tutorial_list(ui, tutorials, default_tutorial_id, animate=False)
+            
+            # Offer the tutorial most likely to come next (already fetched by now)
+            selected_tutorial = speculative.next_tutorial(full_tutorial, tutorials)
+            if selected_tutorial:
+                ui.console.print()
+                ui.console.print(f"[yellow]Continue with the next tutorial: [bold]{selected_tutorial.get('title')}[/bold]? (Y/n)[/yellow]")
+                user_choice = input("> ").strip().lower()
+                if user_choice not in ('', 'y', 'yes'):
+                    selected_tutorial = None
+        prefetcher.stop()
             
     except KeyboardInterrupt:
         ui.console.print("\n[bold yellow]Operation cancelled by user.[/bold yellow]")
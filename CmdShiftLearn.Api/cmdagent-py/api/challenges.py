@@ -5,11 +5,12 @@ API client for interacting with the CmdShiftLearn challenges API.
 import json
 import logging
 import httpx
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable
 
 # Import only what's needed
 from utils import API_BASE_URL
 from api.auth import get_auth_header
+from api.session import ApiSession, AsyncApiClient, DEFAULT_CONCURRENCY, get_session
 
 # Configure logging
 logging.basicConfig(
@@ -22,8 +23,15 @@ logger = logging.getLogger('api.challenges')
 class ChallengeClient:
     """Client for interacting with the challenges API."""
     
-    def __init__(self):
+    def __init__(self, session: ApiSession = None):
+        """
+        Initialize the client.
+        
+        Args:
+            session: HTTP session to use (defaults to the process-wide pooled session)
+        """
         self.base_url = f"{API_BASE_URL}/challenges"
+        self.session = session or get_session()
     
     def get_challenges(self) -> List[Dict[str, Any]]:
         """
@@ -38,9 +46,8 @@ class ChallengeClient:
             # Get authentication headers (includes apikey)
             headers = get_auth_header()
             
-            # Use httpx with a 10-second timeout
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(self.base_url, headers=headers)
+            # Reuse the pooled keep-alive connection
+            response = self.session.get(self.base_url, headers=headers)
             
             logger.info(f"API response status code: {response.status_code}")
             response.raise_for_status()  # Raise exception for 4XX/5XX responses
@@ -59,4 +66,57 @@ class ChallengeClient:
             
         except httpx.RequestError as e:
             logger.error(f"Error fetching challenges: {e}")
-            return []
\ No newline at end of file
+            return []
+
+
+class AsyncChallengeClient(AsyncApiClient):
+    """
+    Async client for the challenges API.
+    
+    Failed fetches are logged and return None (or an empty list).
+    """
+    
+    def __init__(self, api_key=None, session: ApiSession = None, max_concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Initialize the client.
+        
+        Args:
+            api_key: API key (defaults to the stored key)
+            session: Session whose settings are used (defaults to the shared session)
+            max_concurrency: Maximum number of requests in flight
+        """
+        super().__init__(api_key, session, max_concurrency)
+        self.base_url = f"{API_BASE_URL}/challenges"
+    
+    async def get_challenges(self) -> List[Dict[str, Any]]:
+        """
+        Fetch all available challenges.
+        
+        Returns:
+            List[Dict[str, Any]]: Challenge objects (empty if the request failed)
+        """
+        return await self._get_json(self.base_url) or []
+    
+    async def get_challenge_by_id(self, challenge_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a specific challenge by its ID.
+        
+        Args:
+            challenge_id: The ID of the challenge to fetch
+            
+        Returns:
+            Dict[str, Any] or None: The challenge, or None if it could not be fetched
+        """
+        return await self._get_json(f"{self.base_url}/{challenge_id}")
+    
+    async def get_many(self, challenge_ids: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch several challenges concurrently.
+        
+        Args:
+            challenge_ids: IDs of the challenges to fetch
+            
+        Returns:
+            dict: Challenge ID -> challenge, or None for challenges that could not be fetched
+        """
+        return await self._get_many(lambda challenge_id: f"{self.base_url}/{challenge_id}", list(challenge_ids))
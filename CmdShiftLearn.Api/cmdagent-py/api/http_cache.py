@@ -0,0 +1,311 @@
+"""
+On-disk HTTP response cache with conditional revalidation.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+import httpx
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from utils.config import DATA_DIR
+
+logger = logging.getLogger('api.http_cache')
+
+# Default location of the cached API responses
+DEFAULT_HTTP_CACHE_DIR = Path(DATA_DIR) / "cache" / "http"
+
+# Default upper bound on the size of the cache directory
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """
+    Parse a Cache-Control header.
+
+    Args:
+        value: Header value, e.g. 'private, max-age=300'
+
+    Returns:
+        dict: Lower-cased directive -> argument (None for directives without one)
+    """
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def auth_scope(headers: Dict[str, str]) -> str:
+    """
+    Identify whose credentials a request carries, without storing them.
+
+    Args:
+        headers: Request headers
+
+    Returns:
+        str: A short hash of the Authorization header, or 'anonymous'
+    """
+    for name, value in (headers or {}).items():
+        if name.lower() == 'authorization':
+            return hashlib.sha256(value.encode('utf-8')).hexdigest()[:16]
+    return 'anonymous'
+
+
+class CachedResponse:
+    """One cached response: validators, freshness lifetime and body."""
+
+    __slots__ = ('url', 'headers', 'body', 'stored_at', 'max_age')
+
+    def __init__(self, url: str, headers: Dict[str, str], body: bytes, stored_at: float, max_age: float):
+        self.url = url
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+        self.max_age = max_age
+
+    def is_fresh(self, now: float = None) -> bool:
+        """Whether the response may be used without asking the server."""
+        return ((now or time.time()) - self.stored_at) < self.max_age
+
+    @property
+    def age(self) -> float:
+        """Seconds since the response was stored or last revalidated."""
+        return max(0.0, time.time() - self.stored_at)
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers that revalidate this response."""
+        headers = {}
+        if self.headers.get('etag'):
+            headers['If-None-Match'] = self.headers['etag']
+        if self.headers.get('last-modified'):
+            headers['If-Modified-Since'] = self.headers['last-modified']
+        return headers
+
+    def to_response(self) -> httpx.Response:
+        """Rebuild a 200 response (json(), text and raise_for_status() work as usual)."""
+        return httpx.Response(200, headers=self.headers, content=self.body,
+                              request=httpx.Request('GET', self.url))
+
+
+class HttpCache:
+    """
+    Disk cache for GET responses, keyed by URL and API key.
+
+    Responses are stored with their ETag and Last-Modified validators.
+    A response is served without a request while it is fresh according to
+    Cache-Control max-age; after that the request is sent with
+    If-None-Match / If-Modified-Since, and a 304 answer is served from the
+    cache, so an unchanged catalog costs a round-trip with an empty body.
+    Responses without validators or max-age are stored as always stale:
+    they are fetched again on every request, but remain available as the
+    last-known copy while the API cannot be reached. Responses marked
+    no-store are not stored.
+
+    Entries of different API keys never mix: the key is part of the cache
+    key (only a hash of it is used). Each entry is one file; when the
+    directory grows past ``max_bytes`` the least recently used entries are
+    removed.
+    """
+
+    # Bump when the entry layout changes so old entries are ignored
+    VERSION = 1
+
+    # Response headers kept with an entry
+    KEPT_HEADERS = ('content-type', 'etag', 'last-modified', 'cache-control')
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory of the entries (defaults to data/cache/http)
+            max_bytes: Size the directory is trimmed back to
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_HTTP_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.stats = {'fresh': 0, 'revalidated': 0, 'misses': 0, 'stored': 0, 'evicted': 0}
+        self._size = None
+        self._lock = threading.Lock()
+
+    def _entry_path(self, url: str, headers: Dict[str, str]) -> Path:
+        """File holding the entry for a URL in the request's scope."""
+        key = hashlib.sha256(f"{auth_scope(headers)}\0{url}".encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.entry"
+
+    def lookup(self, url: str, headers: Dict[str, str] = None) -> Optional[CachedResponse]:
+        """
+        Find the cached response for a request.
+
+        Args:
+            url: Request URL
+            headers: Request headers (the Authorization header selects the scope)
+
+        Returns:
+            CachedResponse or None: The entry, fresh or stale
+        """
+        path = self._entry_path(url, headers)
+        try:
+            with open(path, 'rb') as file:
+                meta = json.loads(file.readline())
+                body = file.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable HTTP cache entry {path}: {e}")
+            return None
+
+        if meta.get('version') != self.VERSION or meta.get('url') != url:
+            return None
+        try:
+            # Mark as recently used for eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return CachedResponse(url, meta['headers'], body, meta['stored_at'], meta['max_age'])
+
+    def update(self, url: str, headers: Dict[str, str], entry: Optional[CachedResponse],
+               response: httpx.Response) -> httpx.Response:
+        """
+        Record a response to a (possibly conditional) request.
+
+        Args:
+            url: Request URL
+            headers: Request headers (without the conditional ones)
+            entry: Entry the request was revalidating, if any
+            response: The response; its body must already be read
+
+        Returns:
+            httpx.Response: The response to hand to the caller (the cached
+                            body for a 304, otherwise ``response`` itself)
+        """
+        if response.status_code == 304 and entry is not None:
+            self.stats['revalidated'] += 1
+            for name in self.KEPT_HEADERS:
+                if name in response.headers:
+                    entry.headers[name] = response.headers[name]
+            entry.stored_at = time.time()
+            entry.max_age = self._max_age(response.headers)
+            self._write(url, headers, entry)
+            return entry.to_response()
+
+        self.stats['misses'] += 1
+        if response.status_code == 200:
+            self.store(url, headers, response)
+        return response
+
+    def store(self, url: str, headers: Dict[str, str], response: httpx.Response) -> bool:
+        """
+        Store a 200 response unless it is marked no-store.
+
+        Args:
+            url: Request URL
+            headers: Request headers
+            response: The response (body already read)
+
+        Returns:
+            bool: True if the response was stored
+        """
+        directives = parse_cache_control(response.headers.get('cache-control'))
+        if 'no-store' in directives:
+            return False
+        # Without validators or max-age the entry is stale at once and only used offline
+        max_age = self._max_age(response.headers)
+
+        kept = {name: response.headers[name] for name in self.KEPT_HEADERS if name in response.headers}
+        self._write(url, headers, CachedResponse(url, kept, response.content, time.time(), max_age))
+        self.stats['stored'] += 1
+        return True
+
+    @staticmethod
+    def _max_age(response_headers) -> float:
+        """Freshness lifetime in seconds from Cache-Control (0 means always revalidate)."""
+        directives = parse_cache_control(response_headers.get('cache-control'))
+        if 'no-cache' in directives:
+            return 0.0
+        try:
+            max_age = float(directives.get('max-age') or 0)
+            age = float(response_headers.get('age') or 0)
+        except ValueError:
+            return 0.0
+        return max(0.0, max_age - age)
+
+    def _write(self, url: str, headers: Dict[str, str], entry: CachedResponse):
+        """Write an entry atomically and trim the cache if it grew too large."""
+        path = self._entry_path(url, headers)
+        meta = {
+            'version': self.VERSION,
+            'url': url,
+            'headers': entry.headers,
+            'stored_at': entry.stored_at,
+            'max_age': entry.max_age,
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            old_size = path.stat().st_size if path.exists() else 0
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'wb') as file:
+                file.write(json.dumps(meta).encode('utf-8') + b'\n')
+                file.write(entry.body)
+            os.replace(tmp_path, path)
+            new_size = path.stat().st_size
+        except OSError as e:
+            logger.warning(f"Could not write HTTP cache entry {path}: {e}")
+            return
+
+        with self._lock:
+            if self._size is not None:
+                self._size += new_size - old_size
+        if self._current_size() > self.max_bytes:
+            self.evict()
+
+    def _current_size(self) -> int:
+        """Total size of the entries (scanned once, then tracked)."""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(entry.stat().st_size for entry in os.scandir(self.cache_dir)
+                                 if entry.name.endswith('.entry'))
+            return self._size
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits in max_bytes.
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            try:
+                entries = [(entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                           for entry in os.scandir(self.cache_dir) if entry.name.endswith('.entry')]
+            except OSError:
+                return 0
+            entries.sort()
+            size = sum(entry_size for _, entry_size, _ in entries)
+            removed = 0
+            for _, entry_size, entry_path in entries:
+                if size <= self.max_bytes:
+                    break
+                try:
+                    os.remove(entry_path)
+                except OSError:
+                    continue
+                size -= entry_size
+                removed += 1
+            self._size = size
+            self.stats['evicted'] += removed
+            return removed
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            if self.cache_dir.exists():
+                for entry in os.scandir(self.cache_dir):
+                    if entry.name.endswith('.entry'):
+                        os.remove(entry.path)
+            self._size = 0
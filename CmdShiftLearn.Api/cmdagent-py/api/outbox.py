@@ -0,0 +1,309 @@
+"""
+Durable outbox for progress events sent to the CmdShiftLearn API.
+"""
+
+import json
+import time
+import atexit
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from utils import API_BASE_URL, DATA_DIR
+from api.auth import get_auth_header
+from api.http_cache import auth_scope
+from api.resilience import RetryPolicy, CircuitOpenError
+from api.session import ApiSession, get_session
+
+logger = logging.getLogger('api.outbox')
+
+# Default location of the outbox database
+DEFAULT_OUTBOX_PATH = Path(DATA_DIR) / "outbox.db"
+
+# Events sent per flush
+BATCH_SIZE = 20
+
+# Seconds an exiting process spends delivering what is still queued
+EXIT_FLUSH_DEADLINE = 2.0
+
+
+def _keep_highest_xp(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Coalesce two completions of one tutorial: the best result wins."""
+    return new if new.get('xpEarned', 0) >= old.get('xpEarned', 0) else old
+
+
+# Event kind -> (API path, how a newer event for the same key is merged into a queued one)
+EVENT_KINDS: Dict[str, tuple] = {
+    'tutorial-complete': ("/progress/tutorial-complete", _keep_highest_xp),
+}
+
+
+class ProgressOutbox:
+    """
+    Persistent queue of progress events with a background sender.
+
+    enqueue() writes the event to a local SQLite database and returns at
+    once; a daemon thread delivers queued events in batches over the
+    shared API session. Events are keyed by (user, kind, key), so
+    completing a tutorial again before the first report went out updates
+    the queued event instead of adding another. Failed deliveries are
+    retried with jittered exponential backoff, across restarts if needed:
+    nothing is lost while offline. Events the server rejects as invalid
+    (4xx other than 401, 408 and 429) are kept with status 'rejected'.
+
+    Users are identified by a hash of their API key; the key itself is
+    never written to the outbox, so events of a user are only sent once
+    that user's key has been registered in the running process.
+    """
+
+    def __init__(self, db_path: str = None, session: ApiSession = None, retry: RetryPolicy = None):
+        """
+        Open (or create) the outbox.
+
+        Args:
+            db_path: Database file (defaults to data/outbox.db)
+            session: API session used for delivery (defaults to the shared session)
+            retry: Backoff between delivery attempts of one event
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_OUTBOX_PATH
+        self.session = session or get_session()
+        self.retry = retry or RetryPolicy(base_delay=2.0, max_delay=300.0)
+        self.stats = {'queued': 0, 'coalesced': 0, 'sent': 0, 'retried': 0, 'rejected': 0}
+        # Scope -> API key (None means "the stored key") for users seen in this process
+        self._keys: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS events (
+                scope TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt REAL NOT NULL DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'pending',
+                last_error TEXT,
+                PRIMARY KEY (scope, kind, key)
+            )""")
+
+    def register(self, api_key: str = None) -> str:
+        """
+        Let the sender deliver the queued events of a user (e.g. from earlier runs).
+
+        Args:
+            api_key: The user's API key (defaults to the stored key)
+
+        Returns:
+            str: The user's scope
+        """
+        scope = auth_scope(get_auth_header(api_key))
+        with self._lock:
+            # Backoff from an earlier session says nothing about the API now
+            self._db.execute("UPDATE events SET next_attempt = 0 WHERE scope = ? AND status = 'pending'", (scope,))
+            self._keys[scope] = api_key
+            self._start()
+            self._wake.notify()
+        return scope
+
+    def enqueue(self, kind: str, key: str, payload: Dict[str, Any], api_key: str = None):
+        """
+        Queue an event, coalescing it with a queued event for the same key.
+
+        Args:
+            kind: Event kind (a key of EVENT_KINDS)
+            key: What the event is about (e.g. the tutorial ID)
+            payload: JSON body to send
+            api_key: API key of the user (defaults to the stored key)
+        """
+        merge = EVENT_KINDS[kind][1]
+        scope = auth_scope(get_auth_header(api_key))
+        with self._lock:
+            row = self._db.execute(
+                "SELECT payload, status FROM events WHERE scope = ? AND kind = ? AND key = ?",
+                (scope, kind, key)).fetchone()
+            if row is not None and row[1] == 'pending':
+                payload = merge(json.loads(row[0]), payload)
+                self.stats['coalesced'] += 1
+            # A newer event resets the retry schedule
+            self._db.execute(
+                "INSERT OR REPLACE INTO events (scope, kind, key, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+                (scope, kind, key, json.dumps(payload), time.time()))
+            self.stats['queued'] += 1
+            self._keys.setdefault(scope, api_key)
+            self._start()
+            self._wake.notify()
+
+    def pending(self) -> int:
+        """
+        Number of events waiting to be delivered.
+
+        Returns:
+            int: Pending events of every user
+        """
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM events WHERE status = 'pending'").fetchone()[0]
+
+    def flush(self, budget: float = None, due_only: bool = True) -> int:
+        """
+        Deliver a batch of queued events now.
+
+        Args:
+            budget: Seconds the whole batch may take (defaults to one request
+                    deadline per event)
+            due_only: Skip events whose retry time has not come yet
+
+        Returns:
+            int: Number of events delivered
+        """
+        with self._flush_lock:
+            with self._lock:
+                scopes = dict(self._keys)
+                if not scopes:
+                    return 0
+                rows = self._db.execute(
+                    f"SELECT scope, kind, key, payload, attempts FROM events "
+                    f"WHERE status = 'pending' AND scope IN ({','.join('?' * len(scopes))}) "
+                    f"AND next_attempt <= ? ORDER BY created_at LIMIT ?",
+                    (*scopes, time.time() if due_only else float('inf'), BATCH_SIZE)).fetchall()
+
+            end = time.monotonic() + budget if budget is not None else None
+            sent = 0
+            for scope, kind, key, payload, attempts in rows:
+                deadline = None
+                if end is not None:
+                    deadline = end - time.monotonic()
+                    if deadline <= 0:
+                        break
+                outcome, error = self._deliver(kind, json.loads(payload), scopes[scope], deadline)
+                if outcome == 'sent':
+                    sent += 1
+                self._settle(scope, kind, key, payload, attempts, outcome, error)
+                if outcome == 'down':
+                    # The API is down: leave the rest of the batch for later
+                    break
+
+            with self._lock:
+                self.stats['sent'] += sent
+            return sent
+
+    def _settle(self, scope: str, kind: str, key: str, payload: str, attempts: int,
+                outcome: str, error: Optional[str]):
+        """Record the outcome of a delivery, unless a newer event replaced the row meanwhile."""
+        match = (scope, kind, key, payload)
+        where = "WHERE scope = ? AND kind = ? AND key = ? AND payload = ?"
+        with self._lock:
+            if outcome == 'sent':
+                self._db.execute(f"DELETE FROM events {where}", match)
+            elif outcome == 'rejected':
+                self._db.execute(f"UPDATE events SET status = 'rejected', last_error = ? {where}", (error, *match))
+                self.stats['rejected'] += 1
+                logger.error(f"API rejected {kind} event for {key}: {error}")
+            else:
+                delay = self.retry.backoff(attempts)
+                if outcome == 'down':
+                    # No point trying before the circuit breaker lets calls through again
+                    delay = max(delay, self.session.breaker.retry_in)
+                self._db.execute(f"UPDATE events SET attempts = attempts + 1, next_attempt = ?, "
+                                 f"last_error = ? {where}", (time.time() + delay, error, *match))
+                self.stats['retried'] += 1
+                logger.info(f"Could not send {kind} event for {key} ({error}); retrying in {delay:.0f}s")
+
+    def _deliver(self, kind: str, payload: Dict[str, Any], api_key: Optional[str],
+                 deadline: Optional[float]) -> tuple:
+        """
+        POST one event.
+
+        Returns:
+            tuple: ('sent' | 'retry' | 'down' | 'rejected', error message or None)
+        """
+        try:
+            response = self.session.post(f"{API_BASE_URL}{EVENT_KINDS[kind][0]}", deadline=deadline,
+                                         headers=get_auth_header(api_key), json=payload)
+        except CircuitOpenError as e:
+            return 'down', str(e)
+        except Exception as e:
+            return 'retry', str(e) or type(e).__name__
+        if response.is_success:
+            return 'sent', None
+        if 400 <= response.status_code < 500 and response.status_code not in (401, 408, 429):
+            return 'rejected', f"{response.status_code} {response.text[:200]}"
+        return 'retry', f"HTTP {response.status_code}"
+
+    def _next_due(self) -> Optional[float]:
+        """Time of the next delivery attempt of a registered user (called with the lock held)."""
+        if not self._keys:
+            return None
+        return self._db.execute(
+            f"SELECT MIN(next_attempt) FROM events WHERE status = 'pending' "
+            f"AND scope IN ({','.join('?' * len(self._keys))})", tuple(self._keys)).fetchone()[0]
+
+    def _start(self):
+        """Start the sender thread (called with the lock held)."""
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(target=self._run, name="progress-outbox", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    def _run(self):
+        """Sender thread: deliver events as they become due."""
+        while True:
+            with self._lock:
+                while not self._closed:
+                    due = self._next_due()
+                    if due is not None and due <= time.time():
+                        break
+                    self._wake.wait(None if due is None else due - time.time())
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Progress outbox flush failed: {e}")
+                time.sleep(1)
+
+    def close(self):
+        """Stop the sender, giving queued events a short last chance to go out."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wake.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(EXIT_FLUSH_DEADLINE)
+        if not self.session.breaker.is_open:
+            try:
+                self.flush(budget=EXIT_FLUSH_DEADLINE)
+            except Exception as e:
+                logger.warning(f"Progress events left in the outbox: {e}")
+        with self._lock:
+            self._db.close()
+
+
+_outbox: Optional[ProgressOutbox] = None
+_outbox_lock = threading.Lock()
+
+
+def get_outbox() -> ProgressOutbox:
+    """
+    The process-wide progress outbox, opened on first use.
+
+    Returns:
+        ProgressOutbox: The shared outbox
+    """
+    global _outbox
+    if _outbox is None:
+        with _outbox_lock:
+            if _outbox is None:
+                _outbox = ProgressOutbox()
+    return _outbox
@@ -0,0 +1,150 @@
+"""
+Speculative prefetch of the tutorials a learner is likely to open next.
+"""
+
+import logging
+import threading
+from typing import List, Dict, Any, Optional
+
+from api.tutorials import TutorialPrefetcher
+
+logger = logging.getLogger('api.prefetch')
+
+# Tutorials warmed after each pick
+DEFAULT_PREDICTIONS = 3
+
+
+class SpeculativePrefetcher:
+    """
+    Warm the likely next tutorials while the current one is running.
+
+    Predictions come, in order of confidence, from:
+
+    1. the learning path (ContentRepository.get_tutorial_path order for the
+       current tutorial's difficulty),
+    2. the tutorials listed after it with the same difficulty,
+    3. tutorials that share a related challenge with it.
+
+    The predicted tutorials are fetched with a TutorialPrefetcher, so
+    moving on is instant. The local content is only used for predicting;
+    unless a repository is given, the one behind the local tutorial
+    fallback is used, loaded on the prefetch thread, never on the UI
+    thread.
+    """
+
+    def __init__(self, prefetcher: TutorialPrefetcher, repository=None, limit: int = DEFAULT_PREDICTIONS):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            prefetcher: Fetches tutorial bodies (and holds what was fetched)
+            repository: Local content repository for the learning path and related
+                        challenges (defaults to the local tutorial fallback's repository)
+            limit: Number of tutorials to predict
+        """
+        self.prefetcher = prefetcher
+        self.repository = repository
+        self.limit = limit
+        self.predictions: Dict[str, List[str]] = {}
+        self._ready = threading.Condition()
+
+    def _local_repository(self):
+        """The local content repository (shared with the local fallback, loaded on first use)."""
+        if self.repository is None:
+            from content.resolver import get_local_resolver
+            self.repository = get_local_resolver().loaded_repository()
+        return self.repository
+
+    def predict(self, tutorial: Dict[str, Any], listed: List[Dict[str, Any]]) -> List[str]:
+        """
+        Predict the tutorials a learner will open after this one.
+
+        Args:
+            tutorial: The current tutorial
+            listed: Tutorials offered in the menu (predictions are limited to these
+                    when the list is not empty)
+
+        Returns:
+            list: Up to ``limit`` tutorial IDs, most likely first
+        """
+        current_id = tutorial.get('id')
+        listed_tutorial = next((t for t in listed if t.get('id') == current_id), {})
+        difficulty = str(tutorial.get('difficulty') or listed_tutorial.get('difficulty') or '').lower()
+        listed_ids = [t.get('id') for t in listed if t.get('id')]
+        candidates: List[str] = []
+
+        try:
+            repository = self._local_repository()
+            path_ids = [t.get('id') for t in repository.get_tutorial_path(difficulty)]
+            if current_id in path_ids:
+                candidates.extend(path_ids[path_ids.index(current_id) + 1:])
+        except Exception as e:
+            repository = None
+            logger.warning(f"Could not read the learning path: {e}")
+
+        same_difficulty = [t.get('id') for t in listed if str(t.get('difficulty') or '').lower() == difficulty]
+        if current_id in same_difficulty:
+            position = same_difficulty.index(current_id)
+            candidates.extend(same_difficulty[position + 1:] + same_difficulty[:position])
+
+        if repository is not None:
+            for challenge in repository.get_related_challenges(current_id):
+                candidates.extend(challenge.get('related_tutorials', []) or [])
+
+        predictions = []
+        for candidate in candidates:
+            if candidate and candidate != current_id and candidate not in predictions:
+                if not listed_ids or candidate in listed_ids:
+                    predictions.append(candidate)
+            if len(predictions) >= self.limit:
+                break
+        return predictions
+
+    def warm(self, tutorial: Dict[str, Any], listed: List[Dict[str, Any]]):
+        """
+        Predict and fetch the next tutorials in the background.
+
+        Args:
+            tutorial: The tutorial that is about to run
+            listed: Tutorials offered in the menu
+        """
+        threading.Thread(target=self._warm, args=(tutorial, list(listed)),
+                         name="speculative-prefetch", daemon=True).start()
+
+    def _warm(self, tutorial: Dict[str, Any], listed: List[Dict[str, Any]]):
+        """Prefetch thread: predict, then start the fetches."""
+        current_id = tutorial.get('id')
+        predictions = []
+        try:
+            predictions = self.predict(tutorial, listed)
+            self.prefetcher.start(predictions)
+            logger.info(f"Prefetching likely next tutorials after {current_id}: {predictions}")
+        except Exception as e:
+            logger.warning(f"Speculative prefetch failed: {e}")
+        finally:
+            with self._ready:
+                self.predictions[current_id] = predictions
+                self._ready.notify_all()
+
+    def next_tutorial(self, tutorial: Dict[str, Any], listed: List[Dict[str, Any]],
+                      timeout: float = 1.0) -> Optional[Dict[str, Any]]:
+        """
+        The tutorial to suggest after this one.
+
+        Args:
+            tutorial: The tutorial that just finished
+            listed: Tutorials offered in the menu
+            timeout: Seconds to wait for the predictions if they are not ready yet
+
+        Returns:
+            Dict[str, Any] or None: Listed metadata of the most likely next tutorial
+        """
+        current_id = tutorial.get('id')
+        with self._ready:
+            self._ready.wait_for(lambda: current_id in self.predictions, timeout)
+            predictions = self.predictions.get(current_id, [])
+        by_id = {t.get('id'): t for t in listed}
+        for tutorial_id in predictions:
+            if tutorial_id in by_id:
+                return by_id[tutorial_id]
+        return None
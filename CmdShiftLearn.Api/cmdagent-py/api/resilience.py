@@ -0,0 +1,213 @@
+"""
+Retries, deadlines and a circuit breaker for API calls.
+"""
+
+import time
+import random
+import logging
+import threading
+import httpx
+from typing import Iterator, Optional, Tuple
+
+logger = logging.getLogger('api.resilience')
+
+# Status codes worth retrying: the server is overloaded, restarting or waking up
+RETRYABLE_STATUS = (429, 502, 503, 504)
+
+# Seconds one operation may take across all of its tries
+DEFAULT_DEADLINE = 5.0
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+    def __init__(self, retry_in: float):
+        super().__init__(f"API unavailable after repeated failures; retrying in {retry_in:.0f}s")
+        self.retry_in = retry_in
+
+
+class DeadlineExceeded(httpx.TimeoutException):
+    """Raised when an operation's time budget runs out between attempts."""
+
+
+class RetryPolicy:
+    """
+    Jittered exponential backoff within a deadline.
+
+    Attempt n (from 0) waits a random time between 0 and
+    min(max_delay, base_delay * 2**n) before the next try ("full jitter"),
+    so many clients retrying at once do not hit the server in lockstep.
+    An operation stops retrying when the next wait would run past its
+    deadline.
+    """
+
+    def __init__(self, attempts: int = 3, base_delay: float = 0.25, max_delay: float = 2.0,
+                 deadline: float = DEFAULT_DEADLINE):
+        """
+        Initialize the policy.
+
+        Args:
+            attempts: Maximum number of tries per operation (1 disables retries)
+            base_delay: Backoff base in seconds
+            max_delay: Upper bound of one backoff in seconds
+            deadline: Time budget of one operation in seconds, across all tries
+        """
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Seconds to wait after a failed try.
+
+        Args:
+            attempt: Number of the try that failed (from 0)
+
+        Returns:
+            float: Randomized delay
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def schedule(self, deadline: float = None) -> Iterator[Tuple[int, float]]:
+        """
+        The tries of one operation that fit in its budget.
+
+        Use with a for loop: make the try, ``break`` on success, otherwise
+        wait backoff(attempt) and continue. The loop ends when the tries or
+        the budget run out.
+
+        Args:
+            deadline: Budget for this operation in seconds (defaults to the policy's)
+
+        Yields:
+            tuple: (attempt number from 0, seconds left in the budget)
+        """
+        budget = self.deadline if deadline is None else deadline
+        end = time.monotonic() + budget
+        for attempt in range(self.attempts):
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                return
+            yield attempt, remaining
+
+    @staticmethod
+    def is_retryable(response: Optional[httpx.Response] = None, error: Exception = None) -> bool:
+        """
+        Whether a failed try is worth repeating.
+
+        Args:
+            response: The response, if one arrived
+            error: The exception, if the request failed
+
+        Returns:
+            bool: True for transport errors and RETRYABLE_STATUS responses
+        """
+        if error is not None:
+            return isinstance(error, httpx.TransportError) and not isinstance(error, CircuitOpenError)
+        return response is not None and response.status_code in RETRYABLE_STATUS
+
+
+class CircuitBreaker:
+    """
+    Shared failure state for calls to one backend.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    calls fail immediately with CircuitOpenError, so callers go straight
+    to their local fallback instead of each waiting for a timeout. After
+    ``reset_timeout`` seconds one trial call is let through (half-open):
+    success closes the breaker, failure opens it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        """
+        Initialize the breaker (closed).
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds the breaker stays open before a trial call
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """
+        Check that a call may go ahead.
+
+        Raises:
+            CircuitOpenError: If the breaker is open (or a trial call is already running)
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            retry_in = self.opened_at + self.reset_timeout - time.monotonic()
+            if self.state == self.OPEN and retry_in <= 0:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return
+            raise CircuitOpenError(max(0.0, retry_in))
+
+    def record_success(self):
+        """Record a call that reached a healthy server."""
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("API reachable again; closing the circuit breaker")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_running = False
+
+    def record_response(self, response: httpx.Response):
+        """
+        Record a call by the response it got.
+
+        Server errors (and RETRYABLE_STATUS responses) count as failures;
+        anything else, client errors included, shows the server is healthy.
+
+        Args:
+            response: The final response of the call
+        """
+        if response.status_code >= 500 or response.status_code in RETRYABLE_STATUS:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def release(self):
+        """Give up a call that ended without an outcome, so a half-open breaker can try again."""
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self):
+        """Record a call that failed because of the server or the network."""
+        with self._lock:
+            self.failures += 1
+            self._trial_running = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"API failed {self.failures} times in a row; opening the circuit breaker "
+                                   f"for {self.reset_timeout:.0f}s")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets a trial call through (0 if calls may go ahead)."""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being refused."""
+        with self._lock:
+            return self.state == self.OPEN and time.monotonic() - self.opened_at < self.reset_timeout
@@ -0,0 +1,401 @@
+"""
+Shared HTTP session for the CmdShiftLearn API clients.
+"""
+
+import os
+import time
+import atexit
+import asyncio
+import logging
+import threading
+import httpx
+from typing import Dict, List, Any, Optional, Callable
+
+from utils import load_config
+from api.auth import get_auth_header
+from api.http_cache import HttpCache, DEFAULT_MAX_BYTES
+from api.resilience import DEFAULT_DEADLINE, RetryPolicy, CircuitBreaker, CircuitOpenError, DeadlineExceeded
+
+logger = logging.getLogger('api.session')
+
+# HTTP/2 needs the optional 'h2' package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Seconds per try; a retried GET stays within DEFAULT_DEADLINE overall,
+# below the 10-second timeout the clients used before retries
+DEFAULT_TIMEOUTS = {'connect': 2.0, 'read': 3.0, 'write': 3.0, 'pool': 2.0}
+
+DEFAULT_LIMITS = {'max_connections': 10, 'max_keepalive_connections': 5, 'keepalive_expiry': 30.0}
+
+# Requests an async client keeps in flight at once
+DEFAULT_CONCURRENCY = 8
+
+
+class ApiSession:
+    """
+    Pooled, keep-alive HTTP connection to the CmdShiftLearn API.
+
+    All API clients share one httpx.Client, so consecutive calls reuse an
+    open connection instead of paying a TCP and TLS handshake each time.
+    The client is created on first use and recreated in a forked child
+    process (connections must not be shared across processes).
+    """
+
+    def __init__(self, timeouts: Dict[str, float] = None, limits: Dict[str, Any] = None,
+                 http2: bool = False, cache: Optional[HttpCache] = None,
+                 retry: RetryPolicy = None, breaker: CircuitBreaker = None):
+        """
+        Initialize the session (no connection is opened yet).
+
+        Args:
+            timeouts: connect/read/write/pool timeouts in seconds (missing keys use DEFAULT_TIMEOUTS)
+            limits: max_connections, max_keepalive_connections and keepalive_expiry
+                    (missing keys use DEFAULT_LIMITS)
+            http2: Negotiate HTTP/2 when the 'h2' package is installed
+            cache: Response cache for GET requests (None disables caching)
+            retry: Backoff and deadline for GET requests (defaults to RetryPolicy())
+            breaker: Failure state shared by every request (defaults to CircuitBreaker())
+        """
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.cache = cache
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        if http2 and not HTTP2_AVAILABLE:
+            logger.info("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+        self._client: Optional[httpx.Client] = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ApiSession':
+        """
+        Create a session from the 'api' section of the configuration.
+
+        Recognized keys: timeout (read/write timeout), connect_timeout,
+        max_connections, max_keepalive_connections, keepalive_expiry, http2,
+        cache (false disables the response cache), cache_max_mb, retries
+        (tries per GET), deadline (seconds per operation), breaker_threshold
+        and breaker_reset (seconds).
+
+        Args:
+            config: Application configuration
+
+        Returns:
+            ApiSession: The session
+        """
+        api_config = config.get('api', {})
+        timeouts = {}
+        if api_config.get('timeout') is not None:
+            timeouts['read'] = timeouts['write'] = float(api_config['timeout'])
+        if api_config.get('connect_timeout') is not None:
+            timeouts['connect'] = float(api_config['connect_timeout'])
+        limits = {key: api_config[key] for key in DEFAULT_LIMITS if api_config.get(key) is not None}
+        cache = None
+        if api_config.get('cache', True):
+            max_mb = api_config.get('cache_max_mb')
+            cache = HttpCache(max_bytes=int(max_mb * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES)
+        retry = RetryPolicy(attempts=int(api_config.get('retries', 3)),
+                            deadline=float(api_config.get('deadline', DEFAULT_DEADLINE)))
+        breaker = CircuitBreaker(int(api_config.get('breaker_threshold', 3)),
+                                 float(api_config.get('breaker_reset', 30.0)))
+        return cls(timeouts, limits, bool(api_config.get('http2', False)), cache, retry, breaker)
+
+    @property
+    def client(self) -> httpx.Client:
+        """The pooled httpx client (created on first use)."""
+        client = self._client
+        if client is not None and self._pid == os.getpid():
+            return client
+        with self._lock:
+            if self._client is None or self._pid != os.getpid():
+                # A client inherited over fork() shares its sockets with the parent; drop it
+                self._client = httpx.Client(
+                    timeout=httpx.Timeout(**self.timeouts),
+                    limits=httpx.Limits(**self.limits),
+                    http2=self.http2,
+                )
+                self._pid = os.getpid()
+            return self._client
+
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        A new async client with the same timeouts, limits and HTTP version.
+
+        Async clients are bound to the event loop that uses them, so each
+        loop gets its own; the caller closes it.
+
+        Returns:
+            httpx.AsyncClient: The client
+        """
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(**self.timeouts),
+            limits=httpx.Limits(**self.limits),
+            http2=self.http2,
+        )
+
+    def budget_timeout(self, remaining: float) -> httpx.Timeout:
+        """
+        Per-try timeouts capped by what is left of an operation's budget.
+
+        Args:
+            remaining: Seconds left
+
+        Returns:
+            httpx.Timeout: The timeouts for the next try
+        """
+        return httpx.Timeout(**{phase: min(limit, remaining) for phase, limit in self.timeouts.items()})
+
+    def _send(self, method: str, url: str, retry: bool, deadline: Optional[float], **kwargs) -> httpx.Response:
+        """
+        Send a request through the circuit breaker, retrying idempotent ones.
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+            httpx.TransportError: If every try failed (DeadlineExceeded if the budget ran out)
+        """
+        self.breaker.before_call()
+        policy = self.retry
+        attempts = policy.attempts if retry else 1
+        response, error = None, None
+        try:
+            for attempt, remaining in policy.schedule(deadline):
+                try:
+                    response, error = self.client.request(method, url, timeout=self.budget_timeout(remaining), **kwargs), None
+                except httpx.TransportError as e:
+                    response, error = None, e
+                if not policy.is_retryable(response, error):
+                    break
+                delay = policy.backoff(attempt)
+                if attempt + 1 >= attempts or delay >= remaining:
+                    break
+                logger.info(f"{method} {url} failed ({error or response.status_code}); retrying in {delay:.2f}s")
+                time.sleep(delay)
+        except BaseException:
+            # Not a verdict on the server, but a half-open trial must not stay claimed
+            self.breaker.release()
+            raise
+
+        if response is not None:
+            self.breaker.record_response(response)
+            return response
+        self.breaker.record_failure()
+        raise error or DeadlineExceeded(f"{method} {url}: deadline exceeded")
+
+    def get(self, url: str, headers: Dict[str, str] = None, deadline: float = None, **kwargs) -> httpx.Response:
+        """
+        Send a GET request over the pooled connection.
+
+        Failed tries are retried with jittered backoff within the deadline.
+        With a cache, a fresh cached response is returned without a request,
+        a stale one is revalidated with a conditional request, and a stale
+        one is also returned when the API cannot be reached.
+
+        Args:
+            url: The URL
+            headers: Request headers
+            deadline: Time budget in seconds (defaults to the retry policy's)
+
+        Raises:
+            CircuitOpenError: If the API is failing and nothing is cached
+            httpx.TransportError: If the request failed and nothing is cached
+        """
+        if self.cache is None:
+            return self._send('GET', url, True, deadline, headers=headers, **kwargs)
+
+        headers = dict(headers or {})
+        entry = self.cache.lookup(url, headers)
+        if entry is not None and entry.is_fresh():
+            self.cache.stats['fresh'] += 1
+            return entry.to_response()
+        conditional = {**headers, **entry.validators()} if entry is not None else headers
+        try:
+            response = self._send('GET', url, True, deadline, headers=conditional, **kwargs)
+        except httpx.TransportError as e:
+            if entry is None:
+                raise
+            logger.warning(f"Serving stale {url} from cache: {e}")
+            return entry.to_response()
+        return self.cache.update(url, headers, entry, response)
+
+    def post(self, url: str, deadline: float = None, **kwargs) -> httpx.Response:
+        """
+        Send a POST request over the pooled connection.
+
+        POSTs are not retried (they may not be idempotent) but go through
+        the circuit breaker, so they fail fast while the API is down.
+        """
+        return self._send('POST', url, False, deadline, **kwargs)
+
+    def close(self):
+        """Close the pooled connections (a later request opens new ones)."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None and self._pid == os.getpid():
+            client.close()
+
+    def __enter__(self) -> 'ApiSession':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncApiClient:
+    """
+    Base class for the async API clients.
+
+    Owns an httpx.AsyncClient (created on first use in the running event
+    loop) and a semaphore that bounds how many requests are in flight, so
+    fetching many items at once does not flood the server. Use it as an
+    async context manager or call aclose() when done.
+    """
+
+    def __init__(self, api_key: str = None, session: ApiSession = None,
+                 max_concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Initialize the client.
+
+        Args:
+            api_key: API key (defaults to the stored key)
+            session: Session whose settings the async client uses (defaults to the shared session)
+            max_concurrency: Maximum number of requests in flight
+        """
+        self.api_key = api_key
+        self.session = session or get_session()
+        self.max_concurrency = max(1, max_concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the async client's connections."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def _get_json(self, url: str) -> Optional[Any]:
+        """
+        GET a URL and decode the JSON body.
+
+        Failures are logged, not printed, because requests may run in the
+        background while the user is looking at a menu.
+
+        Args:
+            url: The URL
+
+        Returns:
+            The decoded body, or None if the request failed
+        """
+        if self._client is None:
+            self._client = self.session.async_client()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        headers = get_auth_header(self.api_key)
+        cache = self.session.cache
+        entry = cache.lookup(url, headers) if cache is not None else None
+        if entry is not None and entry.is_fresh():
+            cache.stats['fresh'] += 1
+            return entry.to_response().json()
+
+        async with self._semaphore:
+            try:
+                conditional = {**headers, **entry.validators()} if entry is not None else headers
+                response = await self._send(url, conditional)
+                if cache is not None:
+                    response = cache.update(url, headers, entry, response)
+                response.raise_for_status()
+                return response.json()
+            except httpx.HTTPStatusError as e:
+                logger.warning(f"GET {url} failed: {e.response.status_code} - {e.response.reason_phrase}")
+            except (httpx.RequestError, ValueError) as e:
+                if entry is not None:
+                    logger.warning(f"Serving stale {url} from cache: {e}")
+                    return entry.to_response().json()
+                logger.warning(f"GET {url} failed: {e}")
+            return None
+
+    async def _send(self, url: str, headers: Dict[str, str]) -> httpx.Response:
+        """GET with the session's circuit breaker, backoff and deadline (see ApiSession.get)."""
+        breaker, policy = self.session.breaker, self.session.retry
+        breaker.before_call()
+        response, error = None, None
+        try:
+            for attempt, remaining in policy.schedule():
+                try:
+                    response, error = await self._client.get(
+                        url, headers=headers, timeout=self.session.budget_timeout(remaining)), None
+                except httpx.TransportError as e:
+                    response, error = None, e
+                if not policy.is_retryable(response, error):
+                    break
+                delay = policy.backoff(attempt)
+                if attempt + 1 >= policy.attempts or delay >= remaining:
+                    break
+                await asyncio.sleep(delay)
+        except BaseException:
+            breaker.release()
+            raise
+
+        if response is not None:
+            breaker.record_response(response)
+            return response
+        breaker.record_failure()
+        raise error or DeadlineExceeded(f"GET {url}: deadline exceeded")
+
+    async def _get_many(self, url_for: Callable[[str], str], ids: List[str]) -> Dict[str, Optional[Any]]:
+        """
+        Fetch several items concurrently (at most max_concurrency at a time).
+
+        Args:
+            url_for: Maps an item ID to its URL
+            ids: Item IDs
+
+        Returns:
+            dict: ID -> decoded item, or None for items that could not be fetched
+        """
+        ids = list(dict.fromkeys(ids))
+        results = await asyncio.gather(*(self._get_json(url_for(item_id)) for item_id in ids))
+        return dict(zip(ids, results))
+
+
+_session: Optional[ApiSession] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> ApiSession:
+    """
+    The process-wide API session, created from the configuration on first use.
+
+    The session is closed at interpreter exit.
+
+    Returns:
+        ApiSession: The shared session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                try:
+                    config = load_config()
+                except Exception as e:
+                    logger.warning(f"Could not load API settings, using defaults: {e}")
+                    config = {}
+                _session = ApiSession.from_config(config)
+                atexit.register(close_session)
+    return _session
+
+
+def close_session():
+    """Close the process-wide API session if one was created."""
+    if _session is not None:
+        _session.close()
@@ -3,14 +3,20 @@ API client for interacting with the CmdShiftLearn tutorials API.
 """
 
 import json
+import asyncio
 import logging
+import threading
 import httpx
-from typing import List, Dict, Any, Optional
+from collections.abc import Mapping
+from typing import List, Dict, Any, Optional, Iterable, Callable
 from rich.console import Console
 
 # Import only what's needed
 from utils import API_BASE_URL
 from api.auth import get_auth_header
+from api.session import ApiSession, AsyncApiClient, DEFAULT_CONCURRENCY, get_session
+from api.resilience import CircuitOpenError
+from api.outbox import ProgressOutbox, get_outbox
 
 # Configure logging
 logging.basicConfig(
@@ -21,12 +27,137 @@ logger = logging.getLogger('api.tutorials')
 console = Console()
 
 
+def describe_cache_age(seconds: float) -> str:
+    """
+    Human-readable age of cached data, e.g. '5 minutes ago'.
+    
+    Args:
+        seconds: Age in seconds
+        
+    Returns:
+        str: Description of the age
+    """
+    for unit, size in (('day', 86400), ('hour', 3600), ('minute', 60)):
+        if seconds >= size:
+            count = int(seconds // size)
+            return f"{count} {unit}{'s' if count != 1 else ''} ago"
+    return "just now"
+
+
 class TutorialClient:
     """Client for interacting with the tutorials API."""
     
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, session: ApiSession = None, offline_first: bool = False,
+                 outbox: ProgressOutbox = None):
+        """
+        Initialize the client.
+        
+        Args:
+            api_key: API key (defaults to the stored key)
+            session: HTTP session to use (defaults to the process-wide pooled session)
+            offline_first: Answer from the response cache immediately, even if it is
+                           stale, and revalidate in the background (stale-while-revalidate)
+            outbox: Outbox for progress events (defaults to the process-wide outbox)
+        """
         self.base_url = f"{API_BASE_URL}/tutorials"
         self.api_key = api_key
+        self.session = session or get_session()
+        self.offline_first = offline_first
+        self.outbox = outbox
+        # Age in seconds of the last answer served from the cache (None if it came from the API)
+        self.cache_age: Optional[float] = None
+        self.revalidating = False
+        self._listeners: List[Callable[[str, Optional[str], Any], None]] = []
+        self._revalidations = set()
+        self._revalidation_lock = threading.Lock()
+    
+    def on_update(self, callback: Callable[[str, Optional[str], Any], None]):
+        """
+        Register a callback for content that changed on background revalidation.
+        
+        The callback runs on the revalidation thread as
+        ``callback(kind, tutorial_id, data)`` with kind 'tutorials' (the
+        catalog; tutorial_id is None) or 'tutorial'.
+        
+        Args:
+            callback: The callback
+        """
+        self._listeners.append(callback)
+    
+    def _from_cache(self, kind: str, tutorial_id: Optional[str], url: str) -> Optional[Any]:
+        """
+        Serve a response from the cache in offline-first mode.
+        
+        A stale entry is returned as is and revalidated in a background
+        thread; listeners are told if the server had something newer.
+        
+        Args:
+            kind: 'tutorials' or 'tutorial'
+            tutorial_id: Tutorial ID for 'tutorial'
+            url: Request URL
+            
+        Returns:
+            The cached data, or None if there is none (or offline-first is off)
+        """
+        cache = self.session.cache
+        if not self.offline_first or cache is None:
+            return None
+        
+        headers = get_auth_header(self.api_key)
+        entry = cache.lookup(url, headers)
+        if entry is None:
+            return None
+        try:
+            data = json.loads(entry.body)
+        except ValueError:
+            return None
+        if not data:
+            return None
+        
+        self.cache_age = entry.age
+        self.revalidating = not entry.is_fresh()
+        if self.revalidating:
+            self._revalidate(kind, tutorial_id, url, headers, entry.body)
+        logger.info(f"Serving {url} from cache (age {entry.age:.0f}s, {'stale' if self.revalidating else 'fresh'})")
+        return data
+    
+    def _revalidate(self, kind: str, tutorial_id: Optional[str], url: str, headers: Dict[str, str], body: bytes):
+        """Revalidate a cached response in a background thread."""
+        with self._revalidation_lock:
+            if url in self._revalidations:
+                return
+            self._revalidations.add(url)
+        
+        def run():
+            try:
+                response = self.session.get(url, headers=headers)
+                if response.status_code == 200 and response.content != body:
+                    data = response.json()
+                    logger.info(f"Cached {url} was out of date; refreshed")
+                    for callback in list(self._listeners):
+                        try:
+                            callback(kind, tutorial_id, data)
+                        except Exception as e:
+                            logger.error(f"Update callback failed: {e}")
+            except Exception as e:
+                logger.warning(f"Background revalidation of {url} failed: {e}")
+            finally:
+                with self._revalidation_lock:
+                    self._revalidations.discard(url)
+        
+        threading.Thread(target=run, name="tutorial-revalidate", daemon=True).start()
+    
+    def get_cached_tutorial(self, tutorial_id: str) -> Optional[Dict[str, Any]]:
+        """
+        A tutorial from the cache in offline-first mode (revalidated in the background).
+        
+        Args:
+            tutorial_id: The tutorial ID
+            
+        Returns:
+            Dict[str, Any] or None: The cached tutorial, or None if not cached
+        """
+        return self._from_cache('tutorial', tutorial_id, f"{self.base_url}/{tutorial_id}")
     
     def get_tutorials(self) -> List[Dict[str, Any]]:
         """
@@ -35,6 +166,12 @@ class TutorialClient:
         Returns:
             List[Dict[str, Any]]: A list of tutorial objects
         """
+        cached = self._from_cache('tutorials', None, self.base_url)
+        if cached is not None:
+            return cached
+        self.cache_age = None
+        self.revalidating = False
+        
         logger.info(f"Fetching tutorials from {self.base_url}")
         
         try:
@@ -48,9 +185,8 @@ class TutorialClient:
             if 'Authorization' not in headers:
                 logger.warning("Authorization header is missing. Authentication will likely fail.")
             
-            # Use httpx with a 10-second timeout
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(self.base_url, headers=headers)
+            # Reuse the pooled keep-alive connection
+            response = self.session.get(self.base_url, headers=headers)
             
             logger.info(f"API response status code: {response.status_code}")
             
@@ -72,6 +208,11 @@ class TutorialClient:
                 
             return tutorials
             
+        except CircuitOpenError as e:
+            logger.warning(str(e))
+            console.print("[yellow]The API is not responding. Using local tutorials.[/yellow]")
+            return self._load_local_tutorials_fallback()
+            
         except httpx.TimeoutException:
             logger.error("Request timed out while fetching tutorials")
             console.print("[red]Request timed out. Falling back to local tutorials.[/red]")
@@ -97,16 +238,13 @@ class TutorialClient:
         logger.info("Loading tutorials from local files as fallback")
         console.print("[yellow]Loading tutorials from local files as fallback...[/yellow]")
         
-        # Import needed modules
-        from pathlib import Path
-        import os
-        import yaml
+        from content.resolver import get_local_resolver
         
         tutorials = []
         
         try:
-            # Build the path to the local tutorials directory
-            local_path = Path(os.path.dirname(os.path.dirname(__file__))) / "data" / "content" / "tutorials" / "beginner"
+            resolver = get_local_resolver()
+            local_path = resolver.root
             
             logger.info(f"Looking for tutorial files in: {local_path}")
             
@@ -115,35 +253,21 @@ class TutorialClient:
                 console.print(f"[red]Local tutorials directory not found: {local_path}[/red]")
                 return []
             
-            # Find all YAML files in the directory
-            yaml_files = list(local_path.glob("*.yaml")) + list(local_path.glob("*.yml"))
-            
-            logger.info(f"Found {len(yaml_files)} local tutorial files")
-            
-            # Load each tutorial file
-            for yaml_file in yaml_files:
-                try:
-                    with open(yaml_file, 'r', encoding='utf-8') as f:
-                        # Load YAML content
-                        tutorial_data = yaml.safe_load(f)
-                        
-                        if tutorial_data and isinstance(tutorial_data, dict):
-                            # Convert to tutorial metadata format
-                            tutorial_metadata = {
-                                "id": tutorial_data.get("id", yaml_file.stem),
-                                "title": tutorial_data.get("title", "Untitled Tutorial"),
-                                "description": tutorial_data.get("description", ""),
-                                "difficulty": tutorial_data.get("difficulty", "Beginner"),
-                                "xp": tutorial_data.get("xpTotal", 0),
-                                "fromLocalFile": True,  # Mark as loaded from local file
-                                "localPath": str(yaml_file)  # Include path for later reference
-                            }
-                            
-                            tutorials.append(tutorial_metadata)
-                            logger.info(f"Added local tutorial: {tutorial_metadata['title']} (ID: {tutorial_metadata['id']})")
-                            
-                except Exception as e:
-                    logger.error(f"Error loading local tutorial file {yaml_file}: {str(e)}")
+            # Every subdirectory (.yaml and .yml), read through the shared local index
+            for yaml_file, tutorial_data in resolver.tutorials():
+                # Convert to tutorial metadata format
+                tutorial_metadata = {
+                    "id": tutorial_data.get("id", yaml_file.stem),
+                    "title": tutorial_data.get("title", "Untitled Tutorial"),
+                    "description": tutorial_data.get("description", ""),
+                    "difficulty": tutorial_data.get("difficulty", "Beginner"),
+                    "xp": tutorial_data.get("xpTotal", 0),
+                    "fromLocalFile": True,  # Mark as loaded from local file
+                    "localPath": str(yaml_file)  # Include path for later reference
+                }
+                
+                tutorials.append(tutorial_metadata)
+                logger.info(f"Added local tutorial: {tutorial_metadata['title']} (ID: {tutorial_metadata['id']})")
             
             logger.info(f"Loaded {len(tutorials)} tutorials from local files")
             
@@ -169,6 +293,10 @@ class TutorialClient:
         Returns:
             Dict[str, Any] or None: The tutorial object if found, None otherwise
         """
+        cached = self.get_cached_tutorial(tutorial_id)
+        if cached is not None:
+            return cached
+        
         url = f"{self.base_url}/{tutorial_id}"
         logger.info(f"Fetching tutorial {tutorial_id} from {url}")
         
@@ -183,9 +311,8 @@ class TutorialClient:
             if 'Authorization' not in headers:
                 logger.warning("Authorization header is missing. Authentication will likely fail.")
             
-            # Use httpx with a 10-second timeout
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url, headers=headers)
+            # Reuse the pooled keep-alive connection
+            response = self.session.get(url, headers=headers)
             
             logger.info(f"API response status code: {response.status_code}")
             
@@ -201,37 +328,7 @@ class TutorialClient:
                 console.print(f"[yellow]Tutorial with ID '{tutorial_id}' not found[/yellow]")
                 
                 # Try to load a tutorial from local files if available
-                from pathlib import Path
-                import os
-                import yaml
-                
-                logger.info(f"Attempting to load tutorial {tutorial_id} from local files as fallback")
-                local_path = Path(os.path.dirname(os.path.dirname(__file__))) / "data" / "content" / "tutorials" / "beginner"
-                
-                # Try both with and without extension
-                potential_paths = [
-                    local_path / f"{tutorial_id}.yaml",
-                    local_path / f"{tutorial_id}.yml",
-                    local_path / tutorial_id,
-                ]
-                
-                for path in potential_paths:
-                    if path.exists() and path.is_file():
-                        logger.info(f"Found local tutorial file: {path}")
-                        try:
-                            with open(path, 'r', encoding='utf-8') as f:
-                                # Load YAML content
-                                tutorial_data = yaml.safe_load(f)
-                                if tutorial_data and isinstance(tutorial_data, dict):
-                                    logger.info(f"Successfully loaded local tutorial: {tutorial_data.get('title', 'Unknown')}")
-                                    console.print(f"[green]Loaded tutorial from local file: {path.name}[/green]")
-                                    return tutorial_data
-                        except Exception as local_err:
-                            logger.error(f"Error loading local tutorial file: {str(local_err)}")
-                
-                # If we reach here, no local file was found or loaded
-                logger.warning(f"No local fallback found for tutorial ID: {tutorial_id}")
-                return None
+                return self._load_local_tutorial(tutorial_id)
                 
             response.raise_for_status()  # Raise exception for other 4XX/5XX responses
             
@@ -239,42 +336,18 @@ class TutorialClient:
             logger.info(f"Successfully fetched tutorial: {tutorial.get('title', 'Unknown')}")
             return tutorial
             
+        except CircuitOpenError as e:
+            # The API is known to be down; go straight to the local copy
+            logger.warning(str(e))
+            return self._load_local_tutorial(tutorial_id)
+            
         except httpx.TimeoutException:
             logger.error(f"Request timed out while fetching tutorial {tutorial_id}")
             console.print("[red]Request timed out. Please try again later.[/red]")
             
             # Try local fallback
             console.print("[yellow]Attempting to load from local files...[/yellow]")
-            # Recursively call the same function but with a flag to only check local files
-            from pathlib import Path
-            import os
-            import yaml
-            
-            logger.info(f"Attempting to load tutorial {tutorial_id} from local files as fallback after timeout")
-            local_path = Path(os.path.dirname(os.path.dirname(__file__))) / "data" / "content" / "tutorials" / "beginner"
-            
-            # Try both with and without extension
-            potential_paths = [
-                local_path / f"{tutorial_id}.yaml",
-                local_path / f"{tutorial_id}.yml",
-                local_path / tutorial_id,
-            ]
-            
-            for path in potential_paths:
-                if path.exists() and path.is_file():
-                    logger.info(f"Found local tutorial file: {path}")
-                    try:
-                        with open(path, 'r', encoding='utf-8') as f:
-                            # Load YAML content
-                            tutorial_data = yaml.safe_load(f)
-                            if tutorial_data and isinstance(tutorial_data, dict):
-                                logger.info(f"Successfully loaded local tutorial: {tutorial_data.get('title', 'Unknown')}")
-                                console.print(f"[green]Loaded tutorial from local file: {path.name}[/green]")
-                                return tutorial_data
-                    except Exception as local_err:
-                        logger.error(f"Error loading local tutorial file: {str(local_err)}")
-            
-            return None
+            return self._load_local_tutorial(tutorial_id)
             
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP Error: {e.response.status_code} - {e.response.reason_phrase}")
@@ -287,78 +360,253 @@ class TutorialClient:
             
             # Try local fallback as a last resort
             console.print("[yellow]Attempting to load from local files...[/yellow]")
-            from pathlib import Path
-            import os
-            import yaml
-            
-            logger.info(f"Attempting to load tutorial {tutorial_id} from local files as last resort")
-            local_path = Path(os.path.dirname(os.path.dirname(__file__))) / "data" / "content" / "tutorials" / "beginner"
-            
-            # Try both with and without extension
-            potential_paths = [
-                local_path / f"{tutorial_id}.yaml",
-                local_path / f"{tutorial_id}.yml",
-                local_path / tutorial_id,
-            ]
-            
-            for path in potential_paths:
-                if path.exists() and path.is_file():
-                    logger.info(f"Found local tutorial file: {path}")
-                    try:
-                        with open(path, 'r', encoding='utf-8') as f:
-                            # Load YAML content
-                            tutorial_data = yaml.safe_load(f)
-                            if tutorial_data and isinstance(tutorial_data, dict):
-                                logger.info(f"Successfully loaded local tutorial: {tutorial_data.get('title', 'Unknown')}")
-                                console.print(f"[green]Loaded tutorial from local file: {path.name}[/green]")
-                                return tutorial_data
-                    except Exception as local_err:
-                        logger.error(f"Error loading local tutorial file: {str(local_err)}")
+            return self._load_local_tutorial(tutorial_id)
+    
+    def _load_local_tutorial(self, tutorial_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a tutorial from local files as a fallback when the API cannot provide it.
+        
+        Args:
+            tutorial_id: The ID of the tutorial to load
             
+        Returns:
+            Dict[str, Any] or None: The local tutorial if there is one
+        """
+        from content.resolver import get_local_resolver
+        
+        logger.info(f"Attempting to load tutorial {tutorial_id} from local files as fallback")
+        try:
+            tutorial_data = get_local_resolver().resolve(tutorial_id)
+        except Exception as local_err:
+            logger.error(f"Error loading local tutorial: {str(local_err)}")
+            return None
+        
+        if tutorial_data is None:
+            logger.warning(f"No local fallback found for tutorial ID: {tutorial_id}")
             return None
         
+        logger.info(f"Successfully loaded local tutorial: {tutorial_data.get('title', 'Unknown')}")
+        console.print(f"[green]Loaded tutorial {tutorial_id} from local files[/green]")
+        return tutorial_data
+        
     def complete_tutorial(self, tutorial_id: str, xp_earned: int) -> bool:
         """
         Report tutorial completion to the API.
         
+        The event is written to the progress outbox and sent in the
+        background, so this never waits on the network; events that cannot
+        be delivered now are retried later, across restarts if necessary.
+        
         Args:
             tutorial_id: The ID of the completed tutorial
             xp_earned: The amount of XP earned
             
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if the completion was recorded, False otherwise
         """
-        url = f"{API_BASE_URL}/progress/tutorial-complete"
-        logger.info(f"Reporting completion of tutorial {tutorial_id} to {url}")
+        logger.info(f"Queueing completion of tutorial {tutorial_id} ({xp_earned} XP)")
         
         try:
-            # Get authentication headers with API key
-            headers = get_auth_header(self.api_key)
-            
-            # Prepare the payload
             payload = {
                 "tutorialId": tutorial_id,
                 "xpEarned": xp_earned
             }
+            (self.outbox or get_outbox()).enqueue('tutorial-complete', tutorial_id, payload, self.api_key)
+            return True
             
-            # Use httpx with a 10-second timeout
-            with httpx.Client(timeout=10.0) as client:
-                response = client.post(url, headers=headers, json=payload)
+        except Exception as e:
+            logger.error(f"Error recording tutorial completion: {str(e)}")
+            console.print(f"[yellow]Could not save progress: {str(e)}[/yellow]")
+            return False
+    
+    def report_tutorial_completion(self, tutorial_id: str, xp_earned: int) -> bool:
+        """
+        Report tutorial completion to the API (same as complete_tutorial).
+        
+        Args:
+            tutorial_id: The ID of the completed tutorial
+            xp_earned: The amount of XP earned
             
-            logger.info(f"API response status code: {response.status_code}")
+        Returns:
+            bool: True if the completion was recorded, False otherwise
+        """
+        return self.complete_tutorial(tutorial_id, xp_earned)
+    
+    def report_step_completion(self, tutorial_id: str, step_id: str, xp_earned: int) -> bool:
+        """
+        Note a completed step.
+        
+        The API has no per-step endpoint; step XP reaches it as part of the
+        tutorial completion, so this only logs and never touches the network.
+        
+        Args:
+            tutorial_id: The tutorial ID
+            step_id: The completed step
+            xp_earned: XP awarded for the step
             
-            # Handle authentication failure
-            if response.status_code == 401:
-                logger.error(f"Authentication failed. Response: {response.text}")
-                console.print("[red]Authentication failed: Invalid API key[/red]")
-                return False
-                
-            response.raise_for_status()  # Raise exception for other 4XX/5XX responses
+        Returns:
+            bool: Always True
+        """
+        logger.debug(f"Step {step_id} of tutorial {tutorial_id} completed ({xp_earned} XP)")
+        return True
+
+
+class AsyncTutorialClient(AsyncApiClient):
+    """
+    Async client for the tutorials API.
+    
+    Fetches many tutorials concurrently over one connection pool instead of
+    one round-trip after another. Unlike TutorialClient it does not print
+    or fall back to local files: failed fetches return None and the caller
+    decides what to do.
+    """
+    
+    def __init__(self, api_key=None, session: ApiSession = None, max_concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Initialize the client.
+        
+        Args:
+            api_key: API key (defaults to the stored key)
+            session: Session whose settings are used (defaults to the shared session)
+            max_concurrency: Maximum number of requests in flight
+        """
+        super().__init__(api_key, session, max_concurrency)
+        self.base_url = f"{API_BASE_URL}/tutorials"
+    
+    async def get_tutorials(self) -> List[Dict[str, Any]]:
+        """
+        Fetch all available tutorials.
+        
+        Returns:
+            List[Dict[str, Any]]: Tutorial metadata (empty if the request failed)
+        """
+        return await self._get_json(self.base_url) or []
+    
+    async def get_tutorial_by_id(self, tutorial_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a specific tutorial by its ID.
+        
+        Args:
+            tutorial_id: The ID of the tutorial to fetch
             
-            logger.info(f"Successfully reported completion of tutorial {tutorial_id}")
-            return True
+        Returns:
+            Dict[str, Any] or None: The tutorial, or None if it could not be fetched
+        """
+        return await self._get_json(f"{self.base_url}/{tutorial_id}")
+    
+    async def get_many(self, tutorial_ids: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch several tutorials concurrently.
+        
+        Args:
+            tutorial_ids: IDs of the tutorials to fetch
             
+        Returns:
+            dict: Tutorial ID -> tutorial, or None for tutorials that could not be fetched
+        """
+        return await self._get_many(lambda tutorial_id: f"{self.base_url}/{tutorial_id}", list(tutorial_ids))
+
+
+class TutorialPrefetcher:
+    """
+    Fetch tutorial details in a background thread.
+    
+    Start it with the listed tutorials before showing the menu; by the time
+    the user has picked one, its details are usually already here. start()
+    can be called again (e.g. with the tutorials likely to come next);
+    tutorials that are already here or on their way are not fetched twice.
+    """
+    
+    def __init__(self, api_key=None, max_concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Initialize the prefetcher.
+        
+        Args:
+            api_key: API key (defaults to the stored key)
+            max_concurrency: Maximum number of requests in flight
+        """
+        self.api_key = api_key
+        self.max_concurrency = max_concurrency
+        self._results: Dict[str, Optional[Dict[str, Any]]] = {}
+        # Tutorial IDs being fetched
+        self._pending = set()
+        self._done = threading.Condition()
+        # (event loop, task) of every running batch
+        self._runs = []
+    
+    def start(self, tutorials: Iterable[Any]):
+        """
+        Start fetching details in the background.
+        
+        Args:
+            tutorials: Tutorial IDs or tutorial metadata mappings (local tutorials are skipped)
+        """
+        tutorial_ids = []
+        with self._done:
+            for tutorial in tutorials:
+                if isinstance(tutorial, Mapping):
+                    if tutorial.get('fromLocalFile') or not tutorial.get('id'):
+                        continue
+                    tutorial = tutorial['id']
+                if self._results.get(tutorial) is None and tutorial not in self._pending:
+                    tutorial_ids.append(tutorial)
+                    self._pending.add(tutorial)
+        if not tutorial_ids:
+            return
+        
+        threading.Thread(target=self._run, args=(tutorial_ids,), name="tutorial-prefetch", daemon=True).start()
+    
+    def _run(self, tutorial_ids: List[str]):
+        """Prefetch thread: run the fetches on a private event loop."""
+        try:
+            asyncio.run(self._fetch_all(tutorial_ids))
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
-            logger.error(f"Error reporting tutorial completion: {str(e)}")
-            console.print(f"[yellow]Could not save progress: {str(e)}[/yellow]")
-            return False
\ No newline at end of file
+            logger.warning(f"Tutorial prefetch stopped: {e}")
+        finally:
+            with self._done:
+                self._pending.difference_update(tutorial_ids)
+                self._done.notify_all()
+    
+    async def _fetch_all(self, tutorial_ids: List[str]):
+        """Fetch every tutorial, publishing each one as soon as it arrives."""
+        run = (asyncio.get_running_loop(), asyncio.current_task())
+        self._runs.append(run)
+        
+        try:
+            async with AsyncTutorialClient(self.api_key, max_concurrency=self.max_concurrency) as client:
+                async def fetch(tutorial_id):
+                    tutorial = await client.get_tutorial_by_id(tutorial_id)
+                    with self._done:
+                        self._results[tutorial_id] = tutorial
+                        self._pending.discard(tutorial_id)
+                        self._done.notify_all()
+                
+                await asyncio.gather(*(fetch(tutorial_id) for tutorial_id in tutorial_ids))
+            logger.info(f"Prefetched {sum(1 for i in tutorial_ids if self._results.get(i))} of {len(tutorial_ids)} tutorials")
+        finally:
+            self._runs.remove(run)
+    
+    def get(self, tutorial_id: str, timeout: float = 0) -> Optional[Dict[str, Any]]:
+        """
+        The prefetched details of a tutorial.
+        
+        Args:
+            tutorial_id: The tutorial ID
+            timeout: Seconds to wait if the tutorial is still being fetched
+            
+        Returns:
+            Dict[str, Any] or None: The tutorial, or None if it is not (yet) available
+        """
+        with self._done:
+            self._done.wait_for(lambda: tutorial_id not in self._pending, timeout)
+            return self._results.get(tutorial_id)
+    
+    def stop(self):
+        """Cancel outstanding fetches (tutorials already fetched stay available)."""
+        for loop, task in list(self._runs):
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # The loop has already finished
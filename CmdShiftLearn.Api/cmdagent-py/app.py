@@ -13,6 +13,9 @@ from powershell.executor import PowerShellExecutor
 from powershell.validator import PowerShellValidator
 from content.manager import ContentManager
 from content.repository import ContentRepository
+from content.sql_repository import SqlContentRepository
+from content.bundle import DEFAULT_BUNDLE_PATH
+from content.models import Tutorial
 from user.profile import UserProfile
 from user.progress import ProgressTracker
 from gamification.xp import XPSystem
@@ -22,11 +25,37 @@ from certification.tracker import CertificationTracker
 from utils.config import load_config, DATA_DIR
 
 
+def create_content_repository(config: Dict[str, Any]):
+    """
+    Create the content repository selected in the configuration.
+    
+    Args:
+        config: Application configuration
+        
+    Returns:
+        The repository (not loaded yet)
+    """
+    # Content backend: YAML tree (default), a prebuilt bundle or the SQLite database
+    content_config = config.get('content', {})
+    if content_config.get('backend') == 'sqlite':
+        return SqlContentRepository(content_config.get('database'))
+    if content_config.get('backend') == 'bundle':
+        return ContentRepository(bundle_path=content_config.get('bundle') or DEFAULT_BUNDLE_PATH)
+    return ContentRepository()
+
+
 class CmdShiftLearn:
     """Main application class for CmdShiftLearn."""
     
-    def __init__(self):
-        """Initialize the application."""
+    def __init__(self, content_repository=None):
+        """
+        Initialize the application.
+        
+        Args:
+            content_repository: An already loaded content repository to use
+                                (e.g. shared by forked sessions); by default one is
+                                created from the configuration and loaded
+        """
         # Load configuration
         self.config = load_config()
         
@@ -37,8 +66,12 @@ class CmdShiftLearn:
         self.powershell_executor = PowerShellExecutor(sandbox_mode=True)
         self.powershell_validator = PowerShellValidator()
         
-        self.content_repository = ContentRepository()
-        self.content_manager = ContentManager(self.content_repository)
+        if content_repository is not None:
+            self.content_repository = content_repository
+            self.content_manager = ContentManager(content_repository, load=False)
+        else:
+            self.content_repository = create_content_repository(self.config)
+            self.content_manager = ContentManager(self.content_repository)
         
         self.xp_system = XPSystem()
         self.achievement_system = AchievementSystem()
@@ -89,8 +122,11 @@ class CmdShiftLearn:
         if not start_tutorial:
             return
         
+        # The list may only hold headers (lazy repository), so fetch the full tutorial
+        tutorial = self.content_manager.get_tutorial(selected_tutorial.get('id')) or selected_tutorial
+        
         # Run the tutorial
-        self._run_tutorial(selected_tutorial)
+        self._run_tutorial(tutorial)
     
     def start_challenge(self):
         """Start a challenge."""
@@ -223,8 +259,9 @@ class CmdShiftLearn:
         Args:
             tutorial: Tutorial data
         """
-        tutorial_id = tutorial.get('id')
-        steps = tutorial.get('steps', [])
+        tutorial = Tutorial.from_dict(tutorial)
+        tutorial_id = tutorial.id
+        steps = tutorial.steps or []
         
         if not steps:
             self.terminal_ui.console.print("[yellow]This tutorial has no interactive steps.[/yellow]")
@@ -239,10 +276,9 @@ class CmdShiftLearn:
             self.terminal_ui.display_tutorial_step(step, i + 1, len(steps))
             
             # If this is a command step, prompt for input
-            step_type = step.get('type', '')
-            if step_type == 'command' or step_type == 'challenge':
-                # Get expected command
-                expected_command = step.get('command', '') or step.get('expected_command', '')
+            if step.type == 'command' or step.type == 'challenge':
+                expected_command = step.command or ''
+                validation_type = step.validation_type or 'exact'
                 
                 # Get user input
                 user_input = self.terminal_ui.get_command_input(step)
@@ -251,12 +287,12 @@ class CmdShiftLearn:
                 is_correct, feedback = self.input_handler.check_command(
                     user_input, 
                     expected_command,
-                    step.get('validation_type', 'exact')
+                    validation_type
                 )
                 
                 # Provide a hint if incorrect
                 if not is_correct:
-                    hint = step.get('hint', "Try reviewing the instructions.")
+                    hint = step.hint or "Try reviewing the instructions."
                     self.terminal_ui.display_feedback(is_correct, feedback, hint)
                     
                     # Give a second attempt
@@ -264,7 +300,7 @@ class CmdShiftLearn:
                     is_correct, feedback = self.input_handler.check_command(
                         user_input, 
                         expected_command,
-                        step.get('validation_type', 'exact')
+                        validation_type
                     )
                 
                 # Display final feedback
@@ -8,19 +8,22 @@ from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 from utils.config import DATA_DIR
+from content.cache import ContentCache
 
 
 class CertificationTracker:
     """Track and manage progress towards certifications."""
     
-    def __init__(self, content_dir: str = None):
+    def __init__(self, content_dir: str = None, use_cache: bool = True):
         """
         Initialize the certification tracker.
         
         Args:
             content_dir: Directory containing certification data (defaults to data/content/certifications)
+            use_cache: Whether to read certifications through the compiled content snapshot
         """
         self.content_dir = Path(content_dir) if content_dir else Path(DATA_DIR) / "content" / "certifications"
+        self.cache = ContentCache() if use_cache else None
         self.certifications = {}
         self.load_certifications()
     
@@ -36,12 +39,18 @@ class CertificationTracker:
         # Load certification files
         for file_path in self.content_dir.glob("*.yaml"):
             try:
-                with open(file_path, 'r') as file:
-                    cert_data = yaml.safe_load(file)
-                    if cert_data and 'id' in cert_data:
-                        self.certifications[cert_data['id']] = cert_data
+                if self.cache:
+                    cert_data = self.cache.load_yaml(file_path)
+                else:
+                    with open(file_path, 'r') as file:
+                        cert_data = yaml.safe_load(file)
+                if cert_data and 'id' in cert_data:
+                    self.certifications[cert_data['id']] = cert_data
             except Exception as e:
                 print(f"Error loading certification data from {file_path}: {e}")
+        
+        if self.cache:
+            self.cache.save()
     
     def _create_default_certifications(self):
         """Create default certification files."""
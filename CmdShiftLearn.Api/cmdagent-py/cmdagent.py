@@ -40,8 +40,224 @@ def create_parser() -> argparse.ArgumentParser:
     start_parser = tutorial_subparsers.add_parser("start", help="Start a tutorial")
     start_parser.add_argument("tutorial_id", help="ID of the tutorial to start")
     
+    # Search command
+    search_parser = subparsers.add_parser("search", help="Search tutorials and challenges")
+    search_parser.add_argument("query", nargs="+", help="Search terms")
+    search_parser.add_argument("--limit", type=int, default=10, help="Maximum number of results")
+    search_parser.add_argument("--type", choices=["tutorial", "challenge"], help="Only show this content type")
+    search_parser.add_argument("--difficulty", help="Only show this difficulty level")
+    search_parser.add_argument("--topic", help="Only show content with this topic")
+    
+    # Content command
+    content_parser = subparsers.add_parser("content", help="Local content commands")
+    content_subparsers = content_parser.add_subparsers(dest="content_command", help="Content subcommand")
+    
+    # Content import command
+    import_parser = content_subparsers.add_parser("import", help="Import the YAML content tree into the SQLite database")
+    import_parser.add_argument("--db", help="Database file (defaults to data/content.db)")
+    import_parser.add_argument("--source", help="YAML content directory (defaults to data/content)")
+    
+    # Content build command
+    build_parser = content_subparsers.add_parser("build", help="Build a single-file content bundle from the YAML tree")
+    build_parser.add_argument("--output", help="Bundle file (defaults to data/content.bundle)")
+    build_parser.add_argument("--source", help="YAML content directory (defaults to data/content)")
+    build_parser.add_argument("--workers", type=int, default=0, help="Parse and validate with this many processes (0 = one per CPU)")
+    build_parser.add_argument("--no-validate", action="store_true", help="Build without validating the content first")
+    
+    # Content validate command
+    validate_parser = content_subparsers.add_parser("validate", help="Validate the YAML content tree without building")
+    validate_parser.add_argument("--source", help="YAML content directory (defaults to data/content)")
+    validate_parser.add_argument("--workers", type=int, default=0, help="Parse and validate with this many processes (0 = one per CPU)")
+    
+    # Content memory command
+    memory_parser = content_subparsers.add_parser("memory", help="Show memory saved by deduplicating content strings")
+    memory_parser.add_argument("--source", help="YAML content directory (defaults to data/content)")
+    memory_parser.add_argument("--bundle", help="Load from a content bundle instead of the YAML tree")
+    
     return parser
 
+def validate_content(console, source: Optional[str], workers: int):
+    """
+    Parse and validate the YAML content tree, printing every finding.
+    
+    Args:
+        console: Rich console for output
+        source: YAML content directory (defaults to data/content)
+        workers: Number of processes (0 = one per CPU)
+        
+    Returns:
+        tuple: (catalog, issues)
+    """
+    from rich.table import Table
+    from content.repository import ContentRepository
+    from content.validation import validate_catalog
+    
+    repository = ContentRepository(source, use_cache=False, workers=workers, verbose=False)
+    catalog = repository.read_catalog()
+    issues = validate_catalog(catalog, repository.workers, repository.load_errors)
+    
+    if issues:
+        table = Table(title="Content validation")
+        table.add_column("Severity")
+        table.add_column("Item", style="cyan", overflow="fold")
+        table.add_column("Problem")
+        for issue in issues:
+            severity = "[red]error[/red]" if issue["severity"] == "error" else "[yellow]warning[/yellow]"
+            item = f"{issue['kind']}/{issue['id']}" if issue["kind"] else issue["path"]
+            table.add_row(severity, item, issue["message"])
+        console.print(table)
+    return catalog, issues
+
+def run_content_validate(parsed_args: argparse.Namespace) -> None:
+    """
+    Validate the YAML content tree; exits with status 1 on errors.
+    
+    Args:
+        parsed_args: Parsed arguments of the content validate command
+    """
+    from rich.console import Console
+    from content.validation import has_errors
+    
+    console = Console()
+    catalog, issues = validate_content(console, parsed_args.source, parsed_args.workers)
+    errors = sum(1 for issue in issues if issue["severity"] == "error")
+    
+    if has_errors(issues):
+        console.print(f"[red]Content is invalid: {errors} errors, {len(issues) - errors} warnings[/red]")
+        sys.exit(1)
+    console.print(f"[green]Content is valid: {len(catalog['tutorials'])} tutorials, "
+                  f"{len(catalog['challenges'])} challenges ({len(issues)} warnings)[/green]")
+
+def run_content_build(parsed_args: argparse.Namespace) -> None:
+    """
+    Validate the YAML content tree and build a content bundle from it.
+    
+    The bundle is only written when validation finds no errors, unless
+    validation is skipped with --no-validate.
+    
+    Args:
+        parsed_args: Parsed arguments of the content build command
+    """
+    from rich.console import Console
+    from content.repository import ContentRepository
+    from content.bundle import ContentBundle, DEFAULT_BUNDLE_PATH
+    from content.validation import has_errors
+    
+    console = Console()
+    output = parsed_args.output or DEFAULT_BUNDLE_PATH
+    
+    if parsed_args.no_validate:
+        catalog = ContentRepository(parsed_args.source, use_cache=False, workers=parsed_args.workers,
+                                    verbose=False).read_catalog()
+        validated = False
+    else:
+        catalog, issues = validate_content(console, parsed_args.source, parsed_args.workers)
+        if has_errors(issues):
+            console.print("[red]Content has errors; bundle not built.[/red]")
+            sys.exit(1)
+        validated = True
+    
+    manifest = ContentBundle.build(catalog, output)
+    
+    counts = {kind: len(entries) for kind, entries in manifest["items"].items()}
+    console.print(f"[green]Built {output}: {counts['tutorials']} tutorials, {counts['challenges']} challenges, "
+                  f"{counts['certifications']} certifications, {counts['skill_trees']} skill trees "
+                  f"({os.path.getsize(output)} bytes, content {manifest['content_hash'][:12]}, "
+                  f"{'validated' if validated else 'not validated'})[/green]")
+
+def run_content_memory(parsed_args: argparse.Namespace) -> None:
+    """
+    Load the content and report the bytes saved by the string pool, per field.
+    
+    Args:
+        parsed_args: Parsed arguments of the content memory command
+    """
+    from rich.console import Console
+    from rich.table import Table
+    from content.repository import ContentRepository
+    
+    console = Console()
+    repository = ContentRepository(parsed_args.source, use_cache=False, verbose=False,
+                                   bundle_path=parsed_args.bundle)
+    repository.load_all_content()
+    rows = repository.strings.report()
+    
+    table = Table(title=f"Content string pool ({len(repository.strings)} distinct strings)")
+    table.add_column("Field", style="green")
+    table.add_column("Values", justify="right")
+    table.add_column("Unique", justify="right")
+    table.add_column("Stored bytes", justify="right")
+    table.add_column("Saved bytes", style="cyan", justify="right")
+    
+    for row in rows:
+        table.add_row(row["field"], str(row["values"]), str(row["unique"]),
+                      str(row["bytes_stored"]), str(row["bytes_saved"]))
+    
+    totals = {key: sum(row[key] for row in rows) for key in ("values", "unique", "bytes_stored", "bytes_saved")}
+    table.add_row("[bold]Total[/bold]", str(totals["values"]), str(totals["unique"]),
+                  str(totals["bytes_stored"]), f"[bold]{totals['bytes_saved']}[/bold]")
+    
+    console.print(table)
+
+def run_content_import(parsed_args: argparse.Namespace) -> None:
+    """
+    Import the YAML content tree into the SQLite content database.
+    
+    Args:
+        parsed_args: Parsed arguments of the content import command
+    """
+    from rich.console import Console
+    from content.sql_repository import SqlContentRepository
+    
+    console = Console()
+    repository = SqlContentRepository(parsed_args.db, parsed_args.source)
+    counts = repository.import_yaml()
+    
+    console.print(f"[green]Imported {counts['tutorials']} tutorials, {counts['challenges']} challenges, "
+                  f"{counts['certifications']} certifications and {counts['skill_trees']} skill trees "
+                  f"into {repository.db_path}[/green]")
+
+def run_search(parsed_args: argparse.Namespace) -> None:
+    """
+    Search local tutorials and challenges and print the results.
+    
+    Args:
+        parsed_args: Parsed arguments of the search command
+    """
+    from rich.console import Console
+    from rich.table import Table
+    from content.repository import ContentRepository
+    from content.manager import ContentManager
+    
+    console = Console()
+    manager = ContentManager(ContentRepository(verbose=False))
+    
+    query = " ".join(parsed_args.query)
+    filters = {
+        "type": parsed_args.type,
+        "difficulty": parsed_args.difficulty,
+        "topic": parsed_args.topic,
+    }
+    results = manager.search(query, parsed_args.limit, {k: v for k, v in filters.items() if v})
+    
+    if not results:
+        console.print(f"[yellow]No content found for '{query}'.[/yellow]")
+        return
+    
+    table = Table(title=f"Search results for '{query}'")
+    table.add_column("#", style="cyan", justify="right")
+    table.add_column("Type", style="blue")
+    table.add_column("ID", style="green")
+    table.add_column("Title", style="magenta")
+    table.add_column("Difficulty", style="yellow")
+    table.add_column("Score", justify="right")
+    
+    for i, result in enumerate(results, 1):
+        table.add_row(str(i), result["type"], str(result["id"]), result["title"],
+                      result["difficulty"], f"{result['score']:.2f}")
+    
+    console.print(table)
+
 def process_args(args: Optional[List[str]] = None) -> None:
     """
     Process command-line arguments and dispatch to the appropriate handler.
@@ -52,6 +268,24 @@ def process_args(args: Optional[List[str]] = None) -> None:
     parser = create_parser()
     parsed_args = parser.parse_args(args)
     
+    # Searching local content needs neither the API nor authentication
+    if parsed_args.command == "search":
+        run_search(parsed_args)
+        return
+    
+    if parsed_args.command == "content":
+        if parsed_args.content_command == "import":
+            run_content_import(parsed_args)
+        elif parsed_args.content_command == "build":
+            run_content_build(parsed_args)
+        elif parsed_args.content_command == "validate":
+            run_content_validate(parsed_args)
+        elif parsed_args.content_command == "memory":
+            run_content_memory(parsed_args)
+        else:
+            parser.parse_args(["content", "--help"])
+        return
+    
     # Import UI and other modules only when needed
     from terminal.animated_ui import AnimatedTerminalUI
     from api.tutorials import TutorialClient
@@ -0,0 +1,343 @@
+"""
+Single-file content bundle with memory-mapped, lazily deserialized items.
+"""
+
+import io
+import os
+import json
+import mmap
+import time
+import struct
+import pickle
+import hashlib
+from pathlib import Path
+from collections import Counter
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+
+from utils.config import DATA_DIR
+from content.models import to_plain
+
+
+# Default location of the content bundle
+DEFAULT_BUNDLE_PATH = Path(DATA_DIR) / "content.bundle"
+
+# File signature and header: magic, format version, string table offset and
+# length, manifest offset and length
+BUNDLE_MAGIC = b"CSLBNDL\0"
+HEADER = struct.Struct("<8sIQQQQ")
+
+# Content kinds stored in a bundle, in write order
+BUNDLE_KINDS = ('tutorials', 'challenges', 'certifications', 'skill_trees')
+
+
+class BundleError(Exception):
+    """Raised when a bundle file is missing, corrupt or of an unsupported version."""
+
+
+class _StringCounter(pickle.Pickler):
+    """Pickler that only counts the strings it sees (first build pass)."""
+
+    def __init__(self, counts: Counter):
+        super().__init__(io.BytesIO(), pickle.HIGHEST_PROTOCOL)
+        self.counts = counts
+
+    def persistent_id(self, obj):
+        if type(obj) is str:
+            self.counts[obj] += 1
+        return None
+
+
+class _StringTablePickler(pickle.Pickler):
+    """Pickler that writes strings found in the string table as table references."""
+
+    def __init__(self, file, table: Dict[str, int]):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.table = table
+
+    def persistent_id(self, obj):
+        if type(obj) is str:
+            return self.table.get(obj)
+        return None
+
+
+class _StringTableUnpickler(pickle.Unpickler):
+    """Unpickler that resolves table references to the shared string objects."""
+
+    def __init__(self, file, strings: List[str]):
+        super().__init__(file)
+        self.strings = strings
+
+    def persistent_load(self, pid):
+        return self.strings[pid]
+
+
+def item_hash(item: Any) -> str:
+    """
+    SHA-1 of an item's normalized content.
+
+    Computed over canonical JSON (sorted keys), so the hash only changes
+    when the content does, not when the bundle encoding changes.
+
+    Args:
+        item: A content item
+
+    Returns:
+        str: Hex digest
+    """
+    canonical = json.dumps(to_plain(item, canonical=True), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def _dumps(obj: Any, table: Dict[str, int]) -> bytes:
+    """Pickle a value against the bundle string table."""
+    buffer = io.BytesIO()
+    _StringTablePickler(buffer, table).dump(obj)
+    return buffer.getvalue()
+
+
+class ContentBundle:
+    """
+    Read-only view of a content bundle file.
+
+    A bundle is one file: a fixed header, the serialized items back to
+    back, a string table, and a manifest listing each item's offset,
+    length and SHA-1. The file is memory-mapped read-only, so processes on
+    the same host share its pages through the OS page cache, and an item
+    is only unpickled when it is read. The manifest also carries tutorial
+    headers (everything except the steps) so menus never touch the step
+    bodies.
+
+    Strings that occur more than once across the bundle (hints, repeated
+    instructions, topics, IDs) are stored once in the string table and
+    referenced by index, so every item read from the bundle shares the
+    same string objects.
+    """
+
+    # Bump when the file layout changes
+    FORMAT_VERSION = 3
+
+    def __init__(self, path=None):
+        """
+        Open a bundle.
+
+        Args:
+            path: Bundle file (defaults to data/content.bundle)
+
+        Raises:
+            BundleError: If the file cannot be opened or is not a valid bundle
+        """
+        self.path = Path(path) if path else DEFAULT_BUNDLE_PATH
+        try:
+            self._file = open(self.path, 'rb')
+        except OSError as e:
+            raise BundleError(f"Cannot open content bundle {self.path}: {e}")
+
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version = struct.unpack_from("<8sI", self._map, 0)
+            if magic != BUNDLE_MAGIC:
+                raise BundleError(f"{self.path} is not a content bundle")
+            if version != self.FORMAT_VERSION:
+                raise BundleError(f"Unsupported content bundle version {version} in {self.path}")
+            _, _, strings_offset, strings_length, manifest_offset, manifest_length = \
+                HEADER.unpack_from(self._map, 0)
+            self.strings: List[str] = pickle.loads(self._map[strings_offset:strings_offset + strings_length])
+            self.manifest = self._loads(self._map[manifest_offset:manifest_offset + manifest_length])
+        except BundleError:
+            self.close()
+            raise
+        except Exception as e:
+            self.close()
+            raise BundleError(f"Corrupt content bundle {self.path}: {e}")
+
+    def _loads(self, blob: bytes) -> Any:
+        """Unpickle a value written against this bundle's string table."""
+        return _StringTableUnpickler(io.BytesIO(blob), self.strings).load()
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-1 over every item hash; changes whenever any item changes."""
+        return self.manifest['content_hash']
+
+    @property
+    def built_at(self) -> float:
+        """Build time as a Unix timestamp."""
+        return self.manifest['built_at']
+
+    def item_hashes(self, kind: str) -> Dict[str, str]:
+        """
+        Content hashes of the items of one kind (see item_hash()).
+
+        Args:
+            kind: Content kind
+
+        Returns:
+            dict: Item ID -> hex digest
+        """
+        return dict(self.manifest.get('hashes', {}).get(kind, {}))
+
+    def ids(self, kind: str) -> List[str]:
+        """
+        List the item IDs of one kind, in bundle order.
+
+        Args:
+            kind: Content kind (tutorials, challenges, ...)
+
+        Returns:
+            list: Item IDs
+        """
+        return list(self.manifest['items'].get(kind, {}))
+
+    def headers(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Tutorial headers stored in the manifest (no steps, with step_count).
+
+        Returns:
+            dict: Tutorial ID -> header
+        """
+        return self.manifest['headers']
+
+    def read(self, kind: str, item_id: str, verify: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Deserialize one item from its offset in the mapped file.
+
+        Args:
+            kind: Content kind
+            item_id: The item ID
+            verify: Check the item bytes against the manifest hash first
+
+        Returns:
+            dict: The item, or None if the bundle has no such item
+
+        Raises:
+            BundleError: If verification fails
+        """
+        entry = self.manifest['items'].get(kind, {}).get(item_id)
+        if entry is None:
+            return None
+
+        offset, length, digest = entry
+        blob = self._map[offset:offset + length]
+        if verify and hashlib.sha1(blob).hexdigest() != digest:
+            raise BundleError(f"Hash mismatch for {kind} '{item_id}' in {self.path}")
+        return self._loads(blob)
+
+    def iter_items(self, kind: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Deserialize every item of one kind.
+
+        Args:
+            kind: Content kind
+
+        Yields:
+            tuple: (item_id, item)
+        """
+        for item_id in self.ids(kind):
+            yield item_id, self.read(kind, item_id)
+
+    def verify(self) -> List[str]:
+        """
+        Check every item against its manifest hash.
+
+        Returns:
+            list: "kind/id" of each item whose bytes do not match
+        """
+        bad = []
+        for kind, entries in self.manifest['items'].items():
+            for item_id, (offset, length, digest) in entries.items():
+                if hashlib.sha1(self._map[offset:offset + length]).hexdigest() != digest:
+                    bad.append(f"{kind}/{item_id}")
+        return bad
+
+    def close(self):
+        """Unmap and close the bundle file."""
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        if getattr(self, '_file', None) is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @classmethod
+    def build(cls, catalog: Dict[str, Dict], path=None) -> Dict[str, Any]:
+        """
+        Write a catalog to a bundle file.
+
+        The file is written to a temporary path and renamed, so processes
+        that have the old bundle mapped keep reading a consistent file.
+        The manifest records the content hash of every item.
+
+        Args:
+            catalog: Catalog as returned by ContentRepository.read_catalog()
+            path: Destination file (defaults to data/content.bundle)
+
+        Returns:
+            dict: The manifest that was written
+        """
+        from content.repository import ContentRepository
+
+        path = Path(path) if path else DEFAULT_BUNDLE_PATH
+        os.makedirs(path.parent, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+        ordered = [(kind, item_id, catalog[kind][item_id])
+                   for kind in BUNDLE_KINDS for item_id in sorted(catalog.get(kind, {}), key=str)]
+        headers = {item_id: ContentRepository._make_header(item)
+                   for kind, item_id, item in ordered if kind == 'tutorials'}
+
+        # First pass: strings seen more than once go to the string table
+        counts = Counter()
+        counter = _StringCounter(counts)
+        for _, _, item in ordered:
+            counter.dump(item)
+        counter.dump(headers)
+        strings = sorted(value for value, count in counts.items() if count > 1)
+        table = {value: position for position, value in enumerate(strings)}
+        strings_blob = pickle.dumps(strings, pickle.HIGHEST_PROTOCOL)
+
+        items: Dict[str, Dict[str, tuple]] = {kind: {} for kind in BUNDLE_KINDS}
+        try:
+            with open(tmp_path, 'wb') as file:
+                file.write(HEADER.pack(BUNDLE_MAGIC, cls.FORMAT_VERSION, 0, 0, 0, 0))
+                for kind, item_id, item in ordered:
+                    blob = _dumps(item, table)
+                    items[kind][item_id] = (file.tell(), len(blob), hashlib.sha1(blob).hexdigest())
+                    file.write(blob)
+
+                strings_offset = file.tell()
+                file.write(strings_blob)
+
+                # Item blobs refer to the string table, so its hash is part of the content hash
+                content_hash = hashlib.sha1("\n".join(
+                    [hashlib.sha1(strings_blob).hexdigest()] + [
+                        f"{kind}\t{item_id}\t{entry[2]}"
+                        for kind in BUNDLE_KINDS for item_id, entry in items[kind].items()]
+                ).encode('utf-8')).hexdigest()
+                manifest = {
+                    'format': cls.FORMAT_VERSION,
+                    'content_hash': content_hash,
+                    'built_at': time.time(),
+                    'items': items,
+                    'headers': headers,
+                    'strings': len(strings),
+                    'hashes': {kind: {item_id: item_hash(item) for k, item_id, item in ordered if k == kind}
+                               for kind in BUNDLE_KINDS},
+                }
+
+                manifest_blob = _dumps(manifest, table)
+                manifest_offset = file.tell()
+                file.write(manifest_blob)
+                file.seek(0)
+                file.write(HEADER.pack(BUNDLE_MAGIC, cls.FORMAT_VERSION, strings_offset, len(strings_blob),
+                                       manifest_offset, len(manifest_blob)))
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                os.remove(tmp_path)
+        return manifest
@@ -0,0 +1,222 @@
+"""
+On-disk snapshot cache for parsed content files.
+"""
+
+import os
+import pickle
+import hashlib
+import yaml
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from utils.config import DATA_DIR
+
+
+# Default location of the compiled content snapshot
+DEFAULT_CACHE_PATH = Path(DATA_DIR) / "cache" / "content_snapshot.bin"
+
+
+class ContentCache:
+    """
+    Binary snapshot of parsed YAML content files.
+
+    Each entry is keyed by the absolute file path and stores the file's
+    mtime, size and SHA-1 hash together with the pickled parse result.
+    A file whose mtime and size are unchanged is served straight from the
+    snapshot; a file whose stat changed but whose hash did not is also a
+    hit. Only files whose bytes actually changed go through the YAML parser.
+    """
+
+    # Bump when the snapshot layout changes so stale snapshots are ignored
+    VERSION = 1
+
+    def __init__(self, cache_path: str = None):
+        """
+        Initialize the content cache.
+
+        Args:
+            cache_path: Path of the snapshot file (defaults to data/cache/content_snapshot.bin)
+        """
+        self.cache_path = Path(cache_path) if cache_path else DEFAULT_CACHE_PATH
+        self.entries: Dict[str, Tuple[int, int, str, bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._loaded = False
+
+    def load(self):
+        """Load the snapshot from disk, ignoring missing or incompatible files."""
+        self._loaded = True
+        if not self.cache_path.exists():
+            return
+
+        try:
+            with open(self.cache_path, 'rb') as file:
+                snapshot = pickle.load(file)
+            if snapshot.get('version') == self.VERSION:
+                self.entries = snapshot.get('entries', {})
+        except Exception as e:
+            print(f"Ignoring unreadable content cache {self.cache_path}: {e}")
+            self.entries = {}
+
+    def reset_stats(self):
+        """Reset the hit/miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, file_path) -> Tuple[bool, Any]:
+        """
+        Look up a file in the snapshot without parsing it.
+        
+        Args:
+            file_path: Path of the YAML file
+            
+        Returns:
+            tuple: (hit, data) where data is only meaningful on a hit
+        """
+        if not self._loaded:
+            self.load()
+
+        key = os.path.abspath(file_path)
+        entry = self.entries.get(key)
+        if not entry:
+            return False, None
+
+        stat = os.stat(key)
+
+        # Fast path: stat unchanged, no need to read the file at all
+        if entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            self.hits += 1
+            return True, pickle.loads(entry[3])
+
+        with open(key, 'rb') as file:
+            digest = hashlib.sha1(file.read()).hexdigest()
+
+        # Touched but not modified: refresh the stat key, keep the parse result
+        if entry[2] == digest:
+            self.hits += 1
+            self.entries[key] = (stat.st_mtime_ns, stat.st_size, digest, entry[3])
+            self._dirty = True
+            return True, pickle.loads(entry[3])
+
+        return False, None
+
+    def store(self, file_path, data: Any, mtime_ns: int, size: int, digest: str):
+        """
+        Record a freshly parsed file in the snapshot.
+        
+        Args:
+            file_path: Path of the YAML file
+            data: The parsed YAML data
+            mtime_ns: File modification time in nanoseconds
+            size: File size in bytes
+            digest: SHA-1 hex digest of the file contents
+        """
+        key = os.path.abspath(file_path)
+        self.misses += 1
+        self.entries[key] = (mtime_ns, size, digest, pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+        self._dirty = True
+
+    def digest(self, file_path) -> Optional[str]:
+        """
+        Return the content hash recorded for a file, if it is in the snapshot.
+        
+        Args:
+            file_path: Path of the YAML file
+            
+        Returns:
+            str: SHA-1 hex digest, or None if the file is not cached
+        """
+        entry = self.entries.get(os.path.abspath(file_path))
+        return entry[2] if entry else None
+
+    def forget(self, file_path):
+        """
+        Drop a file's entry, e.g. after the repository rewrote it.
+        
+        Args:
+            file_path: Path of the YAML file
+        """
+        if self.entries.pop(os.path.abspath(file_path), None) is not None:
+            self._dirty = True
+
+    def load_yaml(self, file_path) -> Any:
+        """
+        Return the parsed content of a YAML file, using the snapshot when possible.
+
+        Args:
+            file_path: Path of the YAML file
+
+        Returns:
+            The parsed YAML data (parse errors propagate to the caller)
+        """
+        hit, data = self.lookup(file_path)
+        if hit:
+            return data
+
+        data, mtime_ns, size, digest = read_content_file(file_path)
+        self.store(file_path, data, mtime_ns, size, digest)
+        return data
+
+    def save(self) -> bool:
+        """
+        Write the snapshot to disk if anything changed.
+
+        Entries for files that no longer exist are dropped. The file is
+        written to a temporary path and renamed so readers never see a
+        partially written snapshot.
+
+        Returns:
+            bool: True if the snapshot is up to date on disk, False on error
+        """
+        stale = [key for key in self.entries if not os.path.exists(key)]
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self._dirty = True
+
+        if not self._dirty:
+            return True
+
+        try:
+            os.makedirs(self.cache_path.parent, exist_ok=True)
+            tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as file:
+                pickle.dump({'version': self.VERSION, 'entries': self.entries},
+                            file, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+            return True
+        except Exception as e:
+            print(f"Error saving content cache {self.cache_path}: {e}")
+            return False
+
+    def clear(self):
+        """Drop all cached entries and remove the snapshot file."""
+        self.entries = {}
+        self._dirty = False
+        try:
+            if self.cache_path.exists():
+                os.remove(self.cache_path)
+        except Exception as e:
+            print(f"Error removing content cache {self.cache_path}: {e}")
+
+
+
+def read_content_file(file_path) -> Tuple[Any, int, int, str]:
+    """
+    Read and parse a YAML content file.
+    
+    This is a plain module-level function so it can be shipped to worker
+    processes when content is ingested in parallel.
+    
+    Args:
+        file_path: Path of the YAML file
+        
+    Returns:
+        tuple: (data, mtime_ns, size, sha1_hex_digest)
+    """
+    stat = os.stat(file_path)
+    with open(file_path, 'rb') as file:
+        raw = file.read()
+    return yaml.safe_load(raw), stat.st_mtime_ns, stat.st_size, hashlib.sha1(raw).hexdigest()
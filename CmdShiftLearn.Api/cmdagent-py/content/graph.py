@@ -0,0 +1,278 @@
+"""
+Content relationship graph: certification, tutorial and challenge links plus the prerequisite DAG.
+"""
+
+import heapq
+from collections import defaultdict
+from typing import Dict, List, Any, Set, Tuple, Iterable, Optional
+
+from content.index import path_sort_key
+
+
+def prerequisite_ids(tutorial: Dict[str, Any]) -> List[str]:
+    """
+    Read the prerequisite tutorial IDs declared by a tutorial.
+
+    Entries may be plain IDs or mappings with an 'id' or 'tutorial_id' key.
+
+    Args:
+        tutorial: The tutorial data
+
+    Returns:
+        list: Prerequisite tutorial IDs in declaration order
+    """
+    ids = []
+    for entry in tutorial.get('prerequisites', []) or []:
+        if isinstance(entry, dict):
+            entry = entry.get('id') or entry.get('tutorial_id')
+        if entry and entry not in ids:
+            ids.append(entry)
+    return ids
+
+
+def mapped_cert_ids(tutorial: Dict[str, Any]) -> List[str]:
+    """
+    Read the certification IDs a tutorial maps to.
+
+    Args:
+        tutorial: The tutorial data
+
+    Returns:
+        list: Certification IDs from its certification_mappings
+    """
+    return [mapping.get('cert_id') for mapping in tutorial.get('certification_mappings', []) or []
+            if isinstance(mapping, dict) and mapping.get('cert_id')]
+
+
+class ContentGraph:
+    """
+    Adjacency-set graph over one catalog generation.
+
+    Edges are kept in both directions as sets, so linking is O(1) and every
+    neighbour query is a dictionary lookup. Prerequisite edges form a DAG:
+    finalize() runs Kahn's algorithm once, caching a topological order of
+    all tutorials (ties broken by level, then title) and the set of
+    tutorials caught in prerequisite cycles. The graph never writes into
+    the content items themselves.
+    """
+
+    def __init__(self):
+        """Initialize an empty graph."""
+        self.tutorial_keys: Dict[str, Tuple] = {}
+        self.tutorial_difficulty: Dict[str, str] = {}
+        self.cert_order: Dict[str, List[str]] = {}
+        self.cert_tutorials: Dict[str, Set[str]] = defaultdict(set)
+        self.tutorial_certs: Dict[str, Set[str]] = defaultdict(set)
+        self.tutorial_challenges: Dict[str, Set[str]] = defaultdict(set)
+        self.challenge_tutorials: Dict[str, Set[str]] = defaultdict(set)
+        self.prerequisites: Dict[str, Set[str]] = defaultdict(set)
+        self.dependents: Dict[str, Set[str]] = defaultdict(set)
+        self.challenges: Set[str] = set()
+        self.topological_order: List[str] = []
+        self.cyclic: Set[str] = set()
+        self._positions: Dict[str, int] = {}
+        self._paths: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_catalog(cls, catalog: Dict[str, Dict]) -> 'ContentGraph':
+        """
+        Build the graph for a catalog.
+
+        Args:
+            catalog: Catalog with 'tutorials', 'challenges' and 'certifications' maps
+
+        Returns:
+            ContentGraph: The finished graph
+        """
+        graph = cls()
+        for cert_id, cert in catalog['certifications'].items():
+            graph.add_certification(cert_id, cert.get('tutorials', []) or [])
+        for tutorial_id, tutorial in catalog['tutorials'].items():
+            graph.add_tutorial(tutorial_id, path_sort_key(tutorial), tutorial.get('difficulty', ''),
+                               prerequisite_ids(tutorial), mapped_cert_ids(tutorial))
+        for challenge_id, challenge in catalog['challenges'].items():
+            graph.add_challenge(challenge_id, challenge.get('related_tutorials', []) or [])
+        graph.finalize()
+        return graph
+
+    def add_certification(self, cert_id: str, tutorial_ids: Iterable[str] = ()):
+        """
+        Add a certification and the tutorials its own file lists.
+
+        Args:
+            cert_id: The certification ID
+            tutorial_ids: Tutorial IDs listed by the certification, in display order
+        """
+        self.cert_order[cert_id] = []
+        for tutorial_id in tutorial_ids:
+            self.link_certification(tutorial_id, cert_id)
+
+    def add_tutorial(self, tutorial_id: str, sort_key: Tuple, difficulty: Any = '',
+                     prerequisites: Iterable[str] = (), cert_ids: Iterable[str] = ()):
+        """
+        Add a tutorial with its outgoing edges.
+
+        Args:
+            tutorial_id: The tutorial ID
+            sort_key: Tie-break key for the topological order (level, title)
+            difficulty: The tutorial difficulty
+            prerequisites: IDs of tutorials that must come first
+            cert_ids: Certifications the tutorial maps to
+        """
+        self.tutorial_keys[tutorial_id] = sort_key
+        self.tutorial_difficulty[tutorial_id] = str(difficulty or '').lower()
+        for prerequisite_id in prerequisites:
+            if prerequisite_id != tutorial_id:
+                self.prerequisites[tutorial_id].add(prerequisite_id)
+                self.dependents[prerequisite_id].add(tutorial_id)
+            else:
+                self.cyclic.add(tutorial_id)
+        for cert_id in cert_ids:
+            self.link_certification(tutorial_id, cert_id)
+
+    def add_challenge(self, challenge_id: str, tutorial_ids: Iterable[str] = ()):
+        """
+        Add a challenge and its links to related tutorials.
+
+        Args:
+            challenge_id: The challenge ID
+            tutorial_ids: Tutorials the challenge declares as related
+        """
+        self.challenges.add(challenge_id)
+        for tutorial_id in tutorial_ids:
+            self.challenge_tutorials[challenge_id].add(tutorial_id)
+            self.tutorial_challenges[tutorial_id].add(challenge_id)
+
+    def link_certification(self, tutorial_id: str, cert_id: str):
+        """
+        Link a tutorial to a certification.
+
+        Args:
+            tutorial_id: The tutorial ID
+            cert_id: The certification ID
+        """
+        if tutorial_id in self.cert_tutorials[cert_id]:
+            return
+        self.cert_tutorials[cert_id].add(tutorial_id)
+        self.tutorial_certs[tutorial_id].add(cert_id)
+        self.cert_order.setdefault(cert_id, []).append(tutorial_id)
+
+    def finalize(self):
+        """Compute the cached topological order and per-difficulty learning paths."""
+        # Only edges between known tutorials constrain the order
+        indegree = {tutorial_id: 0 for tutorial_id in self.tutorial_keys}
+        for tutorial_id in self.tutorial_keys:
+            for prerequisite_id in self.prerequisites.get(tutorial_id, ()):
+                if prerequisite_id in indegree:
+                    indegree[tutorial_id] += 1
+
+        ready = [(self.tutorial_keys[t], t) for t, degree in indegree.items() if degree == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            _, tutorial_id = heapq.heappop(ready)
+            order.append(tutorial_id)
+            for dependent_id in self.dependents.get(tutorial_id, ()):
+                if dependent_id in indegree:
+                    indegree[dependent_id] -= 1
+                    if indegree[dependent_id] == 0:
+                        heapq.heappush(ready, (self.tutorial_keys[dependent_id], dependent_id))
+
+        # Tutorials in a cycle never reach indegree 0; append them so they stay reachable
+        placed = set(order)
+        remaining = sorted((t for t in self.tutorial_keys if t not in placed),
+                           key=lambda t: (self.tutorial_keys[t], t))
+        self.cyclic |= set(remaining)
+        order.extend(remaining)
+
+        self.topological_order = order
+        self._positions = {tutorial_id: position for position, tutorial_id in enumerate(order)}
+
+        paths = defaultdict(list)
+        for tutorial_id in order:
+            paths[self.tutorial_difficulty[tutorial_id]].append(tutorial_id)
+        self._paths = dict(paths)
+
+    def learning_path(self, difficulty: str) -> List[str]:
+        """
+        Tutorial IDs of one difficulty, prerequisites first.
+
+        Args:
+            difficulty: The difficulty level
+
+        Returns:
+            list: Tutorial IDs in topological order
+        """
+        return list(self._paths.get(str(difficulty).lower(), ()))
+
+    def related_challenge_ids(self, tutorial_id: str) -> List[str]:
+        """
+        Challenges that declare a tutorial as related.
+
+        Args:
+            tutorial_id: The tutorial ID
+
+        Returns:
+            list: Challenge IDs (sorted)
+        """
+        return sorted(c for c in self.tutorial_challenges.get(tutorial_id, ()) if c in self.challenges)
+
+    def certification_tutorial_ids(self, cert_id: str) -> List[str]:
+        """
+        Tutorials linked to a certification, listed ones first.
+
+        Args:
+            cert_id: The certification ID
+
+        Returns:
+            list: Tutorial IDs of tutorials that exist in the graph
+        """
+        return [t for t in self.cert_order.get(cert_id, ()) if t in self.tutorial_keys]
+
+    def prerequisites_of(self, tutorial_id: str, transitive: bool = False) -> List[str]:
+        """
+        Tutorials that must be completed before a tutorial.
+
+        Args:
+            tutorial_id: The tutorial ID
+            transitive: Include prerequisites of prerequisites
+
+        Returns:
+            list: Tutorial IDs in topological order
+        """
+        found = set()
+        pending = [tutorial_id]
+        while pending:
+            for prerequisite_id in self.prerequisites.get(pending.pop(), ()):
+                if prerequisite_id in self.tutorial_keys and prerequisite_id not in found:
+                    found.add(prerequisite_id)
+                    if transitive:
+                        pending.append(prerequisite_id)
+        found.discard(tutorial_id)
+        return sorted(found, key=lambda t: self._positions.get(t, 0))
+
+    def missing_prerequisites(self, tutorial_id: str, completed: Iterable[str]) -> List[str]:
+        """
+        Direct prerequisites of a tutorial that are not completed yet.
+
+        Args:
+            tutorial_id: The tutorial ID
+            completed: IDs of completed tutorials
+
+        Returns:
+            list: Tutorial IDs still to complete
+        """
+        completed = set(completed)
+        return [t for t in self.prerequisites_of(tutorial_id) if t not in completed]
+
+    def position(self, tutorial_id: str) -> Optional[int]:
+        """
+        Position of a tutorial in the cached topological order.
+
+        Args:
+            tutorial_id: The tutorial ID
+
+        Returns:
+            int: The position, or None if the tutorial is unknown
+        """
+        return self._positions.get(tutorial_id)
@@ -0,0 +1,119 @@
+"""
+Secondary indexes and pre-sorted views over a content catalog.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Any
+
+
+# Display order of difficulty levels in menus
+DIFFICULTY_ORDER = {'beginner': 0, 'intermediate': 1, 'advanced': 2}
+
+
+def _normalize(value: Any) -> str:
+    """Lower-case a label for index lookups."""
+    return str(value).lower() if value is not None else ''
+
+
+def menu_sort_key(item: Dict[str, Any]):
+    """Sort key used by the tutorial and challenge menus: difficulty, then title."""
+    return (
+        DIFFICULTY_ORDER.get(_normalize(item.get('difficulty', 'beginner')), 0),
+        item.get('title') or ''
+    )
+
+
+def path_sort_key(tutorial: Dict[str, Any]):
+    """Sort key used for learning paths: tutorial level, then title."""
+    return (tutorial.get('level', 1), tutorial.get('title') or '')
+
+
+class ContentIndex:
+    """
+    Immutable set of lookup tables built from one catalog generation.
+
+    All lists are built once, so filter and menu queries cost O(result)
+    instead of a scan and sort of the whole catalog. The owning repository
+    rebuilds the index when it publishes a new generation.
+    """
+
+    def __init__(self, catalog: Dict[str, Dict], generation: int, graph=None):
+        """
+        Build the indexes.
+
+        Args:
+            catalog: The catalog to index
+            generation: Catalog generation the index was built from
+            graph: ContentGraph of the same catalog (built here if not given)
+        """
+        if graph is None:
+            from content.graph import ContentGraph
+            graph = ContentGraph.from_catalog(catalog)
+
+        self.generation = generation
+
+        tutorials = catalog['tutorials']
+        challenges = catalog['challenges']
+        certifications = catalog['certifications']
+
+        self.tutorials_by_difficulty: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.tutorials_by_topic: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.tutorials_by_level: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+        for tutorial in tutorials.values():
+            self.tutorials_by_difficulty[_normalize(tutorial.get('difficulty', ''))].append(tutorial)
+            self.tutorials_by_level[tutorial.get('level', 1)].append(tutorial)
+            for topic in set(_normalize(t) for t in tutorial.get('topics', []) or []):
+                self.tutorials_by_topic[topic].append(tutorial)
+
+        self.challenges_by_difficulty: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.challenges_by_topic: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for challenge in challenges.values():
+            self.challenges_by_difficulty[_normalize(challenge.get('difficulty', ''))].append(challenge)
+            for topic in set(_normalize(t) for t in challenge.get('topics', []) or []):
+                self.challenges_by_topic[topic].append(challenge)
+
+        self.tutorials_by_certification: Dict[str, List[Dict[str, Any]]] = {
+            cert_id: [tutorials[t] for t in graph.certification_tutorial_ids(cert_id)]
+            for cert_id in certifications
+        }
+
+        # Pre-sorted views for menus and learning paths
+        self.sorted_tutorials = sorted(tutorials.values(), key=menu_sort_key)
+        self.sorted_challenges = sorted(challenges.values(), key=menu_sort_key)
+        self.sorted_certifications = sorted(certifications.values(), key=lambda c: c.get('title') or '')
+
+        self.sorted_tutorials_by_difficulty = self._group_sorted(self.sorted_tutorials)
+        self.sorted_challenges_by_difficulty = self._group_sorted(self.sorted_challenges)
+        self.sorted_tutorials_by_certification = {
+            cert_id: sorted(items, key=menu_sort_key)
+            for cert_id, items in self.tutorials_by_certification.items()
+        }
+        # Learning paths follow the prerequisite order (level, then title, among equals)
+        self.path_by_difficulty = {
+            difficulty: [tutorials[t] for t in graph.learning_path(difficulty)]
+            for difficulty in self.tutorials_by_difficulty
+        }
+
+    @staticmethod
+    def _group_sorted(items: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Split an already sorted list by difficulty, preserving order."""
+        groups = defaultdict(list)
+        for item in items:
+            groups[_normalize(item.get('difficulty', ''))].append(item)
+        return groups
+
+    @staticmethod
+    def lookup(table: Dict[Any, List[Dict[str, Any]]], key: Any) -> List[Dict[str, Any]]:
+        """
+        Return a copy of one index bucket.
+
+        Args:
+            table: One of the index tables
+            key: Bucket key (strings are matched case-insensitively)
+
+        Returns:
+            list: The matching items (empty if none)
+        """
+        if isinstance(key, str):
+            key = key.lower()
+        return list(table.get(key, ()))
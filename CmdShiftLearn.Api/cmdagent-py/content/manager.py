@@ -11,15 +11,18 @@ from content.repository import ContentRepository
 class ContentManager:
     """Manage tutorials, challenges, and certification content."""
     
-    def __init__(self, content_repository: ContentRepository = None):
+    def __init__(self, content_repository: ContentRepository = None, load: bool = True):
         """
         Initialize the content manager.
         
         Args:
             content_repository: Repository for content storage
+            load: Load the content now (False for a repository that is already
+                  loaded, e.g. one preloaded before forking)
         """
         self.repository = content_repository or ContentRepository()
-        self.repository.load_all_content()
+        if load:
+            self.repository.load_all_content()
     
     def get_tutorial_list(self, difficulty: str = None, certification: str = None) -> List[Dict[str, Any]]:
         """
@@ -32,23 +35,8 @@ class ContentManager:
         Returns:
             list: List of tutorials
         """
-        if difficulty:
-            tutorials = self.repository.get_tutorials_by_difficulty(difficulty)
-        elif certification:
-            tutorials = self.repository.get_tutorials_by_certification(certification)
-        else:
-            tutorials = self.repository.get_all_tutorials()
-        
-        # Sort tutorials by difficulty and then by title
-        difficulty_order = {'beginner': 0, 'intermediate': 1, 'advanced': 2}
-        
-        return sorted(
-            tutorials,
-            key=lambda t: (
-                difficulty_order.get(t.get('difficulty', 'beginner').lower(), 0),
-                t.get('title', '')
-            )
-        )
+        # The repository returns these sorted by difficulty and then by title
+        return self.repository.get_sorted_tutorials(difficulty=difficulty, certification=certification)
     
     def get_challenge_list(self, difficulty: str = None) -> List[Dict[str, Any]]:
         """
@@ -60,22 +48,8 @@ class ContentManager:
         Returns:
             list: List of challenges
         """
-        challenges = self.repository.get_all_challenges()
-        
-        if difficulty:
-            challenges = [c for c in challenges 
-                         if c.get('difficulty', '').lower() == difficulty.lower()]
-        
-        # Sort challenges by difficulty and then by title
-        difficulty_order = {'beginner': 0, 'intermediate': 1, 'advanced': 2}
-        
-        return sorted(
-            challenges,
-            key=lambda c: (
-                difficulty_order.get(c.get('difficulty', 'beginner').lower(), 0),
-                c.get('title', '')
-            )
-        )
+        # The repository returns these sorted by difficulty and then by title
+        return self.repository.get_sorted_challenges(difficulty=difficulty)
     
     def get_certification_list(self) -> List[Dict[str, Any]]:
         """
@@ -84,10 +58,7 @@ class ContentManager:
         Returns:
             list: List of certifications
         """
-        return sorted(
-            self.repository.get_all_certifications(),
-            key=lambda c: c.get('title', '')
-        )
+        return self.repository.get_sorted_certifications()
     
     def get_tutorial(self, tutorial_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -136,57 +107,50 @@ class ContentManager:
         Returns:
             dict: The step data or None if not found
         """
-        tutorial = self.repository.get_tutorial(tutorial_id)
-        if not tutorial:
-            return None
-            
-        steps = tutorial.get('steps', [])
-        if not steps or step_index < 0 or step_index >= len(steps):
-            return None
-            
-        return steps[step_index]
+        return self.repository.get_tutorial_step(tutorial_id, step_index)
     
     def get_related_tutorials(self, tutorial_id: str) -> List[Dict[str, Any]]:
         """
         Get tutorials related to the specified tutorial.
         
+        Relevance is the share of common topics plus a bonus for the same
+        difficulty; the top 5 are precomputed from an inverted topic index.
+        
         Args:
             tutorial_id: The tutorial ID
             
         Returns:
             list: List of related tutorials
         """
-        tutorial = self.repository.get_tutorial(tutorial_id)
-        if not tutorial:
-            return []
-            
-        # Get tutorials with similar topics
-        topics = tutorial.get('topics', [])
-        difficulty = tutorial.get('difficulty', 'beginner')
+        return self.repository.get_related_tutorials(tutorial_id, limit=5)
+    
+    def get_similar_challenges(self, challenge_id: str) -> List[Dict[str, Any]]:
+        """
+        Get challenges that cover similar topics to the specified challenge.
         
-        # Find tutorials with similar topics
-        related = []
-        for other_id, other in self.repository.tutorials.items():
-            if other_id == tutorial_id:
-                continue
-                
-            # Check for overlapping topics
-            other_topics = other.get('topics', [])
-            common_topics = set(topics).intersection(set(other_topics))
+        Args:
+            challenge_id: The challenge ID
             
-            if common_topics:
-                # Calculate a relevance score
-                relevance = len(common_topics) / max(len(topics), len(other_topics))
-                
-                # Bonus for same difficulty level
-                if other.get('difficulty') == difficulty:
-                    relevance += 0.2
-                    
-                related.append((other, relevance))
+        Returns:
+            list: List of similar challenges
+        """
+        return self.repository.get_similar_challenges(challenge_id, limit=5)
+    
+    def search(self, query: str, limit: int = 10, filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Full-text search over tutorials and challenges.
         
-        # Sort by relevance and take the top 5
-        related.sort(key=lambda x: x[1], reverse=True)
-        return [item[0] for item in related[:5]]
+        Args:
+            query: Search terms
+            limit: Maximum number of results
+            filters: Optional filters: 'type' (tutorial/challenge), 'difficulty', 'topic'
+            
+        Returns:
+            list: Ranked results with type, id, title, difficulty and score
+        """
+        if not query or not query.strip():
+            return []
+        return self.repository.search(query, limit, filters)
     
     def get_tutorial_path(self, user_level: int = 1) -> List[Dict[str, Any]]:
         """
@@ -206,14 +170,8 @@ class ContentManager:
         else:
             difficulty = "advanced"
             
-        # Get tutorials of appropriate difficulty
-        tutorials = self.repository.get_tutorials_by_difficulty(difficulty)
-        
-        # Sort by tutorial level (if available) or default to alphabetical
-        return sorted(
-            tutorials,
-            key=lambda t: (t.get('level', 1), t.get('title', ''))
-        )
+        # Tutorials of appropriate difficulty, sorted by level and then title
+        return self.repository.get_tutorial_path(difficulty)
     
     def validate_tutorial_completion(self, tutorial_id: str, user_answers: List[str]) -> Tuple[bool, List[bool], int]:
         """
@@ -302,10 +260,11 @@ class ContentManager:
         if not tutorial:
             return False
             
-        # Update the tutorial data
+        # Update a copy; the cached tutorial is shared with concurrent readers
+        tutorial = tutorial.copy()
         tutorial.update(updated_data)
         
-        # Save the updated tutorial
+        # Save the updated tutorial (publishes a new catalog generation)
         return self.repository.save_tutorial(tutorial)
     
     def delete_tutorial(self, tutorial_id: str) -> bool:
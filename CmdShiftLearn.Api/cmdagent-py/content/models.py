@@ -0,0 +1,321 @@
+"""
+Typed, compact content models with a dict-compatible view.
+"""
+
+import sys
+from collections.abc import Mapping, MutableMapping
+from typing import Dict, List, Any, Optional, Tuple
+
+
+def _intern(value: Any) -> Any:
+    """Intern short label strings so repeated values share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_list(value: Any) -> Any:
+    """Intern every string in a list of labels (topics, IDs)."""
+    if isinstance(value, list):
+        return [_intern(item) for item in value]
+    return value
+
+
+class ContentItem(MutableMapping):
+    """
+    Base class for content models.
+
+    Known fields live in ``__slots__`` (no per-instance ``__dict__``); any
+    other keys from the source YAML/JSON go to a small ``extra`` dict that
+    is only created when needed. Alternative key spellings are folded into
+    one field when the item is built (see ALIASES), and the same aliases
+    keep working on lookup, so ``item.get('expectedCommand')`` and
+    ``item.command`` read the same value.
+
+    The mapping view lists the fields that are set (not None) followed by
+    the extra keys, so existing code written against plain dicts keeps
+    working. The source spelling of aliased keys is remembered, so
+    to_dict() writes a file back with the keys it was read with.
+    """
+
+    __slots__ = ('extra', 'source_keys')
+
+    # Field names, in the order they appear in the dict view
+    FIELDS: Tuple[str, ...] = ()
+    # Alternative source key -> field name
+    ALIASES: Dict[str, str] = {}
+    # Fields whose string values are interned
+    LABELS: Tuple[str, ...] = ('id', 'type', 'difficulty', 'validation_type')
+    # Fields holding lists of labels whose strings are interned
+    LABEL_LISTS: Tuple[str, ...] = ('topics',)
+
+    def __init__(self, **fields):
+        """
+        Initialize an item from canonical field values.
+
+        Args:
+            **fields: Field values (unknown names go to ``extra``)
+        """
+        for name in self.FIELDS:
+            object.__setattr__(self, name, None)
+        self.extra = None
+        self.source_keys = None
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> 'ContentItem':
+        """
+        Build an item from a parsed YAML/JSON mapping.
+
+        Args:
+            data: The raw item (an existing instance is returned unchanged)
+
+        Returns:
+            ContentItem: The typed item
+        """
+        if isinstance(data, cls):
+            return data
+
+        item = cls.__new__(cls)
+        for name in cls.FIELDS:
+            object.__setattr__(item, name, None)
+        item.extra = None
+        item.source_keys = None
+
+        fields = cls.FIELDS
+        aliases = cls.ALIASES
+        for key, value in data.items():
+            name = aliases.get(key, key)
+            if name in fields and getattr(item, name) is None:
+                object.__setattr__(item, name, item._convert(name, value))
+                if name != key:
+                    # Field name -> key it was read from, only for aliased keys
+                    if item.source_keys is None:
+                        item.source_keys = {}
+                    item.source_keys[name] = _intern(key)
+            else:
+                if item.extra is None:
+                    item.extra = {}
+                item.extra[_intern(key)] = value
+        return item
+
+    def _convert(self, name: str, value: Any) -> Any:
+        """Normalize one field value while building the item."""
+        if name in self.LABELS:
+            return _intern(value)
+        if name in self.LABEL_LISTS:
+            return _intern_list(value)
+        return value
+
+    def _field(self, key: str) -> Optional[str]:
+        """Field name for a key or alias, or None if the key is not a field."""
+        name = self.ALIASES.get(key, key)
+        return name if name in self.FIELDS else None
+
+    def __getitem__(self, key: str) -> Any:
+        name = self._field(key)
+        if name is not None:
+            value = getattr(self, name)
+            if value is not None:
+                return value
+        elif self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        name = self._field(key)
+        if name is not None:
+            object.__setattr__(self, name, self._convert(name, value))
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key: str):
+        name = self._field(key)
+        if name is not None:
+            if getattr(self, name) is None:
+                raise KeyError(key)
+            object.__setattr__(self, name, None)
+        elif self.extra and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        name = self._field(key)
+        if name is not None:
+            return getattr(self, name) is not None
+        return bool(self.extra) and key in self.extra
+
+    def __iter__(self):
+        for name in self.FIELDS:
+            if getattr(self, name) is not None:
+                yield name
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        count = sum(1 for name in self.FIELDS if getattr(self, name) is not None)
+        return count + (len(self.extra) if self.extra else 0)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __getstate__(self):
+        # Keyed by field name, so adding or reordering FIELDS keeps old pickles readable
+        fields = {}
+        for name in self.FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                fields[name] = value
+        return fields, self.extra, self.source_keys
+
+    def __setstate__(self, state):
+        fields, extra, source_keys = state
+        for name in self.FIELDS:
+            object.__setattr__(self, name, None)
+        self.extra = extra
+        self.source_keys = source_keys
+        dropped = {name: value for name, value in fields.items() if name not in self.FIELDS}
+        for name, value in fields.items():
+            if name in self.FIELDS:
+                object.__setattr__(self, name, value)
+        if dropped:
+            # Fields that were removed from the model are kept as extra keys
+            self.extra = {**(extra or {}), **dropped}
+
+    def copy(self) -> 'ContentItem':
+        """
+        Shallow copy (field values are shared, the extra dict is not).
+
+        Returns:
+            ContentItem: The copy
+        """
+        item = type(self).__new__(type(self))
+        item.__setstate__(self.__getstate__())
+        if item.extra is not None:
+            item.extra = dict(item.extra)
+        if item.source_keys is not None:
+            item.source_keys = dict(item.source_keys)
+        return item
+
+    def to_dict(self, canonical: bool = False) -> Dict[str, Any]:
+        """
+        Convert to plain dicts and lists, e.g. for YAML or JSON output.
+
+        Args:
+            canonical: Use the canonical field names instead of the source keys
+
+        Returns:
+            dict: Fields under the key they were read with (canonical names for
+                  fields set in code), extras under their original keys
+        """
+        source_keys = {} if canonical else (self.source_keys or {})
+        return {source_keys.get(key, key): to_plain(value, canonical) for key, value in self.items()}
+
+
+def to_plain(value: Any, canonical: bool = False) -> Any:
+    """
+    Recursively convert content models inside a value to plain dicts.
+
+    Args:
+        value: Any YAML-like value
+        canonical: Use canonical field names instead of the source keys
+
+    Returns:
+        The value with every ContentItem replaced by a dict
+    """
+    if isinstance(value, ContentItem):
+        return value.to_dict(canonical)
+    if isinstance(value, list):
+        return [to_plain(item, canonical) for item in value]
+    return value
+
+
+class TutorialStep(ContentItem):
+    """One tutorial step. ``content`` holds the instructions, ``command`` the expected command."""
+
+    FIELDS = ('id', 'type', 'title', 'content', 'command', 'hint', 'validation_type',
+              'validation', 'xp_reward', 'ascii_art')
+    ALIASES = {
+        'instructions': 'content',
+        'expected_command': 'command',
+        'expectedCommand': 'command',
+        'validationType': 'validation_type',
+        'xpReward': 'xp_reward',
+        'xp': 'xp_reward',
+    }
+    __slots__ = FIELDS
+
+    @property
+    def instructions(self) -> Optional[str]:
+        """The step instructions (alias of content)."""
+        return self.content
+
+
+class Tutorial(ContentItem):
+    """A tutorial with typed steps."""
+
+    FIELDS = ('id', 'title', 'description', 'difficulty', 'level', 'xp_reward', 'topics',
+              'prerequisites', 'certification_mappings', 'steps')
+    ALIASES = {
+        'xpReward': 'xp_reward',
+    }
+    __slots__ = FIELDS
+
+    def _convert(self, name: str, value: Any) -> Any:
+        if name == 'steps' and isinstance(value, list):
+            return [TutorialStep.from_dict(step) if isinstance(step, Mapping) else step
+                    for step in value]
+        if name == 'prerequisites':
+            return _intern_list(value)
+        return super()._convert(name, value)
+
+
+class Challenge(ContentItem):
+    """A challenge."""
+
+    FIELDS = ('id', 'title', 'description', 'difficulty', 'xp_reward', 'topics', 'content',
+              'solution', 'validation_type', 'hint', 'related_tutorials', 'certification_mappings')
+    ALIASES = {
+        'xpReward': 'xp_reward',
+        'xp': 'xp_reward',
+        'validationType': 'validation_type',
+    }
+    LABEL_LISTS = ('topics', 'related_tutorials')
+    __slots__ = FIELDS
+
+
+class Certification(ContentItem):
+    """A certification and its exam domains."""
+
+    FIELDS = ('id', 'title', 'description', 'tutorials', 'domains')
+    LABEL_LISTS = ('tutorials',)
+    __slots__ = FIELDS
+
+
+# Model class for each content kind (skill trees stay plain dicts)
+CONTENT_MODELS = {
+    'tutorials': Tutorial,
+    'challenges': Challenge,
+    'certifications': Certification,
+}
+
+
+def build_item(kind: str, data: Any) -> Any:
+    """
+    Build the typed model for a parsed content item.
+
+    Args:
+        kind: Content kind (tutorials, challenges, ...)
+        data: The parsed item
+
+    Returns:
+        The typed item, or the data unchanged for kinds without a model
+    """
+    model = CONTENT_MODELS.get(kind)
+    if model is None or not isinstance(data, Mapping):
+        return data
+    return model.from_dict(data)
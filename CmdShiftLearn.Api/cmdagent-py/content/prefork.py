@@ -0,0 +1,141 @@
+"""
+Preload-then-fork hosting: one parent loads the content, session processes share it.
+"""
+
+import os
+import gc
+import sys
+import time
+from typing import Callable, Dict, Any, List
+
+# POSIX only; Windows has no fork()
+FORK_AVAILABLE = hasattr(os, 'fork')
+
+
+class PreforkHost:
+    """
+    Load content once and fork one session process per learner seat.
+
+    The parent loads the catalog and warms everything derived from it (the
+    graph, the indexes, the search index) before forking, so children
+    start with the content already in memory and never parse YAML. The
+    pages are shared copy-on-write between all sessions.
+
+    Python writes to an object whenever the garbage collector visits it,
+    which would copy the shared pages one by one. preload() therefore
+    runs with the collector disabled, collects once at the end and moves
+    every surviving object into the permanent generation (gc.freeze()),
+    so the collectors in the children never touch the catalog.
+
+    Where fork() is not available, run several sessions against a content
+    bundle instead: its pages are shared through the OS page cache.
+    """
+
+    def __init__(self, repository):
+        """
+        Initialize the host.
+
+        Args:
+            repository: Content repository to share (ContentRepository or SqlContentRepository)
+        """
+        self.repository = repository
+        self.children: Dict[int, Any] = {}
+        self.preload_ms = 0.0
+
+    def preload(self):
+        """Load and warm the content, then freeze it for sharing."""
+        start = time.perf_counter()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self.repository.load_all_content()
+            self.warm()
+        finally:
+            gc.collect()
+            gc.freeze()
+            if gc_was_enabled:
+                gc.enable()
+        self.preload_ms = (time.perf_counter() - start) * 1000
+
+    def warm(self):
+        """Build the lazily derived structures so children do not each build their own copy."""
+        repository = self.repository
+        if hasattr(repository, 'warm'):
+            repository.warm()
+        if hasattr(repository, 'stop_watching'):
+            # The watcher thread would not survive the fork
+            repository.stop_watching()
+
+    def spawn(self, session: Callable[..., Any], *args) -> int:
+        """
+        Fork a session process.
+
+        The child calls ``session(repository, *args)`` and exits with its
+        return value (0 for None) without running the parent's exit
+        handlers.
+
+        Args:
+            session: Function run in the child
+            *args: Extra arguments for the session function
+
+        Returns:
+            int: The child's process ID
+
+        Raises:
+            RuntimeError: If the platform cannot fork
+        """
+        if not FORK_AVAILABLE:
+            raise RuntimeError("Preload-then-fork needs os.fork(); use the 'bundle' content backend instead")
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid:
+            self.children[pid] = args
+            return pid
+
+        code = 1
+        try:
+            if hasattr(self.repository, 'after_fork'):
+                self.repository.after_fork()
+            result = session(self.repository, *args)
+            code = result if isinstance(result, int) else 0
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 0
+        except BaseException as e:
+            print(f"Session {args} failed: {e}")
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+
+    def wait(self) -> Dict[int, int]:
+        """
+        Wait for every session process to exit.
+
+        Returns:
+            dict: Process ID -> exit status
+        """
+        statuses = {}
+        while self.children:
+            pid, status = os.wait()
+            if pid in self.children:
+                del self.children[pid]
+                statuses[pid] = os.waitstatus_to_exitcode(status)
+        return statuses
+
+    def run(self, session: Callable[..., Any], seats: List[Any]) -> Dict[int, int]:
+        """
+        Preload, fork one session per seat and wait for all of them.
+
+        Args:
+            session: Function run in each child as session(repository, seat)
+            seats: One entry per session (e.g. terminal device paths)
+
+        Returns:
+            dict: Process ID -> exit status
+        """
+        self.preload()
+        for seat in seats:
+            self.spawn(session, seat)
+        return self.wait()
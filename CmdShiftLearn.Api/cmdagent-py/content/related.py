@@ -0,0 +1,143 @@
+"""
+Topic-based "related content" index with precomputed top-K lists.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Dict, List, Any, Set, Tuple, FrozenSet
+
+
+# Number of related items kept per content item
+DEFAULT_TOP_K = 5
+
+# Bonus added to the relevance score when two items share a difficulty
+SAME_DIFFICULTY_BONUS = 0.2
+
+
+def _signature(item: Dict[str, Any]) -> Tuple[FrozenSet[str], str]:
+    """The fields that affect relatedness: normalized topics and difficulty."""
+    topics = frozenset(str(t).lower() for t in item.get('topics', []) or [])
+    difficulty = str(item.get('difficulty') or '').lower()
+    return topics, difficulty
+
+
+class RelatedIndex:
+    """
+    Inverted topic index for one kind of content (tutorials or challenges).
+
+    Only items that share at least one topic are ever scored, and the top-K
+    related IDs of every item are kept precomputed. refresh() diffs the
+    catalog against what was indexed last time and only rescores items
+    whose neighbourhood could have changed.
+    """
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K):
+        """
+        Initialize an empty index.
+
+        Args:
+            top_k: How many related items to keep per item
+        """
+        self.top_k = top_k
+        self.topic_to_ids: Dict[str, Set[str]] = defaultdict(set)
+        self.signatures: Dict[str, Tuple[FrozenSet[str], str]] = {}
+        self.related: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def copy(self) -> 'RelatedIndex':
+        """
+        Independent copy to refresh for a newer catalog.
+
+        Returns:
+            RelatedIndex: An index with the same contents
+        """
+        with self._lock:
+            index = RelatedIndex(self.top_k)
+            index.topic_to_ids.update((topic, set(ids)) for topic, ids in self.topic_to_ids.items())
+            index.signatures = dict(self.signatures)
+            # refresh() replaces related lists instead of changing them, so they can be shared
+            index.related = dict(self.related)
+        return index
+
+    def _score(self, item_id: str, other_id: str) -> float:
+        """
+        Relevance of other_id to item_id: shared-topic ratio plus a same-difficulty bonus.
+        """
+        topics, difficulty = self.signatures[item_id]
+        other_topics, other_difficulty = self.signatures[other_id]
+        relevance = len(topics & other_topics) / max(len(topics), len(other_topics))
+        if difficulty == other_difficulty:
+            relevance += SAME_DIFFICULTY_BONUS
+        return relevance
+
+    def _rank(self, item_id: str) -> List[str]:
+        """Compute the top-K related IDs for one item from its topic postings."""
+        candidates = set()
+        for topic in self.signatures[item_id][0]:
+            candidates |= self.topic_to_ids[topic]
+        candidates.discard(item_id)
+
+        scored = sorted(((-self._score(item_id, other), other) for other in candidates))
+        return [other for _, other in scored[:self.top_k]]
+
+    def refresh(self, items: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Bring the index up to date with a content map.
+
+        Args:
+            items: Content items keyed by ID
+
+        Returns:
+            int: Number of items whose related list was recomputed
+        """
+        with self._lock:
+            changed = {item_id for item_id in self.signatures if item_id not in items}
+            current = {}
+            for item_id, item in items.items():
+                signature = _signature(item)
+                current[item_id] = signature
+                if self.signatures.get(item_id) != signature:
+                    changed.add(item_id)
+
+            if not changed:
+                return 0
+
+            # Items sharing a topic with the old or new version of a changed item may re-rank
+            affected = set()
+            for item_id in changed:
+                old_topics = self.signatures[item_id][0] if item_id in self.signatures else frozenset()
+                new_topics = current[item_id][0] if item_id in current else frozenset()
+                for topic in old_topics:
+                    affected |= self.topic_to_ids[topic]
+                    self.topic_to_ids[topic].discard(item_id)
+                    if not self.topic_to_ids[topic]:
+                        del self.topic_to_ids[topic]
+                for topic in new_topics:
+                    self.topic_to_ids[topic].add(item_id)
+                    affected |= self.topic_to_ids[topic]
+
+            for item_id in changed - set(current):
+                self.signatures.pop(item_id, None)
+                self.related.pop(item_id, None)
+            for item_id in changed & set(current):
+                self.signatures[item_id] = current[item_id]
+
+            affected = (affected | changed) & set(current)
+            for item_id in affected:
+                self.related[item_id] = self._rank(item_id)
+
+            return len(affected)
+
+    def get_related_ids(self, item_id: str, limit: int = None) -> List[str]:
+        """
+        Return the precomputed related IDs for an item.
+
+        Args:
+            item_id: The item ID
+            limit: Optional cap (at most top_k)
+
+        Returns:
+            list: Related IDs, most relevant first
+        """
+        related = self.related.get(item_id, [])
+        return related[:limit] if limit is not None else list(related)
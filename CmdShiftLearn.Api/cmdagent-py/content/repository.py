@@ -3,162 +3,822 @@ Repository for managing tutorial and challenge content.
 """
 
 import os
-import yaml
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
 
 from utils.config import DATA_DIR
+from content.cache import ContentCache, DEFAULT_CACHE_PATH, read_content_file
+from content.watcher import ContentWatcher, CONTENT_EXTENSIONS
+from content.index import ContentIndex
+from content.graph import ContentGraph
+from content.snapshot import CatalogSnapshot, RELATED_KINDS
+from content.search import SearchIndex
+from content.bundle import ContentBundle
+from content.models import Tutorial, build_item, to_plain
+from content.strings import StringPool
+from content.writer import WriteBehindQueue, atomic_write_yaml
+
+
+def _parse_worker(file_path: str) -> Tuple[Any, Optional[tuple], Optional[str]]:
+    """
+    Parse one content file, reporting errors as values.
+    
+    Runs in worker processes during parallel ingestion, so failures are
+    returned as strings instead of raised (not every YAML error pickles).
+    
+    Args:
+        file_path: Path of the YAML file
+        
+    Returns:
+        tuple: (data, (mtime_ns, size, digest), error)
+    """
+    try:
+        data, mtime_ns, size, digest = read_content_file(file_path)
+        return data, (mtime_ns, size, digest), None
+    except Exception as e:
+        return None, None, str(e)
+
+
+# Layout of the content tree: directory name -> how many levels of
+# subdirectories its files may sit in (None for any depth)
+CONTENT_LAYOUT = {
+    'tutorials': None,
+    'challenges': None,
+    'certifications': 0,
+    'skill_trees': 0,
+}
+
+
+def iter_content_files(directory, max_depth: Optional[int] = None) -> Iterator[Path]:
+    """
+    Walk a directory tree and yield its content files as they are found.
+    
+    Uses os.scandir, so only one directory listing is held at a time and
+    the stat information comes from the directory entries. Entries are
+    visited in name order within each directory; hidden files and
+    directories are skipped and symlinked directories are not followed.
+    
+    Args:
+        directory: Root of the tree
+        max_depth: Levels of subdirectories to descend into (None for no limit)
+        
+    Yields:
+        Path: Each .yaml/.yml file
+    """
+    pending = [(os.fspath(directory), 0)]
+    while pending:
+        path, depth = pending.pop()
+        try:
+            with os.scandir(path) as entries:
+                entries = sorted(entries, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        
+        subdirectories = []
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if max_depth is None or depth < max_depth:
+                        subdirectories.append((entry.path, depth + 1))
+                elif entry.name.endswith(CONTENT_EXTENSIONS) and entry.is_file():
+                    yield Path(entry.path)
+            except OSError:
+                continue
+        # Depth-first, keeping name order
+        pending.extend(reversed(subdirectories))
+
+# Singular labels used in load messages
+CONTENT_LABELS = {
+    'tutorials': 'tutorial',
+    'challenges': 'challenge',
+    'certifications': 'certification',
+    'skill_trees': 'skill tree',
+}
 
 
 class ContentRepository:
-    """Repository for loading and managing tutorial and challenge content."""
+    """
+    Repository for loading and managing tutorial and challenge content.
+    
+    Content is published as immutable generations (CatalogSnapshot).
+    Writers (loads, hot reloads, saves, deletes) serialize on a lock, build
+    a new catalog from a shallow copy of the current one and publish it by
+    swapping one reference. Readers never lock: every query reads the
+    current snapshot once, and callers that need several queries to agree
+    can hold on to snapshot() themselves. Published items are shared
+    between generations and must not be modified in place.
+    """
     
-    def __init__(self, content_dir: str = None):
+    def __init__(self, content_dir: str = None, use_cache: bool = True, cache_path: str = None,
+                 workers: int = 1, lazy: bool = False, max_resident: int = 32, verbose: bool = True,
+                 bundle_path: str = None, write_delay: float = 0):
         """
         Initialize the content repository.
         
         Args:
             content_dir: Directory containing content files (defaults to data/content)
+            use_cache: Whether to use the compiled content snapshot to skip YAML parsing
+            cache_path: Path of the snapshot file (defaults to data/cache/content_snapshot.bin;
+                        lazy repositories keep a header-only snapshot next to it)
+            workers: Number of processes used to parse YAML files (1 parses in-process,
+                     0 uses one worker per CPU core)
+            lazy: Keep only tutorial headers in memory and load step bodies on demand
+            max_resident: In lazy mode, how many full tutorials to keep loaded (LRU)
+            verbose: Print a line per loaded item and a load summary (errors are always printed)
+            bundle_path: Load content from a prebuilt bundle file instead of the YAML tree
+                         (implies lazy; tutorial steps are read from the bundle on demand)
+            write_delay: Queue saved tutorials and write them from a background thread
+                         at most this many seconds later, coalescing repeated edits
+                         (0 writes each save immediately)
         """
         self.content_dir = Path(content_dir) if content_dir else Path(DATA_DIR) / "content"
-        self.tutorials = {}
-        self.challenges = {}
-        self.certifications = {}
-        self.skill_trees = {}
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self._executor = None
+        self.bundle_path = Path(bundle_path) if bundle_path else None
+        self._bundle = None
+        self.lazy = lazy or self.bundle_path is not None
+        self.cache = None
+        if use_cache:
+            cache_path = Path(cache_path) if cache_path else DEFAULT_CACHE_PATH
+            if self.lazy:
+                # Tutorials are cached without their steps, so the two layouts must not mix
+                cache_path = cache_path.with_name(f"{cache_path.stem}.headers{cache_path.suffix}")
+            self.cache = ContentCache(cache_path)
+        self.max_resident = max(1, max_resident)
+        self.verbose = verbose
+        # tutorial ID -> (header it was built from, full tutorial)
+        self._resident: "OrderedDict[str, Tuple[Any, Dict[str, Any]]]" = OrderedDict()
+        self._snapshot = CatalogSnapshot(self._new_catalog(), 0)
+        self._write_lock = threading.RLock()
+        self._writer = WriteBehindQueue(write_delay) if write_delay > 0 else None
+        self._watcher = None
+        self._search_index = None
+        self._search_generation = -1
+        self.load_stats = {}
+        # (file path, message) for files skipped by the last full load
+        self.load_errors: List[Tuple[Path, str]] = []
+        self.strings = StringPool()
+    
+    @staticmethod
+    def _new_catalog() -> Dict[str, Dict]:
+        """
+        Create an empty catalog.
+        
+        The catalog holds every content map plus the file index
+        ('files': path -> (kind, id), 'paths': (kind, id) -> path). It is
+        published as a whole in a CatalogSnapshot, so swapping the single
+        reference publishes a consistent view.
+        
+        Returns:
+            dict: Empty catalog
+        """
+        catalog = {kind: {} for kind in CONTENT_LAYOUT}
+        catalog['files'] = {}
+        catalog['paths'] = {}
+        return catalog
+    
+    def snapshot(self) -> CatalogSnapshot:
+        """
+        The currently published generation.
+        
+        Returns:
+            CatalogSnapshot: A read-only view that stays consistent while held
+        """
+        return self._snapshot
+    
+    @property
+    def generation(self) -> int:
+        """Generation number of the published catalog."""
+        return self._snapshot.generation
+    
+    @property
+    def catalog(self) -> Dict[str, Dict]:
+        """The currently published catalog, read-only (grab once for a consistent view)."""
+        return self._snapshot.catalog
+    
+    @property
+    def tutorials(self) -> Dict[str, Dict[str, Any]]:
+        """Tutorials in the published catalog, keyed by ID."""
+        return self._snapshot.tutorials
+    
+    @property
+    def challenges(self) -> Dict[str, Dict[str, Any]]:
+        """Challenges in the published catalog, keyed by ID."""
+        return self._snapshot.challenges
+    
+    @property
+    def certifications(self) -> Dict[str, Dict[str, Any]]:
+        """Certifications in the published catalog, keyed by ID."""
+        return self._snapshot.certifications
+    
+    @property
+    def skill_trees(self) -> Dict[str, Dict[str, Any]]:
+        """Skill trees in the published catalog, keyed by ID."""
+        return self._snapshot.skill_trees
+    
+    def _publish(self, catalog: Dict[str, Dict]):
+        """
+        Make a fully built catalog visible to readers.
+        
+        Must be called with the write lock held; the catalog must not be
+        modified afterwards.
+        
+        Args:
+            catalog: The new catalog
+        """
+        self._snapshot = CatalogSnapshot(catalog, self._snapshot.generation + 1, self._snapshot)
+    
+    @property
+    def graph(self) -> ContentGraph:
+        """Relationship graph for the current catalog, rebuilt only after content changes."""
+        return self._snapshot.graph
+    
+    @property
+    def index(self) -> ContentIndex:
+        """Secondary indexes for the current catalog, rebuilt only after content changes."""
+        return self._snapshot.index
     
     def load_all_content(self):
         """Load all content from the content directory."""
-        self._load_tutorials()
-        self._load_challenges()
-        self._load_certifications()
-        self._load_skill_trees()
+        start = time.perf_counter()
+        if self.cache:
+            self.cache.reset_stats()
+        
+        catalog = self._new_catalog()
         
-        # Build relationships between content items
-        self._build_content_relationships()
+        with self._write_lock:
+            # Start a fresh pool so text from previous loads is released
+            self.strings = StringPool()
+            if self.bundle_path:
+                self._load_bundle(catalog)
+            else:
+                self._load_content_files(catalog)
+            
+            if self.cache and not self.bundle_path:
+                self.cache.save()
+            
+            self._resident.clear()
+            self._publish(catalog)
+        
+        self._report_load_stats(start)
     
-    def _load_tutorials(self):
-        """Load tutorials from YAML files."""
-        tutorial_dir = self.content_dir / "tutorials"
-        if not tutorial_dir.exists():
-            os.makedirs(tutorial_dir, exist_ok=True)
-            return
+    def _load_bundle(self, catalog: Dict[str, Dict]):
+        """
+        Fill a catalog from the content bundle.
         
-        # Load YAML files from tutorial_dir and all subdirectories
-        # Use set() to prevent duplicate loading
-        yaml_files = set()
-        yaml_files.update(tutorial_dir.glob("*.yaml"))
-        yaml_files.update(tutorial_dir.glob("*/*.yaml"))
+        Tutorials get their headers from the bundle manifest; their steps
+        stay in the mapped file until a tutorial is opened.
         
-        for file_path in yaml_files:
-            try:
-                with open(file_path, 'r') as file:
-                    tutorial_data = yaml.safe_load(file)
-                    if tutorial_data and 'id' in tutorial_data:
-                        self.tutorials[tutorial_data['id']] = tutorial_data
-                        print(f"Loaded tutorial: {tutorial_data.get('title', 'Unknown')} ({file_path})")
-            except Exception as e:
-                print(f"Error loading tutorial from {file_path}: {e}")
+        Args:
+            catalog: Catalog being built
+        """
+        bundle = ContentBundle(self.bundle_path)
+        for tutorial_id, header in bundle.headers().items():
+            catalog['tutorials'][tutorial_id] = self.strings.pool_item(build_item('tutorials', header))
+        for kind in ('challenges', 'certifications', 'skill_trees'):
+            for item_id, item in bundle.iter_items(kind):
+                catalog[kind][item_id] = self.strings.pool_item(build_item(kind, item))
+        self._bundle = bundle
     
-    def _load_challenges(self):
-        """Load challenges from YAML files."""
-        challenge_dir = self.content_dir / "challenges"
-        if not challenge_dir.exists():
-            os.makedirs(challenge_dir, exist_ok=True)
-            return
+    def read_catalog(self) -> Dict[str, Dict]:
+        """
+        Parse the content tree into a fresh catalog without publishing it.
+        
+        Relationship links are not built, so the items are exactly what the
+        YAML files contain. Used by importers and build tools; files that
+        could not be loaded are listed in load_errors afterwards.
+        
+        Returns:
+            dict: The parsed catalog
+        """
+        if self.lazy:
+            # The header-only cache of a lazy repository cannot provide full tutorials
+            reader = ContentRepository(self.content_dir, use_cache=False, workers=self.workers,
+                                       verbose=self.verbose)
+            catalog = reader.read_catalog()
+            self.load_errors = reader.load_errors
+            return catalog
+        
+        catalog = self._new_catalog()
+        with self._write_lock:
+            self._load_content_files(catalog)
+            if self.cache:
+                self.cache.save()
+        return catalog
+    
+    def _load_content_files(self, catalog: Dict[str, Dict]):
+        """
+        Load every content type from disk, in parallel when workers > 1.
+        
+        Args:
+            catalog: Catalog being built
+        """
+        self.load_errors = []
+        if self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                self._executor = executor
+                try:
+                    self._load_kinds(catalog)
+                finally:
+                    self._executor = None
+        else:
+            self._load_kinds(catalog)
+    
+    def _load_kinds(self, catalog: Dict[str, Dict]):
+        """Load each content type in turn."""
+        self._load_tutorials(catalog)
+        self._load_challenges(catalog)
+        self._load_certifications(catalog)
+        self._load_skill_trees(catalog)
+    
+    def _parse_files(self, file_paths: Iterable[Path]) -> Iterator[Tuple[Path, Any, Optional[str]]]:
+        """
+        Parse a batch of content files.
+        
+        Files are served from the snapshot cache where possible; the rest are
+        parsed in-process or fanned out over the worker pool. Results are
+        always yielded in sorted path order so the merged catalog does not
+        depend on scheduling.
+        
+        Args:
+            file_paths: Paths of the YAML files to parse
             
-        # Load YAML files from challenge_dir and all subdirectories
-        # Use set() to prevent duplicate loading
-        yaml_files = set()
-        yaml_files.update(challenge_dir.glob("*.yaml"))
-        yaml_files.update(challenge_dir.glob("*/*.yaml"))
+        Yields:
+            tuple: (file_path, data, error) where error is None on success
+        """
+        file_paths = sorted(set(file_paths))
+        results = {}
+        pending = []
         
-        for file_path in yaml_files:
-            try:
-                with open(file_path, 'r') as file:
-                    challenge_data = yaml.safe_load(file)
-                    if challenge_data and 'id' in challenge_data:
-                        self.challenges[challenge_data['id']] = challenge_data
-                        print(f"Loaded challenge: {challenge_data.get('title', 'Unknown')} ({file_path})")
-            except Exception as e:
-                print(f"Error loading challenge from {file_path}: {e}")
+        for file_path in file_paths:
+            if self.cache:
+                try:
+                    hit, data = self.cache.lookup(file_path)
+                except OSError as e:
+                    results[file_path] = (None, None, str(e))
+                    continue
+                if hit:
+                    results[file_path] = (data, None, None)
+                    continue
+            pending.append(file_path)
+        
+        if self._executor and len(pending) > 1:
+            chunksize = max(1, len(pending) // (self.workers * 4))
+            parsed = self._executor.map(_parse_worker, [str(p) for p in pending], chunksize=chunksize)
+        else:
+            parsed = (_parse_worker(str(p)) for p in pending)
+        
+        for file_path, (data, meta, error) in zip(pending, parsed):
+            if self.cache and meta:
+                self.cache.store(file_path, self._cache_form(file_path, data), *meta)
+            results[file_path] = (data, meta, error)
+        
+        for file_path in file_paths:
+            data, _, error = results[file_path]
+            yield file_path, data, error
     
-    def _load_certifications(self):
-        """Load certification mappings from YAML files."""
-        cert_dir = self.content_dir / "certifications"
-        if not cert_dir.exists():
-            os.makedirs(cert_dir, exist_ok=True)
-            return
+    def _cache_form(self, file_path: Path, data: Any) -> Any:
+        """
+        What the snapshot cache keeps for a parsed file.
+        
+        Lazy repositories cache tutorials without their steps (plus a
+        step_count), so neither the cache nor the snapshot file holds the
+        bodies; they are read from the YAML file when a tutorial is opened.
+        
+        Args:
+            file_path: Path of the parsed file
+            data: The parsed YAML data
             
-        for file_path in cert_dir.glob("*.yaml"):
-            try:
-                with open(file_path, 'r') as file:
-                    cert_data = yaml.safe_load(file)
-                    if cert_data and 'id' in cert_data:
-                        self.certifications[cert_data['id']] = cert_data
-            except Exception as e:
-                print(f"Error loading certification from {file_path}: {e}")
+        Returns:
+            The data to store
+        """
+        if (self.lazy and isinstance(data, Mapping) and 'steps' in data
+                and self._classify_file(file_path) == 'tutorials'):
+            header = {key: value for key, value in data.items() if key != 'steps'}
+            header['step_count'] = len(data.get('steps') or [])
+            return header
+        return data
     
-    def _load_skill_trees(self):
+    def _report_load_stats(self, start: float):
+        """
+        Record and print how the last load went.
+        
+        Args:
+            start: perf_counter() value taken when the load started
+        """
+        self.load_stats = {
+            'tutorials': len(self.tutorials),
+            'challenges': len(self.challenges),
+            'certifications': len(self.certifications),
+            'skill_trees': len(self.skill_trees),
+            'cache_hits': self.cache.hits if self.cache else 0,
+            'cache_misses': self.cache.misses if self.cache else 0,
+            'elapsed_ms': (time.perf_counter() - start) * 1000,
+        }
+        
+        stats = self.load_stats
+        if self._bundle:
+            cache_info = f"bundle: {self._bundle.path}"
+        elif self.cache:
+            cache_info = f"cache: {stats['cache_hits']} hits, {stats['cache_misses']} misses"
+        else:
+            cache_info = "cache disabled"
+        if self.verbose:
+            print(f"Content loaded: {stats['tutorials']} tutorials, {stats['challenges']} challenges, "
+                  f"{stats['certifications']} certifications ({cache_info}) in {stats['elapsed_ms']:.1f} ms")
+    
+    def _discover_files(self, kind: str) -> List[Path]:
+        """
+        List the content files of one kind.
+        
+        Args:
+            kind: Content directory name (tutorials, challenges, ...)
+            
+        Returns:
+            list: Paths of the YAML files for that kind, sorted
+        """
+        kind_dir = self.content_dir / kind
+        if not kind_dir.exists():
+            os.makedirs(kind_dir, exist_ok=True)
+            return []
+        
+        return sorted(iter_content_files(kind_dir, CONTENT_LAYOUT[kind]))
+    
+    def _classify_file(self, file_path: Path) -> Optional[str]:
+        """
+        Work out which kind of content a file holds from its location.
+        
+        Args:
+            file_path: Path of a file somewhere under the content directory
+            
+        Returns:
+            str: The content kind, or None if the file is not a content file
+        """
+        try:
+            relative = Path(file_path).relative_to(self.content_dir)
+        except ValueError:
+            return None
+        
+        kind = relative.parts[0] if relative.parts else None
+        if kind not in CONTENT_LAYOUT or relative.suffix not in CONTENT_EXTENSIONS:
+            return None
+        if any(part.startswith('.') for part in relative.parts):
+            return None
+        
+        # parts = kind directory, subdirectories..., file name
+        max_depth = CONTENT_LAYOUT[kind]
+        return kind if max_depth is None or len(relative.parts) - 2 <= max_depth else None
+    
+    def _add_item(self, catalog: Dict[str, Dict], kind: str, file_path: Path,
+                  data: Any, error: Optional[str]) -> Optional[str]:
+        """
+        Add one parsed content file to a catalog.
+        
+        Args:
+            catalog: Catalog being built
+            kind: Content kind of the file
+            file_path: Path the data came from
+            data: Parsed YAML data
+            error: Parse error message, if parsing failed
+            
+        Returns:
+            str: The item ID, or None if the file did not hold a valid item
+        """
+        label = CONTENT_LABELS[kind]
+        if error:
+            print(f"Error loading {label} from {file_path}: {error}")
+            self.load_errors.append((file_path, error))
+            return None
+        if not data or not isinstance(data, Mapping) or 'id' not in data:
+            self.load_errors.append((file_path, f"not a {label}: no 'id' field"))
+            return None
+        
+        data = self.strings.pool_item(build_item(kind, data))
+        item_id = data['id']
+        if kind == 'tutorials' and self.lazy:
+            data = self._make_header(data)
+        
+        catalog[kind][item_id] = data
+        catalog['files'][file_path] = (kind, item_id)
+        catalog['paths'][(kind, item_id)] = file_path
+        
+        if self.verbose and kind in ('tutorials', 'challenges'):
+            print(f"Loaded {label}: {data.get('title', 'Unknown')} ({file_path})")
+        return item_id
+    
+    def iter_items(self, kind: str, with_paths: bool = False) -> Iterator[Any]:
+        """
+        Stream the items of one kind straight from the content tree.
+        
+        Files are parsed one at a time as the tree is walked and each item
+        is yielded as soon as it is read, so memory use does not grow with
+        the size of the tree. Nothing is cached, pooled or published;
+        invalid files are reported and skipped.
+        
+        Args:
+            kind: Content kind (tutorials, challenges, ...)
+            with_paths: Yield (file_path, item) tuples instead of items
+            
+        Yields:
+            The typed items (or (file_path, item) tuples)
+        """
+        for file_path in iter_content_files(self.content_dir / kind, CONTENT_LAYOUT[kind]):
+            data, _, error = _parse_worker(str(file_path))
+            if error:
+                print(f"Error loading {CONTENT_LABELS[kind]} from {file_path}: {error}")
+                continue
+            if not data or not isinstance(data, Mapping) or 'id' not in data:
+                continue
+            item = build_item(kind, data)
+            yield (file_path, item) if with_paths else item
+    
+    def iter_tutorials(self, with_paths: bool = False) -> Iterator[Any]:
+        """
+        Stream tutorials from the content tree, any depth, .yaml or .yml.
+        
+        Args:
+            with_paths: Yield (file_path, tutorial) tuples instead of tutorials
+            
+        Yields:
+            Tutorial: Each tutorial with its steps, in tree order
+        """
+        return self.iter_items('tutorials', with_paths)
+    
+    def iter_challenges(self, with_paths: bool = False) -> Iterator[Any]:
+        """
+        Stream challenges from the content tree, any depth, .yaml or .yml.
+        
+        Args:
+            with_paths: Yield (file_path, challenge) tuples instead of challenges
+            
+        Yields:
+            Challenge: Each challenge, in tree order
+        """
+        return self.iter_items('challenges', with_paths)
+    
+    def _load_tutorials(self, catalog: Dict[str, Dict]):
+        """Load tutorials from YAML files."""
+        # Load YAML files from the tutorials directory and its subdirectories
+        for file_path, data, error in self._parse_files(self._discover_files('tutorials')):
+            self._add_item(catalog, 'tutorials', file_path, data, error)
+    
+    def _load_challenges(self, catalog: Dict[str, Dict]):
+        """Load challenges from YAML files."""
+        # Load YAML files from the challenges directory and its subdirectories
+        for file_path, data, error in self._parse_files(self._discover_files('challenges')):
+            self._add_item(catalog, 'challenges', file_path, data, error)
+    
+    def _load_certifications(self, catalog: Dict[str, Dict]):
+        """Load certification mappings from YAML files."""
+        for file_path, data, error in self._parse_files(self._discover_files('certifications')):
+            self._add_item(catalog, 'certifications', file_path, data, error)
+    
+    def _load_skill_trees(self, catalog: Dict[str, Dict]):
         """Load skill trees from YAML files."""
-        skill_tree_dir = self.content_dir / "skill_trees"
-        if not skill_tree_dir.exists():
-            os.makedirs(skill_tree_dir, exist_ok=True)
+        for file_path, data, error in self._parse_files(self._discover_files('skill_trees')):
+            self._add_item(catalog, 'skill_trees', file_path, data, error)
+    
+    def apply_changes(self, changed_paths: Iterable[Path]) -> Dict[str, int]:
+        """
+        Incrementally reload a set of added, modified or deleted content files.
+        
+        A new catalog is built from a shallow copy of the current one, only
+        the given files are re-parsed, and the result is published in a
+        single swap. Relationships live in the content graph, which is
+        rebuilt for the new generation on first use.
+        
+        Args:
+            changed_paths: Paths of files that were added, modified or deleted
+            
+        Returns:
+            dict: Counts of 'updated' and 'removed' items
+        """
+        start = time.perf_counter()
+        
+        with self._write_lock:
+            old = self._snapshot
+            catalog = old.thaw()
+            touched = {kind: set() for kind in CONTENT_LAYOUT}
+            to_parse = {}
+            
+            for file_path in sorted({Path(p) for p in changed_paths}):
+                # Drop whatever the file used to define
+                previous = catalog['files'].pop(file_path, None)
+                if previous:
+                    kind, item_id = previous
+                    if catalog['paths'].get(previous) == file_path:
+                        del catalog['paths'][previous]
+                        catalog[kind].pop(item_id, None)
+                        touched[kind].add(item_id)
+                
+                kind = self._classify_file(file_path)
+                if kind and file_path.is_file():
+                    to_parse[file_path] = kind
+            
+            for file_path, data, error in self._parse_files(to_parse):
+                kind = to_parse[file_path]
+                item_id = self._add_item(catalog, kind, file_path, data, error)
+                if item_id is not None:
+                    touched[kind].add(item_id)
+            
+            if self.cache:
+                self.cache.save()
+            
+            self._publish(catalog)
+            
+            # Full tutorials built from replaced headers are stale now
+            for tutorial_id in touched['tutorials']:
+                self._resident.pop(tutorial_id, None)
+        
+        updated = sum(1 for kind, ids in touched.items() for item_id in ids if item_id in catalog[kind])
+        removed = sum(len(ids) for ids in touched.values()) - updated
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if self.verbose:
+            print(f"Content reloaded: {updated} updated, {removed} removed in {elapsed_ms:.1f} ms")
+        return {'updated': updated, 'removed': removed}
+    
+    def watch(self, interval: float = 1.0):
+        """
+        Start watching the content directory and hot-reload changed files.
+        
+        Args:
+            interval: Polling interval in seconds for the fallback watcher
+        """
+        if self._watcher or self.bundle_path:
+            # A bundle is immutable; rebuild it and reload instead
             return
+        
+        def on_change(added, modified, deleted):
+            self.apply_changes(list(added) + list(modified) + list(deleted))
+        
+        self._watcher = ContentWatcher(self.content_dir, on_change, interval=interval)
+        self._watcher.start()
+    
+    def stop_watching(self):
+        """Stop the content watcher if it is running."""
+        if self._watcher:
+            self._watcher.stop()
+            self._watcher = None
+    
+    @staticmethod
+    def _make_header(tutorial_data: Dict[str, Any]) -> Tutorial:
+        """
+        Strip the step bodies from a tutorial, keeping only its header fields.
+        
+        Args:
+            tutorial_data: The full tutorial data
             
-        for file_path in skill_tree_dir.glob("*.yaml"):
-            try:
-                with open(file_path, 'r') as file:
-                    skill_tree_data = yaml.safe_load(file)
-                    if skill_tree_data and 'id' in skill_tree_data:
-                        self.skill_trees[skill_tree_data['id']] = skill_tree_data
-            except Exception as e:
-                print(f"Error loading skill tree from {file_path}: {e}")
-    
-    def _build_content_relationships(self):
-        """Build relationships between content items (prerequisites, related content, etc.)."""
-        # Link tutorials to their certifications
-        for tutorial_id, tutorial in self.tutorials.items():
-            cert_mappings = tutorial.get('certification_mappings', [])
-            for mapping in cert_mappings:
-                cert_id = mapping.get('cert_id')
-                if cert_id and cert_id in self.certifications:
-                    # Add this tutorial to the certification's tutorial list
-                    if 'tutorials' not in self.certifications[cert_id]:
-                        self.certifications[cert_id]['tutorials'] = []
-                    
-                    # Only add if not already in the list
-                    if tutorial_id not in self.certifications[cert_id]['tutorials']:
-                        self.certifications[cert_id]['tutorials'].append(tutorial_id)
-        
-        # Link challenges to their tutorials and certifications
-        for challenge_id, challenge in self.challenges.items():
-            related_tutorials = challenge.get('related_tutorials', [])
-            for tutorial_id in related_tutorials:
-                if tutorial_id in self.tutorials:
-                    # Add this challenge to the tutorial's challenge list
-                    if 'related_challenges' not in self.tutorials[tutorial_id]:
-                        self.tutorials[tutorial_id]['related_challenges'] = []
-                    
-                    # Only add if not already in the list
-                    if challenge_id not in self.tutorials[tutorial_id]['related_challenges']:
-                        self.tutorials[tutorial_id]['related_challenges'].append(challenge_id)
+        Returns:
+            Tutorial: The tutorial without its steps, plus a step_count field
+        """
+        tutorial = Tutorial.from_dict(tutorial_data)
+        header = tutorial.copy()
+        if header.steps is not None or 'step_count' not in header:
+            header['step_count'] = len(header.steps or [])
+        header.steps = None
+        return header
+    
+    def _load_tutorial_body(self, tutorial_id: str, header: Dict[str, Any],
+                            catalog: Dict[str, Dict]) -> Dict[str, Any]:
+        """
+        Load a tutorial's steps from disk and make it resident.
+        
+        Args:
+            tutorial_id: The tutorial ID
+            header: The tutorial header from the index
+            catalog: Catalog the header was read from
+            
+        Returns:
+            dict: The full tutorial (header fields plus steps)
+        """
+        tutorial = Tutorial.from_dict(header).copy()
+        tutorial.pop('step_count', None)
+        tutorial['steps'] = self._read_tutorial_steps(catalog, tutorial_id)
+        self.strings.pool_item(tutorial, count=False)
+        
+        self._make_resident(tutorial_id, header, tutorial)
+        return tutorial
+    
+    def _read_tutorial_steps(self, catalog: Dict[str, Dict], tutorial_id: str) -> List[Dict[str, Any]]:
+        """
+        Read a tutorial's steps from its YAML file or, failing that, the bundle.
+        
+        Args:
+            catalog: Catalog the tutorial belongs to
+            tutorial_id: The tutorial ID
+            
+        Returns:
+            list: The tutorial steps (empty if they cannot be read)
+        """
+        file_path = catalog['paths'].get(('tutorials', tutorial_id))
+        if file_path:
+            # An edit still in the write-behind queue is newer than the file
+            pending = self._writer.pending(file_path) if self._writer else None
+            if isinstance(pending, Mapping):
+                return build_item('tutorials', pending).get('steps') or []
+            # Read straight from the file: the cache only holds headers in lazy
+            # mode, and readers must not modify it
+            data, _, error = _parse_worker(str(file_path))
+            if error:
+                print(f"Error loading tutorial from {file_path}: {error}")
+            elif isinstance(data, Mapping):
+                return data.get('steps') or []
+            return []
+        
+        if self._bundle:
+            data = self._bundle.read('tutorials', tutorial_id)
+            if isinstance(data, Mapping):
+                return data.get('steps') or []
+        return []
+    
+    def _make_resident(self, tutorial_id: str, header: Dict[str, Any], tutorial: Dict[str, Any]):
+        """
+        Mark a full tutorial as most recently used, evicting the oldest beyond the LRU bound.
+        
+        Readers call this without a lock, so entries may vanish under
+        concurrent eviction; a lost entry only costs a reload.
+        
+        Args:
+            tutorial_id: The tutorial ID
+            header: The catalog header the tutorial was built from
+            tutorial: The full tutorial data
+        """
+        self._resident[tutorial_id] = (header, tutorial)
+        try:
+            self._resident.move_to_end(tutorial_id)
+            while len(self._resident) > self.max_resident:
+                self._resident.popitem(last=False)
+        except KeyError:
+            pass
     
     def get_tutorial(self, tutorial_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a tutorial by ID.
         
+        In lazy mode the steps are loaded on first access and the tutorial
+        stays resident until it falls out of the LRU.
+        
         Args:
             tutorial_id: The tutorial ID
             
         Returns:
             dict: The tutorial data or None if not found
         """
-        return self.tutorials.get(tutorial_id)
+        snapshot = self._snapshot
+        if not self.lazy:
+            return snapshot.tutorials.get(tutorial_id)
+        
+        header = snapshot.tutorials.get(tutorial_id)
+        if header is None:
+            return None
+        
+        # Entries built from another generation's header are stale
+        entry = self._resident.get(tutorial_id)
+        if entry is not None and entry[0] is header:
+            try:
+                self._resident.move_to_end(tutorial_id)
+            except KeyError:
+                pass
+            return entry[1]
+        
+        return self._load_tutorial_body(tutorial_id, header, snapshot.catalog)
+    
+    def get_tutorial_step(self, tutorial_id: str, step_index: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a specific step from a tutorial.
+        
+        Args:
+            tutorial_id: The tutorial ID
+            step_index: The step index (0-based)
+            
+        Returns:
+            dict: The step data or None if not found
+        """
+        tutorial = self.get_tutorial(tutorial_id)
+        if not tutorial:
+            return None
+        
+        steps = tutorial.get('steps', [])
+        if not steps or step_index < 0 or step_index >= len(steps):
+            return None
+        
+        return steps[step_index]
     
     def get_all_tutorials(self) -> List[Dict[str, Any]]:
         """
         Get all tutorials.
         
+        In lazy mode these are headers without steps; use get_tutorial()
+        to fetch the full tutorial.
+        
         Returns:
             list: List of all tutorials
         """
@@ -174,8 +834,61 @@ class ContentRepository:
         Returns:
             list: List of tutorials with the specified difficulty
         """
-        return [tutorial for tutorial in self.tutorials.values() 
-                if tutorial.get('difficulty', '').lower() == difficulty.lower()]
+        return ContentIndex.lookup(self.index.tutorials_by_difficulty, difficulty)
+    
+    def get_sorted_tutorials(self, difficulty: str = None, certification: str = None) -> List[Dict[str, Any]]:
+        """
+        Get tutorials in menu order (difficulty, then title), optionally filtered.
+        
+        Args:
+            difficulty: Optional difficulty filter
+            certification: Optional certification ID filter (ignored if difficulty is given)
+            
+        Returns:
+            list: Sorted list of tutorials
+        """
+        index = self.index
+        if difficulty:
+            return ContentIndex.lookup(index.sorted_tutorials_by_difficulty, difficulty)
+        if certification:
+            return list(index.sorted_tutorials_by_certification.get(certification, ()))
+        return list(index.sorted_tutorials)
+    
+    def get_tutorial_path(self, difficulty: str) -> List[Dict[str, Any]]:
+        """
+        Get the tutorials of one difficulty in learning-path order (level, then title).
+        
+        Args:
+            difficulty: The difficulty level
+            
+        Returns:
+            list: Sorted list of tutorials
+        """
+        return ContentIndex.lookup(self.index.path_by_difficulty, difficulty)
+    
+    def get_tutorials_by_topic(self, topic: str) -> List[Dict[str, Any]]:
+        """
+        Get tutorials tagged with a topic.
+        
+        Args:
+            topic: The topic name (case-insensitive)
+            
+        Returns:
+            list: List of tutorials with the specified topic
+        """
+        return ContentIndex.lookup(self.index.tutorials_by_topic, topic)
+    
+    def get_tutorials_by_level(self, level: int) -> List[Dict[str, Any]]:
+        """
+        Get tutorials at a given level.
+        
+        Args:
+            level: The tutorial level (tutorials without one count as level 1)
+            
+        Returns:
+            list: List of tutorials at that level
+        """
+        return ContentIndex.lookup(self.index.tutorials_by_level, level)
     
     def get_tutorials_by_certification(self, cert_id: str) -> List[Dict[str, Any]]:
         """
@@ -187,11 +900,7 @@ class ContentRepository:
         Returns:
             list: List of tutorials related to the certification
         """
-        cert = self.certifications.get(cert_id, {})
-        tutorial_ids = cert.get('tutorials', [])
-        
-        return [self.tutorials[tutorial_id] for tutorial_id in tutorial_ids 
-                if tutorial_id in self.tutorials]
+        return list(self.index.tutorials_by_certification.get(cert_id, ()))
     
     def get_challenge(self, challenge_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -214,6 +923,32 @@ class ContentRepository:
         """
         return list(self.challenges.values())
     
+    def get_challenges_by_difficulty(self, difficulty: str) -> List[Dict[str, Any]]:
+        """
+        Get challenges by difficulty level.
+        
+        Args:
+            difficulty: The difficulty level (beginner, intermediate, advanced)
+            
+        Returns:
+            list: List of challenges with the specified difficulty
+        """
+        return ContentIndex.lookup(self.index.challenges_by_difficulty, difficulty)
+    
+    def get_sorted_challenges(self, difficulty: str = None) -> List[Dict[str, Any]]:
+        """
+        Get challenges in menu order (difficulty, then title), optionally filtered.
+        
+        Args:
+            difficulty: Optional difficulty filter
+            
+        Returns:
+            list: Sorted list of challenges
+        """
+        if difficulty:
+            return ContentIndex.lookup(self.index.sorted_challenges_by_difficulty, difficulty)
+        return list(self.index.sorted_challenges)
+    
     def get_certification(self, cert_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a certification by ID.
@@ -235,6 +970,15 @@ class ContentRepository:
         """
         return list(self.certifications.values())
     
+    def get_sorted_certifications(self) -> List[Dict[str, Any]]:
+        """
+        Get all certifications sorted by title.
+        
+        Returns:
+            list: Sorted list of certifications
+        """
+        return list(self.index.sorted_certifications)
+    
     def get_skill_tree(self, tree_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a skill tree by ID.
@@ -257,11 +1001,139 @@ class ContentRepository:
         Returns:
             list: List of challenges related to the tutorial
         """
-        tutorial = self.tutorials.get(tutorial_id, {})
-        challenge_ids = tutorial.get('related_challenges', [])
+        challenges = self.challenges
+        return [challenges[challenge_id] for challenge_id in self.graph.related_challenge_ids(tutorial_id)
+                if challenge_id in challenges]
+    
+    def _content_fingerprint(self, catalog: Dict[str, Dict]) -> Optional[str]:
+        """
+        Identify the content of a catalog by the hashes of its source files.
+        
+        Args:
+            catalog: The catalog to fingerprint
+            
+        Returns:
+            str: A SHA-1 fingerprint, or None if some file has no recorded hash
+        """
+        lines = [f"bundle\t{self._bundle.content_hash}"] if self._bundle else []
+        if catalog['files'] and not self.cache:
+            return None
+        
+        for file_path, (kind, item_id) in catalog['files'].items():
+            digest = self.cache.digest(file_path)
+            if digest is None:
+                return None
+            lines.append(f"{kind}\t{item_id}\t{digest}")
+        return hashlib.sha1("\n".join(sorted(lines)).encode('utf-8')).hexdigest()
+    
+    def _iter_search_documents(self, catalog: Dict[str, Dict]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield every tutorial and challenge with its full text for indexing.
+        
+        Args:
+            catalog: The catalog to index
+            
+        Yields:
+            tuple: ('tutorial' | 'challenge', item)
+        """
+        for tutorial_id, tutorial in catalog['tutorials'].items():
+            if self.lazy:
+                # Headers have no steps; read the body without making it resident
+                tutorial = Tutorial.from_dict(tutorial).copy()
+                tutorial.pop('step_count', None)
+                tutorial['steps'] = self._read_tutorial_steps(catalog, tutorial_id)
+            yield 'tutorial', tutorial
+        
+        for challenge in catalog['challenges'].values():
+            yield 'challenge', challenge
+    
+    def get_search_index(self) -> SearchIndex:
+        """
+        Full-text index of the current catalog.
+        
+        The index is persisted next to the content cache and reused across
+        runs while the content fingerprint is unchanged; it is rebuilt after
+        content changes.
+        
+        Returns:
+            SearchIndex: The up-to-date search index
+        """
+        snapshot = self._snapshot
+        if self._search_index is not None and self._search_generation == snapshot.generation:
+            return self._search_index
+        
+        generation = snapshot.generation
+        catalog = snapshot.catalog
+        fingerprint = self._content_fingerprint(catalog)
+        index_path = self.cache.cache_path.with_name("search_index.bin") if self.cache else None
+        
+        index = SearchIndex.load(index_path, fingerprint) if index_path else None
+        if index is None:
+            index = SearchIndex.build(self._iter_search_documents(catalog), fingerprint)
+            if index_path and fingerprint:
+                index.save(index_path)
+        
+        self._search_index = index
+        self._search_generation = generation
+        return index
+    
+    def search(self, query: str, limit: int = 10, filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Search tutorials and challenges.
+        
+        Args:
+            query: Search terms
+            limit: Maximum number of results
+            filters: Optional 'type', 'difficulty' and 'topic' filters
+            
+        Returns:
+            list: Ranked result dicts (type, id, title, difficulty, score)
+        """
+        return self.get_search_index().search(query, limit, filters)
+    
+    def warm(self):
+        """
+        Build the lazily derived structures of the published catalog.
+        
+        Graph, topic index, related-content indexes and the search index are
+        otherwise built by the first query that needs them.
+        """
+        snapshot = self._snapshot
+        snapshot.graph
+        snapshot.index
+        for kind in RELATED_KINDS:
+            snapshot.related(kind)
+        self.get_search_index()
+    
+    def get_related_tutorials(self, tutorial_id: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Get tutorials that share topics with a tutorial, most relevant first.
+        
+        Args:
+            tutorial_id: The tutorial ID
+            limit: Maximum number of tutorials to return
+            
+        Returns:
+            list: List of related tutorials
+        """
+        snapshot = self._snapshot
+        related_ids = snapshot.related('tutorials').get_related_ids(tutorial_id, limit)
+        return [snapshot.tutorials[other_id] for other_id in related_ids if other_id in snapshot.tutorials]
+    
+    def get_similar_challenges(self, challenge_id: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Get challenges that share topics with a challenge, most relevant first.
         
-        return [self.challenges[challenge_id] for challenge_id in challenge_ids 
-                if challenge_id in self.challenges]
+        Args:
+            challenge_id: The challenge ID
+            limit: Maximum number of challenges to return
+            
+        Returns:
+            list: List of similar challenges
+        """
+        snapshot = self._snapshot
+        related_ids = snapshot.related('challenges').get_related_ids(challenge_id, limit)
+        return [snapshot.challenges[other_id] for other_id in related_ids if other_id in snapshot.challenges]
     
     def save_tutorial(self, tutorial_data: Dict[str, Any]) -> bool:
         """
@@ -275,26 +1147,112 @@ class ContentRepository:
         """
         if not tutorial_data or 'id' not in tutorial_data:
             return False
+        return self.save_many([tutorial_data]) == 1
+    
+    def save_many(self, tutorials: Iterable[Dict[str, Any]]) -> int:
+        """
+        Save a batch of tutorials and publish them as one new generation.
         
-        tutorial_id = tutorial_data['id']
-        file_path = self.content_dir / "tutorials" / f"{tutorial_id}.yaml"
+        Used for bulk imports: the catalog is copied and the indexes are
+        invalidated once for the whole batch instead of once per tutorial.
+        Each file is written atomically, or queued when write-behind is
+        enabled. Items without an ID are skipped.
         
-        try:
-            # Make sure the directory exists
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        Args:
+            tutorials: Tutorial data (any iterable, e.g. iter_tutorials() of another tree)
             
-            # Save the tutorial data
-            with open(file_path, 'w') as file:
-                yaml.dump(tutorial_data, file, default_flow_style=False)
+        Returns:
+            int: Number of tutorials saved
+        """
+        with self._write_lock:
+            catalog = self._snapshot.thaw()
+            saved = []
             
-            # Update in-memory data
-            self.tutorials[tutorial_id] = tutorial_data
+            for tutorial_data in tutorials:
+                if not tutorial_data or 'id' not in tutorial_data:
+                    continue
+                
+                tutorial_id = tutorial_data['id']
+                # Existing tutorials are written back where they were found
+                file_path = catalog['paths'].get(('tutorials', tutorial_id),
+                                                 self.content_dir / "tutorials" / f"{tutorial_id}.yaml")
+                plain = to_plain(tutorial_data)
+                try:
+                    self._write_content_file(file_path, plain)
+                except Exception as e:
+                    print(f"Error saving tutorial {tutorial_id}: {e}")
+                    continue
+                if self.cache:
+                    self.cache.forget(file_path)
+                
+                # Store a model built from the saved data, never the caller's object
+                tutorial = self.strings.pool_item(build_item('tutorials', plain))
+                catalog['files'][file_path] = ('tutorials', tutorial_id)
+                catalog['paths'][('tutorials', tutorial_id)] = file_path
+                header = self._make_header(tutorial) if self.lazy else tutorial
+                catalog['tutorials'][tutorial_id] = header
+                saved.append((tutorial_id, header, tutorial))
             
-            return True
-        except Exception as e:
-            print(f"Error saving tutorial: {e}")
-            return False
+            if saved:
+                self._publish(catalog)
+                for tutorial_id, header, tutorial in saved:
+                    if self.lazy:
+                        self._make_resident(tutorial_id, header, tutorial)
+                    else:
+                        self._resident.pop(tutorial_id, None)
+            return len(saved)
+    
+    def _write_content_file(self, file_path: Path, data: Any):
+        """
+        Write one content file, through the write-behind queue if enabled.
+        
+        Args:
+            file_path: Destination file
+            data: Plain YAML data
+        """
+        if self._writer:
+            self._writer.put(file_path, data)
+        else:
+            atomic_write_yaml(file_path, data)
     
+    def flush(self) -> int:
+        """
+        Write every queued edit to disk now.
+        
+        Returns:
+            int: Number of files written
+        """
+        return self._writer.flush() if self._writer else 0
+    
+    def write_errors(self) -> Dict[Path, str]:
+        """
+        Queued edits whose last write attempt failed (they are retried in the background).
+        
+        Returns:
+            dict: File -> error message
+        """
+        return self._writer.failures() if self._writer else {}
+    
+    def close(self):
+        """Stop watching and write every queued edit (safe to call more than once)."""
+        self.stop_watching()
+        if self._writer:
+            self._writer.close()
+
+    def after_fork(self):
+        """
+        Reset per-process state in a child forked from a preloaded repository.
+
+        The published snapshot (and everything derived from it) is shared
+        with the parent and kept; locks, threads and worker pools are not
+        inherited safely and are recreated.
+        """
+        self._write_lock = threading.RLock()
+        self._watcher = None
+        self._executor = None
+        if self._writer:
+            self._writer = WriteBehindQueue(self._writer.delay)
+
     def delete_tutorial(self, tutorial_id: str) -> bool:
         """
         Delete a tutorial from the repository.
@@ -305,19 +1263,28 @@ class ContentRepository:
         Returns:
             bool: True if deleted successfully, False otherwise
         """
-        if tutorial_id not in self.tutorials:
-            return False
-        
-        file_path = self.content_dir / "tutorials" / f"{tutorial_id}.yaml"
-        
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
+        with self._write_lock:
+            if tutorial_id not in self.tutorials:
+                return False
             
-            # Remove from in-memory data
-            del self.tutorials[tutorial_id]
+            catalog = self._snapshot.thaw()
+            file_path = catalog['paths'].get(('tutorials', tutorial_id),
+                                             self.content_dir / "tutorials" / f"{tutorial_id}.yaml")
             
-            return True
-        except Exception as e:
-            print(f"Error deleting tutorial: {e}")
-            return False
+            try:
+                if self._writer:
+                    self._writer.discard(file_path)
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                
+                # Publish a generation without the tutorial
+                del catalog['tutorials'][tutorial_id]
+                catalog['paths'].pop(('tutorials', tutorial_id), None)
+                catalog['files'].pop(file_path, None)
+                self._publish(catalog)
+                self._resident.pop(tutorial_id, None)
+                
+                return True
+            except Exception as e:
+                print(f"Error deleting tutorial: {e}")
+                return False
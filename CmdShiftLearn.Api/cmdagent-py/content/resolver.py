@@ -0,0 +1,202 @@
+"""
+Indexed lookup of local tutorials by ID.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from content.models import to_plain
+from content.repository import ContentRepository, CONTENT_LAYOUT, iter_content_files
+
+
+class LocalTutorialResolver:
+    """
+    Find local tutorials by ID through a loaded ContentRepository.
+
+    Lookups are answered from the repository's published catalog, whose
+    file index maps every tutorial ID to the file it came from, so the
+    tree is parsed once, by the repository's own load (which reuses the
+    content cache for unchanged files). Before a tutorial is returned its
+    file is checked and, if it changed, reloaded through
+    ContentRepository.apply_changes; when an ID is missing and a directory
+    of the tree changed (files added, removed or renamed), the changed
+    files are reloaded the same way. Duplicate IDs resolve as in a full
+    load: the last file in sorted path order wins.
+    """
+
+    def __init__(self, repository: ContentRepository = None):
+        """
+        Initialize the resolver (the content is loaded on first use).
+
+        Args:
+            repository: Repository to resolve through; loaded on first use if
+                        it has not been (defaults to one over data/content)
+        """
+        self.repository = repository or ContentRepository(verbose=False)
+        self.root = self.repository.content_dir / 'tutorials'
+        # tutorial file -> mtime_ns as last loaded into the repository
+        self._mtimes: Optional[Dict[Path, int]] = None
+        # directory -> mtime_ns when the files were last listed
+        self._directories: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'reloaded': 0, 'rescans': 0}
+
+    def resolve(self, tutorial_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a local tutorial by ID.
+
+        Args:
+            tutorial_id: The tutorial ID
+
+        Returns:
+            dict: A fresh copy of the tutorial, or None if there is no local file for it
+        """
+        with self._lock:
+            self._ensure_loaded()
+            for attempt in range(2):
+                path = self._path_of(tutorial_id)
+                if path is not None and self._refresh_file(path):
+                    tutorial = self.repository.get_tutorial(tutorial_id)
+                    if tutorial is not None:
+                        self.stats['hits'] += 1
+                        return to_plain(tutorial)
+                # Missing, moved or renamed: look again if the tree changed
+                if attempt or not self._tree_changed():
+                    return None
+                self._rescan()
+        return None
+
+    def locate(self, tutorial_id: str) -> Optional[Path]:
+        """
+        Find the file of a local tutorial.
+
+        Args:
+            tutorial_id: The tutorial ID
+
+        Returns:
+            Path: The file, or None if there is no local file for it
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if self._path_of(tutorial_id) is None and self._tree_changed():
+                self._rescan()
+            return self._path_of(tutorial_id)
+
+    def tutorials(self) -> List[Tuple[Path, Any]]:
+        """
+        List every local tutorial, reloading only files that changed.
+
+        Returns:
+            list: (file path, tutorial) tuples in tree order
+        """
+        with self._lock:
+            self._ensure_loaded()
+            self._rescan()
+            snapshot = self.repository.snapshot()
+            paths = snapshot.catalog['paths']
+            return sorted(((paths[('tutorials', tutorial_id)], tutorial)
+                           for tutorial_id, tutorial in snapshot.tutorials.items()
+                           if ('tutorials', tutorial_id) in paths),
+                          key=lambda found: found[0])
+
+    def loaded_repository(self) -> ContentRepository:
+        """
+        The repository lookups go through, loaded on first use.
+
+        Returns:
+            ContentRepository: The loaded repository (shared; do not modify its items)
+        """
+        with self._lock:
+            self._ensure_loaded()
+        return self.repository
+
+    def _path_of(self, tutorial_id: str) -> Optional[Path]:
+        """File the published catalog took a tutorial from."""
+        return self.repository.catalog['paths'].get(('tutorials', tutorial_id))
+
+    def _ensure_loaded(self):
+        """Load the repository and record the file times (called with the lock held)."""
+        if self._mtimes is not None:
+            return
+        # Listed before loading, so a file changed in between is reloaded, not missed
+        mtimes = self._scan()
+        if not self.repository.generation:
+            self.repository.load_all_content()
+        self._mtimes = mtimes
+
+    def _refresh_file(self, path: Path) -> bool:
+        """Reload one file if it changed since it was loaded; False if it is gone (lock held)."""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns != self._mtimes.get(path):
+            self.repository.apply_changes([path])
+            self.stats['reloaded'] += 1
+            if mtime_ns is None:
+                self._mtimes.pop(path, None)
+            else:
+                self._mtimes[path] = mtime_ns
+        return mtime_ns is not None
+
+    def _rescan(self):
+        """Reload every tutorial file added, changed or removed since the last scan (lock held)."""
+        mtimes = self._scan()
+        changed = [path for path in set(mtimes) | set(self._mtimes)
+                   if mtimes.get(path) != self._mtimes.get(path)]
+        if changed:
+            self.repository.apply_changes(changed)
+            self.stats['reloaded'] += len(changed)
+        self._mtimes = mtimes
+        self.stats['rescans'] += 1
+
+    def _scan(self) -> Dict[Path, int]:
+        """mtime of every tutorial file, and remember the directory times."""
+        mtimes = {}
+        for path in iter_content_files(self.root, CONTENT_LAYOUT['tutorials']):
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+        self._directories = self._directory_mtimes()
+        return mtimes
+
+    def _directory_mtimes(self) -> Dict[str, int]:
+        """mtime of the tutorials directory and each of its subdirectories."""
+        mtimes = {}
+        pending = [os.fspath(self.root)]
+        while pending:
+            directory = pending.pop()
+            try:
+                mtimes[directory] = os.stat(directory).st_mtime_ns
+                with os.scandir(directory) as entries:
+                    pending.extend(entry.path for entry in entries
+                                   if not entry.name.startswith('.') and entry.is_dir(follow_symlinks=False))
+            except OSError:
+                continue
+        return mtimes
+
+    def _tree_changed(self) -> bool:
+        """Whether files may have been added, removed or renamed since the last scan."""
+        return self._directory_mtimes() != self._directories
+
+
+_resolver: Optional[LocalTutorialResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def get_local_resolver() -> LocalTutorialResolver:
+    """
+    The process-wide local tutorial resolver, created on first use.
+
+    Returns:
+        LocalTutorialResolver: The shared resolver
+    """
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = LocalTutorialResolver()
+    return _resolver
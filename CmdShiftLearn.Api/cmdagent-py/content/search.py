@@ -0,0 +1,277 @@
+"""
+Full-text BM25 search over tutorials and challenges.
+"""
+
+import os
+import re
+import math
+import heapq
+import pickle
+from collections import defaultdict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+
+# Tokens are runs of letters/digits, optionally joined by '-' or '_' (Get-Process, $env_path)
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[-_][a-z0-9]+)*")
+
+# How much each field counts towards a document's term frequencies
+FIELD_WEIGHTS = {
+    'title': 3,
+    'description': 2,
+    'topics': 2,
+    'body': 1,
+}
+
+# Step keys holding the instructions and the expected command (canonical name first)
+STEP_TEXT_KEYS = ('content', 'instructions')
+STEP_COMMAND_KEYS = ('command', 'expected_command', 'expectedCommand')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lower-case search tokens.
+
+    Compound tokens such as ``get-process`` are kept whole and also split
+    into their parts, so both ``get-process`` and ``process`` match.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        list: Tokens in order of appearance
+    """
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        tokens.append(token)
+        if '-' in token or '_' in token:
+            tokens.extend(part for part in re.split(r"[-_]", token) if part)
+    return tokens
+
+
+def _first(item: Mapping, keys: Tuple[str, ...]) -> Any:
+    """The value of the first of several alternative keys that is set."""
+    for key in keys:
+        value = item.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _text(value: Any) -> str:
+    """Flatten a YAML value into searchable text."""
+    if value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        return ' '.join(_text(v) for v in value)
+    return str(value)
+
+
+def extract_fields(kind: str, item: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Pull the searchable text out of a tutorial or challenge.
+
+    Args:
+        kind: 'tutorial' or 'challenge'
+        item: The full content item
+
+    Returns:
+        dict: Field name -> text
+    """
+    body = []
+    if kind == 'tutorial':
+        for step in item.get('steps', []) or []:
+            if isinstance(step, Mapping):
+                body.append(_text(step.get('title')))
+                # Typed steps answer every alias; raw YAML steps use one of them
+                body.append(_text(_first(step, STEP_TEXT_KEYS)))
+                body.append(_text(_first(step, STEP_COMMAND_KEYS)))
+                body.append(_text(step.get('hint')))
+    else:
+        body.append(_text(item.get('content')))
+        body.append(_text(item.get('hint')))
+
+    return {
+        'title': _text(item.get('title')),
+        'description': _text(item.get('description')),
+        'topics': _text(item.get('topics')),
+        'body': '\n'.join(body),
+    }
+
+
+class SearchIndex:
+    """
+    BM25 inverted index over tutorials and challenges.
+
+    Documents are whole tutorials/challenges; title, description, topics,
+    step instructions, hints and challenge content are indexed with the
+    field weights in FIELD_WEIGHTS. Postings and per-document length norms
+    are precomputed so a query only touches the postings of its own terms.
+    """
+
+    # Bump when the on-disk layout changes
+    VERSION = 2
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.docs: List[Tuple[str, str, str, str, frozenset]] = []
+        self.postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self.doc_lengths: List[int] = []
+        self.norms: List[float] = []
+        self.fingerprint: Optional[str] = None
+
+    @classmethod
+    def build(cls, documents: Iterable[Tuple[str, Dict[str, Any]]], fingerprint: str = None) -> 'SearchIndex':
+        """
+        Build an index from (kind, item) pairs.
+
+        Args:
+            documents: Iterable of ('tutorial' | 'challenge', item) pairs
+            fingerprint: Identifier of the content the index was built from
+
+        Returns:
+            SearchIndex: The finished index
+        """
+        index = cls()
+        index.fingerprint = fingerprint
+        for kind, item in documents:
+            index.add_document(kind, item)
+        index.finalize()
+        return index
+
+    def add_document(self, kind: str, item: Dict[str, Any]):
+        """
+        Add one tutorial or challenge to the index.
+
+        Args:
+            kind: 'tutorial' or 'challenge'
+            item: The full content item
+        """
+        doc_id = len(self.docs)
+        topics = frozenset(str(t).lower() for t in item.get('topics', []) or [])
+        self.docs.append((kind, item.get('id'), _text(item.get('title')),
+                          _text(item.get('difficulty')).lower(), topics))
+
+        frequencies = defaultdict(int)
+        for field, text in extract_fields(kind, item).items():
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                frequencies[token] += weight
+
+        for token, frequency in frequencies.items():
+            self.postings[token].append((doc_id, frequency))
+        self.doc_lengths.append(sum(frequencies.values()))
+
+    def finalize(self):
+        """Precompute BM25 length norms once all documents are added."""
+        average = (sum(self.doc_lengths) / len(self.doc_lengths)) if self.doc_lengths else 1.0
+        average = average or 1.0
+        self.norms = [self.k1 * (1 - self.b + self.b * length / average) for length in self.doc_lengths]
+        self.postings = dict(self.postings)
+
+    def _matches(self, doc_id: int, filters: Dict[str, Any]) -> bool:
+        """Check a document against the optional type/difficulty/topic filters."""
+        kind, _, _, difficulty, topics = self.docs[doc_id]
+        if filters.get('type') and kind != filters['type'].lower().rstrip('s'):
+            return False
+        if filters.get('difficulty') and difficulty != filters['difficulty'].lower():
+            return False
+        if filters.get('topic') and filters['topic'].lower() not in topics:
+            return False
+        return True
+
+    def search(self, query: str, limit: int = 10, filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Rank documents against a free-text query.
+
+        Args:
+            query: Search terms
+            limit: Maximum number of results
+            filters: Optional 'type' (tutorial/challenge), 'difficulty' and 'topic' filters
+
+        Returns:
+            list: Result dicts with type, id, title, difficulty and score, best first
+        """
+        filters = filters or {}
+        total = len(self.docs)
+        scores = defaultdict(float)
+
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings:
+                scores[doc_id] += idf * frequency * (self.k1 + 1) / (frequency + self.norms[doc_id])
+
+        if filters:
+            scores = {doc_id: score for doc_id, score in scores.items() if self._matches(doc_id, filters)}
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda pair: pair[1])
+        results = []
+        for doc_id, score in best:
+            kind, item_id, title, difficulty, _ = self.docs[doc_id]
+            results.append({
+                'type': kind,
+                'id': item_id,
+                'title': title,
+                'difficulty': difficulty,
+                'score': round(score, 4),
+            })
+        return results
+
+    def save(self, path) -> bool:
+        """
+        Persist the index next to the content cache.
+
+        Args:
+            path: Destination file
+
+        Returns:
+            bool: True if saved successfully, False otherwise
+        """
+        path = Path(path)
+        try:
+            os.makedirs(path.parent, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as file:
+                pickle.dump({'version': self.VERSION, 'index': self}, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            print(f"Error saving search index {path}: {e}")
+            return False
+
+    @classmethod
+    def load(cls, path, fingerprint: str) -> Optional['SearchIndex']:
+        """
+        Load a persisted index if it was built from the same content.
+
+        Args:
+            path: Index file
+            fingerprint: Fingerprint of the current content
+
+        Returns:
+            SearchIndex: The index, or None if missing, stale or unreadable
+        """
+        path = Path(path)
+        if not fingerprint or not path.exists():
+            return None
+        try:
+            with open(path, 'rb') as file:
+                saved = pickle.load(file)
+        except Exception:
+            return None
+        index = saved.get('index') if saved.get('version') == cls.VERSION else None
+        if index is None or index.fingerprint != fingerprint:
+            return None
+        return index
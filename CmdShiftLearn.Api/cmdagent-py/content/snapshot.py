@@ -0,0 +1,132 @@
+"""
+Immutable catalog generations shared between readers.
+"""
+
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+
+from content.graph import ContentGraph
+from content.index import ContentIndex
+from content.related import RelatedIndex
+
+# Content kinds with a related-content index
+RELATED_KINDS = ('tutorials', 'challenges')
+
+
+class CatalogSnapshot:
+    """
+    One published generation of the content catalog.
+
+    A snapshot is never modified after it is created: the catalog maps are
+    wrapped in read-only proxies and writers build a new catalog and
+    publish a new snapshot instead. Readers grab the current snapshot once
+    (a single attribute read, no lock) and get a consistent view of all
+    content and of the structures derived from it, however many
+    generations are published meanwhile.
+
+    The graph, the secondary indexes and the related-content indexes are
+    built on first use. Two threads may race to build them; both build the
+    same thing from the same frozen catalog, and the second assignment
+    simply wins. Related-content indexes start from a copy of an earlier
+    generation's, so only items affected by the changes are rescored.
+    """
+
+    __slots__ = ('generation', 'catalog', '_graph', '_index', '_related', '_base_related')
+
+    def __init__(self, catalog: Dict[str, Dict], generation: int, previous: 'CatalogSnapshot' = None):
+        """
+        Freeze a fully built catalog.
+
+        Args:
+            catalog: The catalog (the caller must not modify it afterwards)
+            generation: Generation number of this snapshot
+            previous: The snapshot this one replaces, whose related-content
+                      indexes are reused
+        """
+        self.generation = generation
+        self.catalog: Mapping[str, Mapping] = MappingProxyType({
+            key: value if isinstance(value, MappingProxyType) else MappingProxyType(value)
+            for key, value in catalog.items()
+        })
+        self._graph = None
+        self._index = None
+        self._related = None
+        # Related indexes of the latest earlier generation that built them
+        # (kept instead of the snapshot itself, so old catalogs can be freed)
+        self._base_related = None
+        if previous is not None:
+            self._base_related = previous._related or previous._base_related
+
+    def __getitem__(self, key: str) -> Mapping:
+        return self.catalog[key]
+
+    def thaw(self) -> Dict[str, Dict]:
+        """
+        Shallow, writable copy of the catalog for building the next generation.
+
+        Returns:
+            dict: New maps holding the same items
+        """
+        return {key: dict(value) for key, value in self.catalog.items()}
+
+    @property
+    def tutorials(self) -> Mapping[str, Any]:
+        """Tutorials of this generation, keyed by ID."""
+        return self.catalog['tutorials']
+
+    @property
+    def challenges(self) -> Mapping[str, Any]:
+        """Challenges of this generation, keyed by ID."""
+        return self.catalog['challenges']
+
+    @property
+    def certifications(self) -> Mapping[str, Any]:
+        """Certifications of this generation, keyed by ID."""
+        return self.catalog['certifications']
+
+    @property
+    def skill_trees(self) -> Mapping[str, Any]:
+        """Skill trees of this generation, keyed by ID."""
+        return self.catalog['skill_trees']
+
+    @property
+    def graph(self) -> ContentGraph:
+        """Relationship graph of this generation."""
+        graph = self._graph
+        if graph is None:
+            graph = ContentGraph.from_catalog(self.catalog)
+            if graph.cyclic:
+                print(f"Prerequisite cycle detected among tutorials: {', '.join(sorted(graph.cyclic))}")
+            self._graph = graph
+        return graph
+
+    def related(self, kind: str) -> RelatedIndex:
+        """
+        Related-content index of this generation.
+
+        Args:
+            kind: 'tutorials' or 'challenges'
+
+        Returns:
+            RelatedIndex: The index (must not be refreshed by callers)
+        """
+        related = self._related
+        if related is None:
+            base = self._base_related
+            related = {}
+            for related_kind in RELATED_KINDS:
+                related_index = base[related_kind].copy() if base else RelatedIndex()
+                related_index.refresh(self.catalog[related_kind])
+                related[related_kind] = related_index
+            self._related = related
+            self._base_related = None
+        return related[kind]
+
+    @property
+    def index(self) -> ContentIndex:
+        """Secondary indexes and sorted views of this generation."""
+        index = self._index
+        if index is None:
+            index = ContentIndex(self.catalog, self.generation, self.graph)
+            self._index = index
+        return index
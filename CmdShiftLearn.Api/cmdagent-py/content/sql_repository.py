@@ -0,0 +1,972 @@
+"""
+SQLite-backed repository for tutorial and challenge content.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable
+
+from sqlalchemy import (
+    create_engine, event, MetaData, Table, Column, Index,
+    String, Integer, Text, select, delete, insert, func, text
+)
+
+from utils.config import DATA_DIR
+from content.index import DIFFICULTY_ORDER
+from content.graph import ContentGraph, prerequisite_ids, mapped_cert_ids
+from content.models import Tutorial, TutorialStep, Challenge, Certification, ContentItem, to_plain
+from content.related import SAME_DIFFICULTY_BONUS
+from content.search import SearchIndex, FIELD_WEIGHTS, extract_fields, tokenize
+
+
+# Default location of the content database
+DEFAULT_DB_PATH = Path(DATA_DIR) / "content.db"
+
+# Bump when the table layout changes; an outdated database is rebuilt on next import
+SCHEMA_VERSION = 3
+
+metadata = MetaData()
+
+meta_table = Table(
+    "meta", metadata,
+    Column("key", String, primary_key=True),
+    Column("value", Text),
+)
+
+tutorials_table = Table(
+    "tutorials", metadata,
+    Column("id", String, primary_key=True),
+    Column("title", Text, nullable=False, default=""),
+    Column("difficulty", String, nullable=False, default=""),
+    Column("difficulty_rank", Integer, nullable=False, default=0),
+    Column("level", Integer, nullable=False, default=1),
+    Column("step_count", Integer, nullable=False, default=0),
+    Column("header", Text, nullable=False),
+    Index("ix_tutorials_menu", "difficulty_rank", "title"),
+    Index("ix_tutorials_path", "difficulty", "level", "title"),
+)
+
+tutorial_steps_table = Table(
+    "tutorial_steps", metadata,
+    Column("tutorial_id", String, primary_key=True),
+    Column("position", Integer, primary_key=True),
+    Column("data", Text, nullable=False),
+)
+
+challenges_table = Table(
+    "challenges", metadata,
+    Column("id", String, primary_key=True),
+    Column("title", Text, nullable=False, default=""),
+    Column("difficulty", String, nullable=False, default=""),
+    Column("difficulty_rank", Integer, nullable=False, default=0),
+    Column("data", Text, nullable=False),
+    Index("ix_challenges_menu", "difficulty_rank", "title"),
+    Index("ix_challenges_difficulty", "difficulty"),
+)
+
+certifications_table = Table(
+    "certifications", metadata,
+    Column("id", String, primary_key=True),
+    Column("title", Text, nullable=False, default=""),
+    Column("data", Text, nullable=False),
+)
+
+skill_trees_table = Table(
+    "skill_trees", metadata,
+    Column("id", String, primary_key=True),
+    Column("data", Text, nullable=False),
+)
+
+# kind is 'tutorial' or 'challenge'; topics are stored lower-cased
+topics_table = Table(
+    "topics", metadata,
+    Column("kind", String, primary_key=True),
+    Column("item_id", String, primary_key=True),
+    Column("topic", String, primary_key=True),
+    Index("ix_topics_lookup", "kind", "topic"),
+)
+
+# tutorial -> certification edges from certification_mappings
+tutorial_certifications_table = Table(
+    "tutorial_certifications", metadata,
+    Column("tutorial_id", String, primary_key=True),
+    Column("cert_id", String, primary_key=True),
+    Index("ix_tutorial_certifications_cert", "cert_id"),
+)
+
+# tutorial -> prerequisite tutorial edges
+tutorial_prerequisites_table = Table(
+    "tutorial_prerequisites", metadata,
+    Column("tutorial_id", String, primary_key=True),
+    Column("prerequisite_id", String, primary_key=True),
+    Index("ix_tutorial_prerequisites_prerequisite", "prerequisite_id"),
+)
+
+# challenge -> tutorial edges from related_tutorials
+challenge_tutorials_table = Table(
+    "challenge_tutorials", metadata,
+    Column("challenge_id", String, primary_key=True),
+    Column("tutorial_id", String, primary_key=True),
+    Index("ix_challenge_tutorials_tutorial", "tutorial_id"),
+)
+
+# Full-text index; created separately because it is an FTS5 virtual table
+FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS content_fts USING fts5("
+    "kind UNINDEXED, item_id UNINDEXED, title, description, topics, body, "
+    "tokenize = \"unicode61 tokenchars '-_'\")"
+)
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a YAML value to JSON (dates and other scalars become strings)."""
+    return json.dumps(value, default=lambda o: to_plain(o) if isinstance(o, ContentItem) else str(o),
+                      ensure_ascii=False)
+
+
+def _difficulty(item: Dict[str, Any]) -> str:
+    """Normalized difficulty label of an item."""
+    return str(item.get('difficulty') or '').lower()
+
+
+def _level(tutorial: Dict[str, Any]) -> int:
+    """Tutorial level as an integer (non-numeric levels sort as level 1)."""
+    try:
+        return int(tutorial.get('level', 1))
+    except (TypeError, ValueError):
+        return 1
+
+
+def _topics(item: Dict[str, Any]) -> set:
+    """Normalized topics of an item."""
+    return {str(topic).lower() for topic in item.get('topics', []) or []}
+
+
+class SqlContentRepository:
+    """
+    Content repository backed by an indexed SQLite database.
+
+    Tutorials, steps, challenges, certifications, skill trees and the
+    relationships between them live in separate tables with indexes for
+    every menu and filter query, so a lookup only materializes the rows it
+    returns. The YAML tree stays the authoring format: import_yaml() loads
+    it into the database in a single transaction, and load_all_content()
+    imports automatically when the database is empty.
+
+    Exposes the same query methods as ContentRepository so ContentManager
+    can use either backend.
+    """
+
+    def __init__(self, db_path: str = None, content_dir: str = None, verbose: bool = True):
+        """
+        Initialize the SQLite content repository.
+
+        Args:
+            db_path: Path of the database file (defaults to data/content.db)
+            content_dir: YAML content directory used for imports (defaults to data/content)
+            verbose: Print a load summary (errors are always printed)
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.content_dir = Path(content_dir) if content_dir else Path(DATA_DIR) / "content"
+        self.verbose = verbose
+        self.generation = 0
+        self.fts_available = True
+        self._search_index = None
+        self._search_generation = -1
+        self._graph = None
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.engine = create_engine(f"sqlite:///{self.db_path}")
+        event.listen(self.engine, "connect", self._configure_connection)
+
+    @staticmethod
+    def _configure_connection(dbapi_connection, connection_record):
+        """Per-connection SQLite settings."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    def create_schema(self):
+        """Create the tables and indexes if they do not exist yet."""
+        with self.engine.begin() as connection:
+            version = None
+            if self.engine.dialect.has_table(connection, "meta"):
+                version = connection.execute(
+                    select(meta_table.c.value).where(meta_table.c.key == "schema_version")
+                ).scalar()
+            if version is not None and version != str(SCHEMA_VERSION):
+                metadata.drop_all(connection)
+                connection.execute(text("DROP TABLE IF EXISTS content_fts"))
+
+            metadata.create_all(connection)
+            try:
+                connection.execute(text(FTS_DDL))
+            except Exception:
+                # SQLite built without FTS5: search falls back to an in-memory index
+                self.fts_available = False
+            connection.execute(delete(meta_table).where(meta_table.c.key == "schema_version"))
+            connection.execute(insert(meta_table).values(key="schema_version", value=str(SCHEMA_VERSION)))
+
+    def is_empty(self) -> bool:
+        """
+        Check whether any content has been imported.
+
+        Returns:
+            bool: True if the database holds no tutorials, challenges or certifications
+        """
+        with self.engine.connect() as connection:
+            for table in (tutorials_table, challenges_table, certifications_table):
+                if connection.execute(select(table.c.id).limit(1)).first():
+                    return False
+        return True
+
+    def load_all_content(self):
+        """Open the database, importing the YAML content tree if it is empty."""
+        start = time.perf_counter()
+        self.create_schema()
+        if self.is_empty():
+            self.import_yaml()
+
+        if self.verbose:
+            counts = self.count_content()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"Content loaded: {counts['tutorials']} tutorials, {counts['challenges']} challenges, "
+                  f"{counts['certifications']} certifications (sqlite: {self.db_path}) in {elapsed_ms:.0f} ms")
+
+    def count_content(self) -> Dict[str, int]:
+        """
+        Count the stored items of each kind.
+
+        Returns:
+            dict: Kind -> number of items
+        """
+        tables = {
+            'tutorials': tutorials_table,
+            'challenges': challenges_table,
+            'certifications': certifications_table,
+            'skill_trees': skill_trees_table,
+        }
+        with self.engine.connect() as connection:
+            return {kind: connection.execute(select(func.count()).select_from(table)).scalar()
+                    for kind, table in tables.items()}
+
+    def import_yaml(self, content_dir: str = None) -> Dict[str, int]:
+        """
+        Replace the database contents with the YAML content tree.
+
+        The whole import runs in one transaction, so readers never see a
+        half-imported catalog.
+
+        Args:
+            content_dir: YAML content directory (defaults to the repository's content_dir)
+
+        Returns:
+            dict: Kind -> number of imported items
+        """
+        from content.repository import ContentRepository
+
+        source = ContentRepository(content_dir or self.content_dir, use_cache=False, verbose=False)
+        catalog = source.read_catalog()
+
+        self.create_schema()
+        with self.engine.begin() as connection:
+            for table in reversed(metadata.sorted_tables):
+                if table is not meta_table:
+                    connection.execute(delete(table))
+            if self.fts_available:
+                connection.execute(text("DELETE FROM content_fts"))
+
+            for tutorial in catalog['tutorials'].values():
+                self._insert_tutorial(connection, tutorial)
+            for challenge in catalog['challenges'].values():
+                self._insert_challenge(connection, challenge)
+            for cert_id, cert in catalog['certifications'].items():
+                connection.execute(insert(certifications_table).values(
+                    id=cert_id, title=str(cert.get('title') or ''), data=_dumps(cert)))
+            for tree_id, tree in catalog['skill_trees'].items():
+                connection.execute(insert(skill_trees_table).values(id=tree_id, data=_dumps(tree)))
+
+            connection.execute(delete(meta_table).where(meta_table.c.key.in_(["source", "imported_at"])))
+            connection.execute(insert(meta_table), [
+                {"key": "source", "value": str(source.content_dir)},
+                {"key": "imported_at", "value": str(int(time.time()))},
+            ])
+
+        self.generation += 1
+        return {kind: len(catalog[kind]) for kind in ('tutorials', 'challenges', 'certifications', 'skill_trees')}
+
+    def _insert_tutorial(self, connection, tutorial: Dict[str, Any]):
+        """Insert one tutorial with its steps, topics, relationships and search text."""
+        tutorial_id = tutorial['id']
+        steps = tutorial.get('steps') or []
+        header = {key: value for key, value in tutorial.items() if key != 'steps'}
+        difficulty = _difficulty(tutorial)
+
+        connection.execute(insert(tutorials_table).values(
+            id=tutorial_id,
+            title=str(tutorial.get('title') or ''),
+            difficulty=difficulty,
+            difficulty_rank=DIFFICULTY_ORDER.get(difficulty or 'beginner', 0),
+            level=_level(tutorial),
+            step_count=len(steps),
+            header=_dumps(header),
+        ))
+        if steps:
+            connection.execute(insert(tutorial_steps_table), [
+                {"tutorial_id": tutorial_id, "position": position, "data": _dumps(step)}
+                for position, step in enumerate(steps)
+            ])
+
+        cert_ids = set(mapped_cert_ids(tutorial))
+        if cert_ids:
+            connection.execute(insert(tutorial_certifications_table), [
+                {"tutorial_id": tutorial_id, "cert_id": cert_id} for cert_id in sorted(cert_ids)
+            ])
+
+        prerequisites = prerequisite_ids(tutorial)
+        if prerequisites:
+            connection.execute(insert(tutorial_prerequisites_table), [
+                {"tutorial_id": tutorial_id, "prerequisite_id": prerequisite_id}
+                for prerequisite_id in prerequisites
+            ])
+
+        self._insert_topics(connection, 'tutorial', tutorial_id, tutorial)
+        self._insert_search_text(connection, 'tutorial', tutorial)
+
+    def _insert_challenge(self, connection, challenge: Dict[str, Any]):
+        """Insert one challenge with its topics, relationships and search text."""
+        challenge_id = challenge['id']
+        difficulty = _difficulty(challenge)
+
+        connection.execute(insert(challenges_table).values(
+            id=challenge_id,
+            title=str(challenge.get('title') or ''),
+            difficulty=difficulty,
+            difficulty_rank=DIFFICULTY_ORDER.get(difficulty or 'beginner', 0),
+            data=_dumps(challenge),
+        ))
+
+        tutorial_ids = set(challenge.get('related_tutorials', []) or [])
+        if tutorial_ids:
+            connection.execute(insert(challenge_tutorials_table), [
+                {"challenge_id": challenge_id, "tutorial_id": tutorial_id}
+                for tutorial_id in sorted(tutorial_ids, key=str)
+            ])
+
+        self._insert_topics(connection, 'challenge', challenge_id, challenge)
+        self._insert_search_text(connection, 'challenge', challenge)
+
+    @staticmethod
+    def _insert_topics(connection, kind: str, item_id: str, item: Dict[str, Any]):
+        """Insert the topic postings of one item."""
+        topics = _topics(item)
+        if topics:
+            connection.execute(insert(topics_table), [
+                {"kind": kind, "item_id": item_id, "topic": topic} for topic in sorted(topics)
+            ])
+
+    def _insert_search_text(self, connection, kind: str, item: Dict[str, Any]):
+        """Insert the searchable text of one item into the FTS table."""
+        if not self.fts_available:
+            return
+        # Store pre-tokenized text so compound tokens (get-process) match whole and by part
+        fields = {field: " ".join(tokenize(value)) for field, value in extract_fields(kind, item).items()}
+        connection.execute(
+            text("INSERT INTO content_fts (kind, item_id, title, description, topics, body) "
+                 "VALUES (:kind, :item_id, :title, :description, :topics, :body)"),
+            {"kind": kind, "item_id": item['id'], **fields}
+        )
+
+    def _remove_tutorial_rows(self, connection, tutorial_id: str):
+        """Delete every row belonging to one tutorial."""
+        connection.execute(delete(tutorials_table).where(tutorials_table.c.id == tutorial_id))
+        connection.execute(delete(tutorial_steps_table).where(tutorial_steps_table.c.tutorial_id == tutorial_id))
+        connection.execute(delete(tutorial_certifications_table)
+                           .where(tutorial_certifications_table.c.tutorial_id == tutorial_id))
+        connection.execute(delete(tutorial_prerequisites_table)
+                           .where(tutorial_prerequisites_table.c.tutorial_id == tutorial_id))
+        connection.execute(delete(topics_table).where(
+            (topics_table.c.kind == 'tutorial') & (topics_table.c.item_id == tutorial_id)))
+        if self.fts_available:
+            connection.execute(text("DELETE FROM content_fts WHERE kind = 'tutorial' AND item_id = :item_id"),
+                               {"item_id": tutorial_id})
+
+    # -- materialization ---------------------------------------------------
+
+    def _tutorial_headers(self, connection, query) -> List[Dict[str, Any]]:
+        """
+        Run a tutorial query and build header dicts (no steps) in row order.
+
+        Args:
+            connection: Open connection
+            query: Select of (tutorials.id, tutorials.header, tutorials.step_count)
+
+        Returns:
+            list: Tutorial headers with step_count
+        """
+        headers = []
+        for _, header_json, step_count in connection.execute(query):
+            header = Tutorial.from_dict(json.loads(header_json))
+            header['step_count'] = step_count
+            headers.append(header)
+        return headers
+
+    @staticmethod
+    def _header_columns():
+        """Columns selected for tutorial headers."""
+        return select(tutorials_table.c.id, tutorials_table.c.header, tutorials_table.c.step_count)
+
+    @staticmethod
+    def _challenge_rows(connection, query) -> List[Dict[str, Any]]:
+        """Run a challenge query and decode its data column."""
+        return [Challenge.from_dict(json.loads(data)) for (data,) in connection.execute(query)]
+
+    @property
+    def graph(self) -> ContentGraph:
+        """
+        Relationship graph built from the edge tables, rebuilt only after content changes.
+
+        Only IDs, sort keys and edges are read; no item bodies are decoded
+        except certification files, which carry their own tutorial lists.
+        """
+        generation = self.generation
+        graph = self._graph
+        if graph is not None and graph[0] == generation:
+            return graph[1]
+
+        content_graph = ContentGraph()
+        with self.engine.connect() as connection:
+            for cert_id, data in connection.execute(select(certifications_table.c.id, certifications_table.c.data)):
+                content_graph.add_certification(cert_id, json.loads(data).get('tutorials', []) or [])
+
+            prerequisites = {}
+            for tutorial_id, prerequisite_id in connection.execute(select(tutorial_prerequisites_table)):
+                prerequisites.setdefault(tutorial_id, []).append(prerequisite_id)
+            cert_links = {}
+            for tutorial_id, cert_id in connection.execute(select(tutorial_certifications_table)):
+                cert_links.setdefault(tutorial_id, []).append(cert_id)
+
+            for tutorial_id, level, title, difficulty in connection.execute(select(
+                    tutorials_table.c.id, tutorials_table.c.level, tutorials_table.c.title,
+                    tutorials_table.c.difficulty).order_by(tutorials_table.c.id)):
+                content_graph.add_tutorial(tutorial_id, (level, title), difficulty,
+                                           prerequisites.get(tutorial_id, ()), cert_links.get(tutorial_id, ()))
+
+            challenge_links = {}
+            for challenge_id, tutorial_id in connection.execute(select(challenge_tutorials_table)):
+                challenge_links.setdefault(challenge_id, []).append(tutorial_id)
+            for challenge_id in connection.execute(select(challenges_table.c.id)).scalars():
+                content_graph.add_challenge(challenge_id, challenge_links.get(challenge_id, ()))
+
+        content_graph.finalize()
+        if content_graph.cyclic:
+            print(f"Prerequisite cycle detected among tutorials: {', '.join(sorted(content_graph.cyclic))}")
+        self._graph = (generation, content_graph)
+        return content_graph
+
+    def _tutorials_in_order(self, tutorial_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch tutorial headers for a list of IDs, preserving its order."""
+        if not tutorial_ids:
+            return []
+        with self.engine.connect() as connection:
+            by_id = {tutorial['id']: tutorial for tutorial in self._tutorial_headers(
+                connection, self._header_columns().where(tutorials_table.c.id.in_(tutorial_ids)))}
+        return [by_id[tutorial_id] for tutorial_id in tutorial_ids if tutorial_id in by_id]
+
+    # -- queries -------------------------------------------------------------
+
+    def get_tutorial(self, tutorial_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a tutorial by ID, including its steps.
+
+        Args:
+            tutorial_id: The tutorial ID
+
+        Returns:
+            dict: The tutorial data or None if not found
+        """
+        with self.engine.connect() as connection:
+            header_json = connection.execute(
+                select(tutorials_table.c.header).where(tutorials_table.c.id == tutorial_id)
+            ).scalar()
+            if header_json is None:
+                return None
+
+            tutorial = Tutorial.from_dict(json.loads(header_json))
+            tutorial['steps'] = [TutorialStep.from_dict(json.loads(data)) for data in connection.execute(
+                select(tutorial_steps_table.c.data)
+                .where(tutorial_steps_table.c.tutorial_id == tutorial_id)
+                .order_by(tutorial_steps_table.c.position)
+            ).scalars()]
+            return tutorial
+
+    def get_tutorial_step(self, tutorial_id: str, step_index: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a specific step from a tutorial.
+
+        Args:
+            tutorial_id: The tutorial ID
+            step_index: The step index (0-based)
+
+        Returns:
+            dict: The step data or None if not found
+        """
+        with self.engine.connect() as connection:
+            data = connection.execute(
+                select(tutorial_steps_table.c.data).where(
+                    (tutorial_steps_table.c.tutorial_id == tutorial_id)
+                    & (tutorial_steps_table.c.position == step_index))
+            ).scalar()
+        return TutorialStep.from_dict(json.loads(data)) if data is not None else None
+
+    def get_all_tutorials(self) -> List[Dict[str, Any]]:
+        """
+        Get all tutorials (headers without steps, with a step_count field).
+
+        Returns:
+            list: List of all tutorials
+        """
+        with self.engine.connect() as connection:
+            return self._tutorial_headers(connection, self._header_columns().order_by(tutorials_table.c.id))
+
+    def get_tutorials_by_difficulty(self, difficulty: str) -> List[Dict[str, Any]]:
+        """
+        Get tutorials by difficulty level.
+
+        Args:
+            difficulty: The difficulty level (beginner, intermediate, advanced)
+
+        Returns:
+            list: List of tutorials with the specified difficulty
+        """
+        with self.engine.connect() as connection:
+            return self._tutorial_headers(connection, self._header_columns().where(
+                tutorials_table.c.difficulty == str(difficulty).lower()))
+
+    def get_sorted_tutorials(self, difficulty: str = None, certification: str = None) -> List[Dict[str, Any]]:
+        """
+        Get tutorials in menu order (difficulty, then title), optionally filtered.
+
+        Args:
+            difficulty: Optional difficulty filter
+            certification: Optional certification ID filter (ignored if difficulty is given)
+
+        Returns:
+            list: Sorted list of tutorials
+        """
+        query = self._header_columns()
+        if difficulty:
+            query = query.where(tutorials_table.c.difficulty == str(difficulty).lower())
+        elif certification:
+            tutorial_ids = self.graph.certification_tutorial_ids(certification)
+            query = query.where(tutorials_table.c.id.in_(tutorial_ids))
+        query = query.order_by(tutorials_table.c.difficulty_rank, tutorials_table.c.title)
+
+        with self.engine.connect() as connection:
+            return self._tutorial_headers(connection, query)
+
+    def get_tutorial_path(self, difficulty: str) -> List[Dict[str, Any]]:
+        """
+        Get the tutorials of one difficulty in learning-path order.
+
+        Prerequisites come first; otherwise tutorials are ordered by level, then title.
+
+        Args:
+            difficulty: The difficulty level
+
+        Returns:
+            list: Sorted list of tutorials
+        """
+        return self._tutorials_in_order(self.graph.learning_path(difficulty))
+
+    def get_tutorials_by_topic(self, topic: str) -> List[Dict[str, Any]]:
+        """
+        Get tutorials by topic.
+
+        Args:
+            topic: The topic to filter by
+
+        Returns:
+            list: List of tutorials with the specified topic
+        """
+        query = self._header_columns().join(
+            topics_table,
+            (topics_table.c.kind == 'tutorial') & (topics_table.c.item_id == tutorials_table.c.id)
+        ).where(topics_table.c.topic == str(topic).lower())
+        with self.engine.connect() as connection:
+            return self._tutorial_headers(connection, query)
+
+    def get_tutorials_by_level(self, level: int) -> List[Dict[str, Any]]:
+        """
+        Get tutorials by level.
+
+        Args:
+            level: The level to filter by
+
+        Returns:
+            list: List of tutorials with the specified level
+        """
+        with self.engine.connect() as connection:
+            return self._tutorial_headers(connection, self._header_columns().where(
+                tutorials_table.c.level == level))
+
+    def get_tutorials_by_certification(self, cert_id: str) -> List[Dict[str, Any]]:
+        """
+        Get tutorials related to a certification.
+
+        Args:
+            cert_id: The certification ID
+
+        Returns:
+            list: List of tutorials related to the certification
+        """
+        return self._tutorials_in_order(self.graph.certification_tutorial_ids(cert_id))
+
+    def get_challenge(self, challenge_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a challenge by ID.
+
+        Args:
+            challenge_id: The challenge ID
+
+        Returns:
+            dict: The challenge data or None if not found
+        """
+        with self.engine.connect() as connection:
+            data = connection.execute(
+                select(challenges_table.c.data).where(challenges_table.c.id == challenge_id)
+            ).scalar()
+        return Challenge.from_dict(json.loads(data)) if data is not None else None
+
+    def get_all_challenges(self) -> List[Dict[str, Any]]:
+        """
+        Get all challenges.
+
+        Returns:
+            list: List of all challenges
+        """
+        with self.engine.connect() as connection:
+            return self._challenge_rows(connection, select(challenges_table.c.data)
+                                        .order_by(challenges_table.c.id))
+
+    def get_challenges_by_difficulty(self, difficulty: str) -> List[Dict[str, Any]]:
+        """
+        Get challenges by difficulty level.
+
+        Args:
+            difficulty: The difficulty level (beginner, intermediate, advanced)
+
+        Returns:
+            list: List of challenges with the specified difficulty
+        """
+        with self.engine.connect() as connection:
+            return self._challenge_rows(connection, select(challenges_table.c.data).where(
+                challenges_table.c.difficulty == str(difficulty).lower()))
+
+    def get_sorted_challenges(self, difficulty: str = None) -> List[Dict[str, Any]]:
+        """
+        Get challenges in menu order (difficulty, then title), optionally filtered.
+
+        Args:
+            difficulty: Optional difficulty filter
+
+        Returns:
+            list: Sorted list of challenges
+        """
+        query = select(challenges_table.c.data)
+        if difficulty:
+            query = query.where(challenges_table.c.difficulty == str(difficulty).lower())
+        query = query.order_by(challenges_table.c.difficulty_rank, challenges_table.c.title)
+        with self.engine.connect() as connection:
+            return self._challenge_rows(connection, query)
+
+    def get_certification(self, cert_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a certification by ID.
+
+        Args:
+            cert_id: The certification ID
+
+        Returns:
+            dict: The certification data or None if not found
+        """
+        with self.engine.connect() as connection:
+            data = connection.execute(
+                select(certifications_table.c.data).where(certifications_table.c.id == cert_id)
+            ).scalar()
+        return Certification.from_dict(json.loads(data)) if data is not None else None
+
+    def get_all_certifications(self) -> List[Dict[str, Any]]:
+        """
+        Get all certifications.
+
+        Returns:
+            list: List of all certifications
+        """
+        with self.engine.connect() as connection:
+            return [Certification.from_dict(json.loads(data)) for data in connection.execute(
+                select(certifications_table.c.data).order_by(certifications_table.c.id)).scalars()]
+
+    def get_sorted_certifications(self) -> List[Dict[str, Any]]:
+        """
+        Get all certifications sorted by title.
+
+        Returns:
+            list: Sorted list of certifications
+        """
+        with self.engine.connect() as connection:
+            return [Certification.from_dict(json.loads(data)) for data in connection.execute(
+                select(certifications_table.c.data).order_by(certifications_table.c.title)).scalars()]
+
+    def get_skill_tree(self, tree_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a skill tree by ID.
+
+        Args:
+            tree_id: The skill tree ID
+
+        Returns:
+            dict: The skill tree data or None if not found
+        """
+        with self.engine.connect() as connection:
+            data = connection.execute(
+                select(skill_trees_table.c.data).where(skill_trees_table.c.id == tree_id)
+            ).scalar()
+        return json.loads(data) if data is not None else None
+
+    def get_related_challenges(self, tutorial_id: str) -> List[Dict[str, Any]]:
+        """
+        Get challenges related to a tutorial.
+
+        Args:
+            tutorial_id: The tutorial ID
+
+        Returns:
+            list: List of challenges related to the tutorial
+        """
+        query = (select(challenges_table.c.data)
+                 .join(challenge_tutorials_table, challenge_tutorials_table.c.challenge_id == challenges_table.c.id)
+                 .where(challenge_tutorials_table.c.tutorial_id == tutorial_id)
+                 .order_by(challenges_table.c.id))
+        with self.engine.connect() as connection:
+            return self._challenge_rows(connection, query)
+
+    def _related_ids(self, connection, kind: str, item_id: str, table: Table, limit: int) -> List[str]:
+        """
+        Rank items of one kind by shared topics with an item.
+
+        Uses the same score as RelatedIndex: shared-topic ratio plus a
+        same-difficulty bonus, ties broken by ID.
+        """
+        topics = set(connection.execute(
+            select(topics_table.c.topic).where(
+                (topics_table.c.kind == kind) & (topics_table.c.item_id == item_id))
+        ).scalars())
+        if not topics:
+            return []
+
+        difficulty = connection.execute(select(table.c.difficulty).where(table.c.id == item_id)).scalar()
+        shared = (select(topics_table.c.item_id, func.count().label("shared"))
+                  .where((topics_table.c.kind == kind) & topics_table.c.topic.in_(topics)
+                         & (topics_table.c.item_id != item_id))
+                  .group_by(topics_table.c.item_id).subquery())
+        totals = (select(topics_table.c.item_id, func.count().label("total"))
+                  .where(topics_table.c.kind == kind)
+                  .group_by(topics_table.c.item_id).subquery())
+        rows = connection.execute(
+            select(shared.c.item_id, shared.c.shared, totals.c.total, table.c.difficulty)
+            .join(totals, totals.c.item_id == shared.c.item_id)
+            .join(table, table.c.id == shared.c.item_id)
+        )
+
+        scored = []
+        for other_id, shared_count, total, other_difficulty in rows:
+            relevance = shared_count / max(len(topics), total)
+            if other_difficulty == difficulty:
+                relevance += SAME_DIFFICULTY_BONUS
+            scored.append((-relevance, other_id))
+        scored.sort()
+        return [other_id for _, other_id in scored[:limit]]
+
+    def get_related_tutorials(self, tutorial_id: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Get tutorials that share topics with a tutorial, most relevant first.
+
+        Args:
+            tutorial_id: The tutorial ID
+            limit: Maximum number of tutorials to return
+
+        Returns:
+            list: List of related tutorials
+        """
+        with self.engine.connect() as connection:
+            related_ids = self._related_ids(connection, 'tutorial', tutorial_id, tutorials_table, limit)
+            by_id = {tutorial['id']: tutorial for tutorial in self._tutorial_headers(
+                connection, self._header_columns().where(tutorials_table.c.id.in_(related_ids)))}
+        return [by_id[other_id] for other_id in related_ids if other_id in by_id]
+
+    def get_similar_challenges(self, challenge_id: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Get challenges that share topics with a challenge, most relevant first.
+
+        Args:
+            challenge_id: The challenge ID
+            limit: Maximum number of challenges to return
+
+        Returns:
+            list: List of similar challenges
+        """
+        with self.engine.connect() as connection:
+            related_ids = self._related_ids(connection, 'challenge', challenge_id, challenges_table, limit)
+            by_id = {challenge['id']: challenge for challenge in self._challenge_rows(
+                connection, select(challenges_table.c.data).where(challenges_table.c.id.in_(related_ids)))}
+        return [by_id[other_id] for other_id in related_ids if other_id in by_id]
+
+    def search(self, query: str, limit: int = 10, filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Search tutorials and challenges with the database's full-text index.
+
+        Args:
+            query: Search terms
+            limit: Maximum number of results
+            filters: Optional 'type', 'difficulty' and 'topic' filters
+
+        Returns:
+            list: Ranked result dicts (type, id, title, difficulty, score)
+        """
+        if not self.fts_available:
+            return self._fallback_search_index().search(query, limit, filters)
+
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return []
+        filters = filters or {}
+        match = " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
+        weights = ", ".join(str(FIELD_WEIGHTS[field]) for field in ('title', 'description', 'topics', 'body'))
+
+        sql = ("SELECT f.kind, f.item_id, bm25(content_fts, 0, 0, " + weights + ") AS rank, "
+               "COALESCE(t.title, c.title), COALESCE(t.difficulty, c.difficulty) "
+               "FROM content_fts f "
+               "LEFT JOIN tutorials t ON f.kind = 'tutorial' AND t.id = f.item_id "
+               "LEFT JOIN challenges c ON f.kind = 'challenge' AND c.id = f.item_id "
+               "WHERE content_fts MATCH :match")
+        params = {"match": match, "limit": limit}
+        if filters.get('type'):
+            sql += " AND f.kind = :kind"
+            params['kind'] = filters['type'].lower().rstrip('s')
+        if filters.get('difficulty'):
+            sql += " AND COALESCE(t.difficulty, c.difficulty) = :difficulty"
+            params['difficulty'] = filters['difficulty'].lower()
+        if filters.get('topic'):
+            sql += (" AND EXISTS (SELECT 1 FROM topics p WHERE p.kind = f.kind "
+                    "AND p.item_id = f.item_id AND p.topic = :topic)")
+            params['topic'] = filters['topic'].lower()
+        sql += " ORDER BY rank LIMIT :limit"
+
+        with self.engine.connect() as connection:
+            rows = connection.execute(text(sql), params).all()
+        return [{
+            'type': kind,
+            'id': item_id,
+            'title': title or '',
+            'difficulty': difficulty or '',
+            'score': round(-rank, 4),
+        } for kind, item_id, rank, title, difficulty in rows]
+
+    def _fallback_search_index(self) -> SearchIndex:
+        """In-memory BM25 index used when SQLite lacks FTS5."""
+        if self._search_index is None or self._search_generation != self.generation:
+            documents = [('tutorial', self.get_tutorial(t['id'])) for t in self.get_all_tutorials()]
+            documents += [('challenge', c) for c in self.get_all_challenges()]
+            self._search_index = SearchIndex.build(documents)
+            self._search_generation = self.generation
+        return self._search_index
+
+    def save_tutorial(self, tutorial_data: Dict[str, Any]) -> bool:
+        """
+        Save a tutorial to the database.
+
+        Args:
+            tutorial_data: The tutorial data to save
+
+        Returns:
+            bool: True if saved successfully, False otherwise
+        """
+        if not tutorial_data or 'id' not in tutorial_data:
+            return False
+
+        try:
+            with self.engine.begin() as connection:
+                self._remove_tutorial_rows(connection, tutorial_data['id'])
+                self._insert_tutorial(connection, tutorial_data)
+            self.generation += 1
+            return True
+        except Exception as e:
+            print(f"Error saving tutorial: {e}")
+            return False
+
+    def save_many(self, tutorials: Iterable[Dict[str, Any]]) -> int:
+        """
+        Save a batch of tutorials in one transaction.
+
+        Args:
+            tutorials: Tutorial data (items without an ID are skipped)
+
+        Returns:
+            int: Number of tutorials saved (0 if the transaction failed)
+        """
+        saved = 0
+        try:
+            with self.engine.begin() as connection:
+                for tutorial_data in tutorials:
+                    if not tutorial_data or 'id' not in tutorial_data:
+                        continue
+                    self._remove_tutorial_rows(connection, tutorial_data['id'])
+                    self._insert_tutorial(connection, tutorial_data)
+                    saved += 1
+            if saved:
+                self.generation += 1
+            return saved
+        except Exception as e:
+            print(f"Error saving tutorials: {e}")
+            return 0
+
+    def delete_tutorial(self, tutorial_id: str) -> bool:
+        """
+        Delete a tutorial from the database.
+
+        Args:
+            tutorial_id: The tutorial ID to delete
+
+        Returns:
+            bool: True if deleted successfully, False otherwise
+        """
+        try:
+            with self.engine.begin() as connection:
+                exists = connection.execute(
+                    select(tutorials_table.c.id).where(tutorials_table.c.id == tutorial_id)
+                ).first()
+                if not exists:
+                    return False
+                self._remove_tutorial_rows(connection, tutorial_id)
+            self.generation += 1
+            return True
+        except Exception as e:
+            print(f"Error deleting tutorial: {e}")
+            return False
+
+    def warm(self):
+        """Build the relationship graph ahead of the first query that needs it."""
+        self.graph
+
+    def after_fork(self):
+        """
+        Reset per-process state in a child forked from a preloaded repository.
+
+        SQLite connections must not be shared between processes, so the
+        child drops the pooled connections inherited from the parent
+        (without closing them under the parent) and opens its own.
+        """
+        self.engine.dispose(close=False)
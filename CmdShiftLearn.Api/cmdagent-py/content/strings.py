@@ -0,0 +1,112 @@
+"""
+Deduplicated string pool for content text.
+"""
+
+import sys
+from collections import defaultdict
+from typing import Dict, List, Any
+
+from content.models import ContentItem
+
+
+class StringPool:
+    """
+    Pool of distinct strings shared by every loaded content item.
+
+    Identical hints, instructions, code snippets, topic names and labels
+    are replaced by one shared ``str`` object, so duplicate text is stored
+    once. Statistics are kept per field (e.g. ``tutorialstep.hint``) so the
+    memory report can show where the savings come from.
+    """
+
+    def __init__(self):
+        """Initialize an empty pool."""
+        self._strings: Dict[str, str] = {}
+        # field -> [values, unique values, bytes stored, bytes saved]
+        self._stats: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0, 0])
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def intern(self, value: str, field: str = 'other', count: bool = True) -> str:
+        """
+        Return the pooled copy of a string.
+
+        Args:
+            value: The string
+            field: Field name the value belongs to (for the report)
+            count: Record the value in the statistics
+
+        Returns:
+            str: The shared instance
+        """
+        pooled = self._strings.get(value)
+        if pooled is None:
+            self._strings[value] = value
+        if count:
+            stats = self._stats[field]
+            stats[0] += 1
+            if pooled is None:
+                stats[1] += 1
+                stats[2] += sys.getsizeof(value)
+            else:
+                stats[3] += sys.getsizeof(value)
+        return pooled if pooled is not None else value
+
+    def pool_item(self, item: Any, prefix: str = None, count: bool = True) -> Any:
+        """
+        Replace the strings of a content item with pooled copies, in place.
+
+        Walks the string and list-of-string fields of a model, and the steps
+        of a tutorial. Other values (nested mappings, numbers) are left alone.
+
+        Args:
+            item: A ContentItem (other values are returned unchanged)
+            prefix: Field name prefix for the report (defaults to the model name)
+            count: Record the values in the statistics (off when re-pooling
+                   data that was already counted, e.g. reloaded tutorial steps)
+
+        Returns:
+            The same item
+        """
+        if not isinstance(item, ContentItem):
+            return item
+
+        prefix = prefix or type(item).__name__.lower()
+        for name in item.FIELDS:
+            value = getattr(item, name)
+            if isinstance(value, str):
+                object.__setattr__(item, name, self.intern(value, f"{prefix}.{name}", count))
+            elif isinstance(value, list):
+                for i, element in enumerate(value):
+                    if isinstance(element, str):
+                        value[i] = self.intern(element, f"{prefix}.{name}", count)
+                    elif isinstance(element, ContentItem):
+                        self.pool_item(element, count=count)
+        return item
+
+    def strings(self) -> List[str]:
+        """
+        The distinct strings in the pool.
+
+        Returns:
+            list: Every pooled string once
+        """
+        return list(self._strings)
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Per-field deduplication statistics, biggest savings first.
+
+        Returns:
+            list: Dicts with field, values, unique, bytes_stored and bytes_saved
+        """
+        rows = [{
+            'field': field,
+            'values': values,
+            'unique': unique,
+            'bytes_stored': stored,
+            'bytes_saved': saved,
+        } for field, (values, unique, stored, saved) in self._stats.items()]
+        rows.sort(key=lambda row: (-row['bytes_saved'], row['field']))
+        return rows
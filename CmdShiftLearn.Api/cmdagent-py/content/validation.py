@@ -0,0 +1,256 @@
+"""
+Build-time validation of content items.
+"""
+
+import re
+from collections import Counter
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Iterable, Tuple
+
+from content.index import DIFFICULTY_ORDER
+from content.graph import ContentGraph
+
+
+# Step types the tutorial runners understand
+STEP_TYPES = ('text', 'command', 'challenge')
+
+# Validation types understood by the input handler
+VALIDATION_TYPES = ('exact', 'fuzzy', 'regex', 'output')
+
+
+def _issue(severity: str, kind: str, item_id: Any, message: str, path: Any = None) -> Dict[str, Any]:
+    """Build one validation finding."""
+    return {
+        'severity': severity,
+        'kind': kind,
+        'id': item_id,
+        'path': str(path) if path else None,
+        'message': message,
+    }
+
+
+def _check_regex(pattern: Any, where: str, errors: List[str]):
+    """Record an error if a pattern does not compile."""
+    if not isinstance(pattern, str):
+        errors.append(f"{where}: regex pattern must be a string")
+        return
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        errors.append(f"{where}: invalid regex {pattern!r}: {e}")
+
+
+def _check_common(item: Mapping, errors: List[str]):
+    """Checks shared by tutorials and challenges."""
+    for field in ('id', 'title'):
+        if not isinstance(item.get(field), str) or not item.get(field).strip():
+            errors.append(f"'{field}' must be a non-empty string")
+
+    difficulty = item.get('difficulty')
+    if difficulty is not None and str(difficulty).lower() not in DIFFICULTY_ORDER:
+        errors.append(f"unknown difficulty {difficulty!r} (expected one of {', '.join(DIFFICULTY_ORDER)})")
+
+    xp_reward = item.get('xp_reward')
+    if xp_reward is not None and (not isinstance(xp_reward, int) or isinstance(xp_reward, bool) or xp_reward < 0):
+        errors.append(f"'xp_reward' must be a non-negative integer, got {xp_reward!r}")
+
+    topics = item.get('topics')
+    if topics is not None and (not isinstance(topics, list) or not all(isinstance(t, str) for t in topics)):
+        errors.append("'topics' must be a list of strings")
+
+
+def _check_step(step: Any, number: int, errors: List[str]):
+    """Checks for one tutorial step."""
+    where = f"step {number}"
+    if not isinstance(step, Mapping):
+        errors.append(f"{where}: must be a mapping")
+        return
+
+    step_type = step.get('type', 'text')
+    if step_type not in STEP_TYPES:
+        errors.append(f"{where}: unknown type {step_type!r}")
+    if not step.get('content') and not step.get('title'):
+        errors.append(f"{where}: needs 'content' or 'title'")
+
+    validation_type = step.get('validation_type') or 'exact'
+    if validation_type not in VALIDATION_TYPES:
+        errors.append(f"{where}: unknown validation_type {validation_type!r}")
+
+    if step_type in ('command', 'challenge'):
+        command = step.get('command')
+        if not isinstance(command, str) or not command.strip():
+            errors.append(f"{where}: {step_type} steps need a 'command'")
+        elif validation_type == 'regex':
+            _check_regex(command, where, errors)
+
+    validation = step.get('validation')
+    if isinstance(validation, Mapping):
+        if validation.get('type', 'exact') == 'regex':
+            _check_regex(validation.get('pattern'), f"{where} validation", errors)
+        if validation.get('outputMatch') is not None:
+            _check_regex(validation.get('outputMatch'), f"{where} outputMatch", errors)
+    elif validation is not None:
+        errors.append(f"{where}: 'validation' must be a mapping")
+
+    xp_reward = step.get('xp_reward')
+    if xp_reward is not None and (not isinstance(xp_reward, int) or isinstance(xp_reward, bool) or xp_reward < 0):
+        errors.append(f"{where}: 'xp_reward' must be a non-negative integer")
+
+
+def validate_item(kind: str, item: Any) -> List[str]:
+    """
+    Check one content item against the schema for its kind.
+
+    Items should already be normalized models (see content.models), so
+    alternative key spellings are accepted under their canonical names.
+
+    Args:
+        kind: Content kind (tutorials, challenges, ...)
+        item: The item
+
+    Returns:
+        list: Error messages (empty if the item is valid)
+    """
+    errors = []
+    if not isinstance(item, Mapping):
+        return ["item must be a mapping"]
+
+    if kind == 'tutorials':
+        _check_common(item, errors)
+        steps = item.get('steps')
+        if not isinstance(steps, list) or not steps:
+            errors.append("'steps' must be a non-empty list")
+        else:
+            ids = Counter(step.get('id') for step in steps if isinstance(step, Mapping) and step.get('id'))
+            for step_id, count in ids.items():
+                if count > 1:
+                    errors.append(f"step id {step_id!r} is used {count} times")
+            for number, step in enumerate(steps, 1):
+                _check_step(step, number, errors)
+        prerequisites = item.get('prerequisites')
+        if prerequisites is not None and not isinstance(prerequisites, list):
+            errors.append("'prerequisites' must be a list")
+
+    elif kind == 'challenges':
+        _check_common(item, errors)
+        if not item.get('content') and not item.get('description'):
+            errors.append("needs 'content' or 'description'")
+        validation_type = item.get('validation_type') or 'exact'
+        if validation_type not in VALIDATION_TYPES:
+            errors.append(f"unknown validation_type {validation_type!r}")
+        elif validation_type == 'regex' and item.get('solution') is not None:
+            _check_regex(item.get('solution'), "solution", errors)
+
+    elif kind == 'certifications':
+        if not isinstance(item.get('id'), str) or not item.get('id'):
+            errors.append("'id' must be a non-empty string")
+        tutorials = item.get('tutorials')
+        if tutorials is not None and not isinstance(tutorials, list):
+            errors.append("'tutorials' must be a list")
+        domains = item.get('domains')
+        if domains is not None and not isinstance(domains, list):
+            errors.append("'domains' must be a list")
+
+    elif not item.get('id'):
+        errors.append("'id' must not be empty")
+
+    return errors
+
+
+def _validate_batch(batch: List[Tuple[str, Any, Any]]) -> List[Tuple[str, Any, List[str]]]:
+    """Validate a batch of (kind, id, item) in a worker process."""
+    return [(kind, item_id, validate_item(kind, item)) for kind, item_id, item in batch]
+
+
+def validate_catalog(catalog: Dict[str, Dict], workers: int = 1,
+                     load_errors: Iterable[Tuple[Any, str]] = ()) -> List[Dict[str, Any]]:
+    """
+    Validate a whole catalog.
+
+    Per-item schema and regex checks run in parallel over ``workers``
+    processes. Cross-item checks (duplicate IDs, dangling references,
+    prerequisite cycles) run afterwards on the whole catalog.
+
+    Args:
+        catalog: Catalog as returned by ContentRepository.read_catalog()
+        workers: Number of worker processes (1 validates in-process)
+        load_errors: (path, message) for files that could not be loaded at all
+
+    Returns:
+        list: Findings, each a dict with severity ('error' or 'warning'),
+              kind, id, path and message
+    """
+    paths = catalog.get('paths', {})
+    issues = [_issue('error', None, None, message, path) for path, message in load_errors]
+
+    items = [(kind, item_id, catalog[kind][item_id])
+             for kind in ('tutorials', 'challenges', 'certifications', 'skill_trees')
+             for item_id in catalog.get(kind, {})]
+    if workers > 1 and len(items) > 1:
+        size = max(1, len(items) // (workers * 4))
+        batches = [items[i:i + size] for i in range(0, len(items), size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = [result for batch in executor.map(_validate_batch, batches) for result in batch]
+    else:
+        results = _validate_batch(items)
+
+    for kind, item_id, errors in results:
+        for message in errors:
+            issues.append(_issue('error', kind, item_id, message, paths.get((kind, item_id))))
+
+    # Two files defining the same ID: the last one silently wins at load time
+    defined = Counter(catalog.get('files', {}).values())
+    for (kind, item_id), count in defined.items():
+        if count > 1:
+            files = sorted(str(path) for path, key in catalog['files'].items() if key == (kind, item_id))
+            issues.append(_issue('error', kind, item_id, f"defined in {count} files: {', '.join(files)}"))
+
+    issues.extend(_reference_issues(catalog, paths))
+    return issues
+
+
+def _reference_issues(catalog: Dict[str, Dict], paths: Dict) -> List[Dict[str, Any]]:
+    """Dangling references and prerequisite cycles."""
+    issues = []
+    tutorials = catalog.get('tutorials', {})
+    graph = ContentGraph.from_catalog(catalog)
+
+    for tutorial_id in tutorials:
+        for prerequisite_id in sorted(graph.prerequisites.get(tutorial_id, ())):
+            if prerequisite_id not in tutorials:
+                issues.append(_issue('warning', 'tutorials', tutorial_id,
+                                     f"unknown prerequisite {prerequisite_id!r}",
+                                     paths.get(('tutorials', tutorial_id))))
+    for tutorial_id in sorted(graph.cyclic):
+        issues.append(_issue('warning', 'tutorials', tutorial_id, "part of a prerequisite cycle",
+                             paths.get(('tutorials', tutorial_id))))
+
+    for challenge_id, challenge in catalog.get('challenges', {}).items():
+        for tutorial_id in challenge.get('related_tutorials', []) or []:
+            if tutorial_id not in tutorials:
+                issues.append(_issue('warning', 'challenges', challenge_id,
+                                     f"unknown related tutorial {tutorial_id!r}",
+                                     paths.get(('challenges', challenge_id))))
+
+    for cert_id, cert in catalog.get('certifications', {}).items():
+        for tutorial_id in cert.get('tutorials', []) or []:
+            if tutorial_id not in tutorials:
+                issues.append(_issue('warning', 'certifications', cert_id,
+                                     f"unknown tutorial {tutorial_id!r}",
+                                     paths.get(('certifications', cert_id))))
+    return issues
+
+
+def has_errors(issues: Iterable[Dict[str, Any]]) -> bool:
+    """
+    Whether any finding is an error (warnings do not block a build).
+
+    Args:
+        issues: Findings from validate_catalog()
+
+    Returns:
+        bool: True if the content must not be published
+    """
+    return any(issue['severity'] == 'error' for issue in issues)
+
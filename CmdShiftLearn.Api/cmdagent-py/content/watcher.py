@@ -0,0 +1,152 @@
+"""
+Filesystem watcher for hot-reloading content files.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+
+# File extensions considered content files
+CONTENT_EXTENSIONS = ('.yaml', '.yml')
+
+ChangeCallback = Callable[[List[Path], List[Path], List[Path]], None]
+
+
+class ContentWatcher:
+    """
+    Watch a content tree and report added, modified and deleted files.
+
+    Change detection always works by diffing (mtime, size) snapshots of the
+    tree, so it is correct on every platform. When the optional ``watchdog``
+    package is installed its native backend (inotify, FSEvents, ...) only
+    wakes the scanner early; otherwise the tree is polled every ``interval``
+    seconds.
+    """
+
+    def __init__(self, root, callback: ChangeCallback, interval: float = 1.0,
+                 debounce: float = 0.2, use_native: bool = True):
+        """
+        Initialize the content watcher.
+
+        Args:
+            root: Directory to watch
+            callback: Called as callback(added, modified, deleted) with lists of paths
+            interval: Seconds between scans when no native events arrive
+            debounce: Seconds to wait after a native event so bursts of writes coalesce
+            use_native: Use the watchdog backend when it is installed
+        """
+        self.root = Path(root)
+        self.callback = callback
+        self.interval = interval
+        self.debounce = debounce
+        self.use_native = use_native and WATCHDOG_AVAILABLE
+        self._snapshot: Dict[Path, Tuple[int, int]] = {}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._observer = None
+
+    @property
+    def backend(self) -> str:
+        """Name of the change notification backend in use."""
+        return "watchdog" if self.use_native else "polling"
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        """
+        Take a (mtime, size) snapshot of every content file under the root.
+
+        Returns:
+            dict: Path -> (mtime_ns, size)
+        """
+        snapshot = {}
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if not filename.endswith(CONTENT_EXTENSIONS):
+                    continue
+                file_path = Path(dirpath) / filename
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                snapshot[file_path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def check(self) -> Tuple[List[Path], List[Path], List[Path]]:
+        """
+        Rescan the tree and return what changed since the previous scan.
+
+        Returns:
+            tuple: (added, modified, deleted) lists of paths
+        """
+        current = self._scan()
+        previous = self._snapshot
+        self._snapshot = current
+
+        added = sorted(path for path in current if path not in previous)
+        deleted = sorted(path for path in previous if path not in current)
+        modified = sorted(path for path, state in current.items()
+                          if path in previous and previous[path] != state)
+        return added, modified, deleted
+
+    def start(self):
+        """Start watching in a background thread."""
+        if self._thread:
+            return
+
+        self._snapshot = self._scan()
+        self._stop.clear()
+
+        if self.use_native:
+            watcher = self
+
+            class _WakeHandler(FileSystemEventHandler):
+                def on_any_event(self, event):
+                    watcher._wake.set()
+
+            self._observer = Observer()
+            self._observer.schedule(_WakeHandler(), str(self.root), recursive=True)
+            self._observer.start()
+
+        self._thread = threading.Thread(target=self._run, name="content-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching and wait for the background thread to exit."""
+        self._stop.set()
+        self._wake.set()
+        if self._observer:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        """Background loop: wait for a wake-up or the poll interval, then diff."""
+        while not self._stop.is_set():
+            woken = self._wake.wait(self.interval)
+            if self._stop.is_set():
+                break
+            if woken:
+                # Let editors finish their write/rename dance before scanning
+                self._stop.wait(self.debounce)
+                self._wake.clear()
+
+            added, modified, deleted = self.check()
+            if not (added or modified or deleted):
+                continue
+
+            try:
+                self.callback(added, modified, deleted)
+            except Exception as e:
+                print(f"Error applying content changes: {e}")
@@ -0,0 +1,211 @@
+"""
+Atomic YAML writes and a write-behind queue for authored content.
+"""
+
+import os
+import time
+import atexit
+import threading
+import yaml
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+# Use the C emitter when PyYAML was built with libyaml
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Upper bound in seconds on the wait before a failed write is retried
+MAX_RETRY_DELAY = 60.0
+
+
+def atomic_write_yaml(file_path, data: Any):
+    """
+    Write data as YAML so readers see either the old or the new file.
+
+    The document is written to a temporary file in the same directory and
+    renamed over the destination.
+
+    Args:
+        file_path: Destination file
+        data: Plain YAML data (dicts, lists, scalars)
+    """
+    file_path = Path(file_path)
+    os.makedirs(file_path.parent, exist_ok=True)
+    tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            yaml.dump(data, file, Dumper=YAML_DUMPER, default_flow_style=False, allow_unicode=True)
+        os.replace(tmp_path, file_path)
+    finally:
+        if tmp_path.exists():
+            os.remove(tmp_path)
+
+
+class WriteBehindQueue:
+    """
+    Coalescing write-behind queue for content files.
+
+    put() only records the latest data for a path; a background thread
+    writes every pending file at most ``delay`` seconds after the first
+    unwritten edit, so a burst of edits to one tutorial costs one write.
+    Files are written with atomic_write_yaml(). Data that is queued or
+    being written can be read back with pending(), so readers never see an
+    older version from disk. A write that fails stays queued and is
+    retried with exponential backoff (unless a newer edit replaces it);
+    failures() lists the files whose latest edit is not on disk. Pending
+    writes are flushed on close() and at interpreter exit.
+    """
+
+    def __init__(self, delay: float = 1.0):
+        """
+        Initialize the queue (the writer thread starts on first use).
+
+        Args:
+            delay: Maximum seconds an edit waits before it is written
+        """
+        self.delay = delay
+        self.stats = {'queued': 0, 'coalesced': 0, 'written': 0, 'errors': 0}
+        self._pending: Dict[Path, Any] = {}
+        self._inflight: Dict[Path, Any] = {}
+        # file -> (failed attempts, last error) for files whose latest write failed
+        self._failed: Dict[Path, Tuple[int, str]] = {}
+        self._deadline: Optional[float] = None
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+
+    def put(self, file_path, data: Any):
+        """
+        Queue data to be written to a file, replacing any queued data for it.
+
+        Args:
+            file_path: Destination file
+            data: Plain YAML data
+        """
+        file_path = Path(file_path)
+        with self._lock:
+            if not self._closed:
+                if file_path in self._pending:
+                    self.stats['coalesced'] += 1
+                self._pending[file_path] = data
+                self.stats['queued'] += 1
+                if self._deadline is None:
+                    self._deadline = time.monotonic() + self.delay
+                    self._wake.notify()
+                self._start()
+                return
+        # Late writes after close() go straight to disk
+        atomic_write_yaml(file_path, data)
+
+    def pending(self, file_path) -> Optional[Any]:
+        """
+        Data queued or being written for a file.
+
+        Args:
+            file_path: The file
+
+        Returns:
+            The newest unwritten data, or None if the file is up to date on disk
+        """
+        file_path = Path(file_path)
+        with self._lock:
+            if file_path in self._pending:
+                return self._pending[file_path]
+            return self._inflight.get(file_path)
+
+    def failures(self) -> Dict[Path, str]:
+        """
+        Files whose latest edit could not be written yet.
+
+        Returns:
+            dict: File -> error of the last attempt (the edit stays queued for a retry)
+        """
+        with self._lock:
+            return {file_path: error for file_path, (_, error) in self._failed.items()}
+
+    def discard(self, file_path):
+        """
+        Drop a queued write, e.g. because the file is being deleted.
+
+        Args:
+            file_path: The file
+        """
+        with self._flush_lock:
+            with self._lock:
+                self._pending.pop(Path(file_path), None)
+                self._failed.pop(Path(file_path), None)
+
+    def flush(self) -> int:
+        """
+        Write every pending file now.
+
+        Returns:
+            int: Number of files written
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = self._pending
+                self._pending = {}
+                self._inflight = batch
+                self._deadline = None
+
+            written = 0
+            failed = {}
+            for file_path, data in batch.items():
+                try:
+                    atomic_write_yaml(file_path, data)
+                    written += 1
+                except Exception as e:
+                    failed[file_path] = (data, str(e))
+
+            with self._lock:
+                self._inflight = {}
+                self.stats['written'] += written
+                for file_path in batch:
+                    if file_path not in failed:
+                        self._failed.pop(file_path, None)
+                for file_path, (data, error) in failed.items():
+                    self.stats['errors'] += 1
+                    attempts = self._failed.get(file_path, (0, None))[0] + 1
+                    self._failed[file_path] = (attempts, error)
+                    # Requeue unless a newer edit arrived meanwhile; that one is written instead
+                    self._pending.setdefault(file_path, data)
+                    retry_at = time.monotonic() + min(MAX_RETRY_DELAY, self.delay * (2 ** attempts))
+                    if self._deadline is None or retry_at < self._deadline:
+                        self._deadline = retry_at
+                    print(f"Error writing content file {file_path}: {error} "
+                          f"(attempt {attempts}, will retry)")
+                if failed:
+                    self._wake.notify()
+            return written
+
+    def _start(self):
+        """Start the writer thread (called with the lock held)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="content-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    def _run(self):
+        """Writer thread: wait for the oldest edit's deadline, then flush."""
+        while True:
+            with self._lock:
+                while not self._closed and (self._deadline is None or time.monotonic() < self._deadline):
+                    timeout = None if self._deadline is None else self._deadline - time.monotonic()
+                    self._wake.wait(timeout)
+                if self._closed:
+                    return
+            self.flush()
+
+    def close(self):
+        """Stop the writer thread and write everything still pending."""
+        with self._lock:
+            self._closed = True
+            self._wake.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+        for file_path, error in self.failures().items():
+            print(f"Edit to {file_path} could not be written and is lost: {error}")
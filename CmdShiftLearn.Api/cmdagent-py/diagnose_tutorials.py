@@ -40,6 +40,24 @@ console = Console()
 # Configuration
 from utils.config import API_BASE_URL, DATA_DIR
 from api.auth import login, load_api_key
+from content.repository import iter_content_files
+
+
+def _tutorial_roots() -> List[Path]:
+    """
+    Tutorial directories to search, without duplicates.
+    
+    Returns:
+        List[Path]: Candidate tutorial directories (some may not exist)
+    """
+    roots = []
+    for path in [
+        Path(DATA_DIR) / "content" / "tutorials",
+        Path(os.path.dirname(os.path.dirname(__file__))) / "data" / "content" / "tutorials",
+    ]:
+        if path.resolve() not in [root.resolve() for root in roots]:
+            roots.append(path)
+    return roots
 
 
 def check_local_tutorials() -> List[Dict[str, Any]]:
@@ -53,13 +71,8 @@ def check_local_tutorials() -> List[Dict[str, Any]]:
     
     local_tutorials = []
     
-    # Define paths to check
-    paths_to_check = [
-        Path(DATA_DIR) / "content" / "tutorials" / "beginner",
-        Path(DATA_DIR) / "content" / "tutorials",
-        Path(os.path.dirname(os.path.dirname(__file__))) / "data" / "content" / "tutorials" / "beginner",
-        Path(os.path.dirname(os.path.dirname(__file__))) / "data" / "content" / "tutorials",
-    ]
+    # Define paths to check (each tree is searched recursively)
+    paths_to_check = _tutorial_roots()
     
     # Create a tree for displaying tutorial files
     file_tree = Tree("[bold]Tutorial Files[/bold]")
@@ -72,15 +85,10 @@ def check_local_tutorials() -> List[Dict[str, Any]]:
             path_node.add(f"[red]Directory does not exist[/red]")
             continue
         
-        # Find all YAML files
-        yaml_files = list(path.glob("*.yaml")) + list(path.glob("*.yml"))
-        
-        if not yaml_files:
-            path_node.add(f"[yellow]No YAML files found[/yellow]")
-            continue
-        
-        # Load each tutorial file
-        for yaml_file in yaml_files:
+        # Load each tutorial file as the tree is walked
+        found = False
+        for yaml_file in iter_content_files(path):
+            found = True
             try:
                 with open(yaml_file, 'r', encoding='utf-8') as f:
                     content = f.read()
@@ -91,7 +99,7 @@ def check_local_tutorials() -> List[Dict[str, Any]]:
                         tutorial_title = tutorial_data.get("title", "Untitled")
                         
                         # Add to the tree
-                        file_info = f"[green]{yaml_file.name}[/green] - {tutorial_id}: {tutorial_title}"
+                        file_info = f"[green]{yaml_file.relative_to(path)}[/green] - {tutorial_id}: {tutorial_title}"
                         path_node.add(file_info)
                         
                         # Add to the list
@@ -110,6 +118,9 @@ def check_local_tutorials() -> List[Dict[str, Any]]:
             except Exception as e:
                 path_node.add(f"[red]{yaml_file.name} - Error: {str(e)}[/red]")
                 logger.error(f"Error loading tutorial file {yaml_file}: {str(e)}")
+        
+        if not found:
+            path_node.add(f"[yellow]No YAML files found[/yellow]")
     
     # Display the tree
     console.print(file_tree)
@@ -339,26 +350,20 @@ def diagnose_specific_tutorial(api_key: str, tutorial_id: str) -> None:
     console.print("[bold]Checking local files...[/bold]")
     
     local_tutorial = None
-    local_paths = [
-        Path(DATA_DIR) / "content" / "tutorials" / "beginner",
-        Path(DATA_DIR) / "content" / "tutorials",
-        Path(os.path.dirname(os.path.dirname(__file__))) / "data" / "content" / "tutorials" / "beginner",
-        Path(os.path.dirname(os.path.dirname(__file__))) / "data" / "content" / "tutorials",
-    ]
+    local_paths = _tutorial_roots()
     
     # Find local tutorial files
     possible_files = []
     
     for path in local_paths:
         if path.exists():
-            # Look for exact filename matches
-            for ext in [".yaml", ".yml"]:
-                file_path = path / f"{tutorial_id}{ext}"
-                if file_path.exists():
-                    possible_files.append(file_path)
-            
-            # Look for files with matching ID in content
-            for yaml_file in list(path.glob("*.yaml")) + list(path.glob("*.yml")):
+            for yaml_file in iter_content_files(path):
+                # Look for exact filename matches
+                if yaml_file.stem == tutorial_id:
+                    possible_files.append(yaml_file)
+                    continue
+                
+                # Look for files with matching ID in content
                 try:
                     with open(yaml_file, 'r', encoding='utf-8') as f:
                         content = f.read()
@@ -23,8 +23,11 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
-from api.tutorials import TutorialClient
+from api.tutorials import TutorialClient, TutorialPrefetcher, describe_cache_age
+from api.prefetch import SpeculativePrefetcher
+from api.outbox import get_outbox
 from api.auth import login, load_api_key
+from content.models import Tutorial, TutorialStep
 
 
 # Initialize Rich console if available
@@ -117,8 +120,9 @@ def display_step(step: Dict[str, Any], step_number: int, show_expected: bool = F
             print("This step is empty or not available.")
         return
     
-    instructions = step.get('instructions', 'No instructions available.')
-    expected_command = step.get('expectedCommand', 'No command specified.')
+    step = TutorialStep.from_dict(step)
+    instructions = step.content if step.content is not None else 'No instructions available.'
+    expected_command = step.command if step.command is not None else 'No command specified.'
     
     if RICH_AVAILABLE:
         # Display step header
@@ -198,8 +202,9 @@ def run_tutorial_step(step: Dict[str, Any], step_number: int) -> bool:
             print("This step is empty or not available.")
         return False
     
-    expected_command = step.get('expectedCommand', '')
-    hint = step.get('hint', 'Try reading the instructions carefully.')
+    step = TutorialStep.from_dict(step)
+    expected_command = step.command or ''
+    hint = step.hint if step.hint is not None else 'Try reading the instructions carefully.'
     
     # Display step instructions (without showing the expected command)
     display_step(step, step_number)
@@ -284,6 +289,18 @@ def prompt_for_tutorial_selection(tutorials: List[Dict[str, Any]]) -> Optional[D
         sys.exit(0)
 
 
+def prompt_for_next_tutorial(tutorial: Dict[str, Any]) -> bool:
+    """Ask whether to go on with the suggested next tutorial."""
+    title = tutorial.get('title', tutorial.get('id'))
+    try:
+        if RICH_AVAILABLE:
+            return Confirm.ask(f"\n[bold green]Continue with the next tutorial: {title}?[/bold green]", default=True)
+        answer = input(f"\nContinue with the next tutorial: {title}? (Y/n): ").strip().lower()
+        return answer in ('', 'y', 'yes')
+    except (KeyboardInterrupt, EOFError):
+        return False
+
+
 def run_tutorial(tutorial: Dict[str, Any], tutorial_client: TutorialClient) -> None:
     """Run an interactive tutorial with all its steps."""
     if not tutorial:
@@ -293,7 +310,8 @@ def run_tutorial(tutorial: Dict[str, Any], tutorial_client: TutorialClient) -> N
             print("Tutorial not found or could not be loaded.")
         return
     
-    steps = tutorial.get('steps', [])
+    tutorial = Tutorial.from_dict(tutorial)
+    steps = tutorial.steps or []
     
     if not steps:
         if RICH_AVAILABLE:
@@ -324,7 +342,7 @@ def run_tutorial(tutorial: Dict[str, Any], tutorial_client: TutorialClient) -> N
 def main():
     """Main entry point for the CLI application."""
     # Define API base URL
-    from utils.config import API_BASE_URL
+    from utils.config import API_BASE_URL, OFFLINE_FIRST
     
     print_header("CmdShiftLearn CLI Agent")
     
@@ -346,8 +364,12 @@ def main():
     else:
         print(f"Connecting to CmdShiftLearn API at: {API_BASE_URL}\n")
     
+    # Deliver progress that was saved while offline in earlier sessions
+    get_outbox().register(api_key)
+    
     # Create tutorial client with the API key
-    tutorial_client = TutorialClient(api_key)
+    # Offline-first (opt-in): show the last known tutorials at once and revalidate in the background
+    tutorial_client = TutorialClient(api_key, offline_first=OFFLINE_FIRST)
     
     try:
         # Fetch and display the list of tutorials
@@ -360,12 +382,37 @@ def main():
                 print("Failed to retrieve tutorials from the API. Please check your API key.")
             sys.exit(1)
             
+        # Fetch the details of every tutorial in the background while the menu is shown
+        prefetcher = TutorialPrefetcher(api_key)
+        prefetcher.start(tutorials)
+        
+        if tutorial_client.cache_age is not None:
+            notice = f"Showing tutorials saved {describe_cache_age(tutorial_client.cache_age)}"
+            if tutorial_client.revalidating:
+                notice += "; checking for updates in the background"
+            if RICH_AVAILABLE:
+                console.print(f"[dim]{notice}[/dim]")
+            else:
+                print(notice)
+        
+        # Runs on the revalidation thread: keep the fresh list for the main thread,
+        # which shows it the next time the menu is rendered
+        updates = {}
+        
+        def on_update(kind, tutorial_id, data):
+            if kind == 'tutorials' and data:
+                updates['tutorials'] = data
+        
+        tutorial_client.on_update(on_update)
+        
         print_header("Available Tutorials")
         print_tutorials(tutorials)
         
         # Prompt user to select a tutorial
         selected_tutorial = prompt_for_tutorial_selection(tutorials)
-        if selected_tutorial:
+        # While a tutorial runs, the ones likely to come next are fetched in the background
+        speculative = SpeculativePrefetcher(prefetcher)
+        while selected_tutorial:
             # Fetch the full tutorial details
             tutorial_id = selected_tutorial.get('id')
             if RICH_AVAILABLE:
@@ -373,16 +420,31 @@ def main():
             else:
                 print(f"\nLoading tutorial {tutorial_id}...")
             
-            full_tutorial = tutorial_client.get_tutorial_by_id(tutorial_id)
+            full_tutorial = (tutorial_client.get_cached_tutorial(tutorial_id)
+                             or prefetcher.get(tutorial_id, timeout=10.0)
+                             or tutorial_client.get_tutorial_by_id(tutorial_id))
             
-            if full_tutorial:
-                # Run the interactive tutorial
-                run_tutorial(full_tutorial, tutorial_client)
-            else:
+            if not full_tutorial:
                 if RICH_AVAILABLE:
                     console.print(f"[red]Failed to load tutorial {tutorial_id}. Please try again later.[/red]")
                 else:
                     print(f"Failed to load tutorial {tutorial_id}. Please try again later.")
+                break
+            
+            # Run the interactive tutorial
+            speculative.warm(full_tutorial, tutorials)
+            run_tutorial(full_tutorial, tutorial_client)
+            
+            fresh = updates.pop('tutorials', None)
+            if fresh:
+                tutorials[:] = fresh
+                print_header("Available Tutorials (updated)")
+                print_tutorials(tutorials)
+            
+            selected_tutorial = speculative.next_tutorial(full_tutorial, tutorials)
+            if selected_tutorial and not prompt_for_next_tutorial(selected_tutorial):
+                selected_tutorial = None
+        prefetcher.stop()
         
     except KeyboardInterrupt:
         if RICH_AVAILABLE:
@@ -5,12 +5,73 @@ Run script for CmdShiftLearn PowerShell learning platform.
 
 import os
 import sys
-from app import CmdShiftLearn
+import argparse
+from app import CmdShiftLearn, create_content_repository
+from content.prefork import PreforkHost, FORK_AVAILABLE
+from utils.config import load_config
+
+
+def run_seat(repository, tty: str) -> int:
+    """
+    Run one learner session on a terminal, in a forked child.
+
+    Args:
+        repository: The preloaded content repository shared with the parent
+        tty: Terminal device the session reads from and writes to
+
+    Returns:
+        int: Exit code
+    """
+    fd = os.open(tty, os.O_RDWR)
+    for target in (0, 1, 2):
+        os.dup2(fd, target)
+    os.close(fd)
+    sys.stdin = open(0, 'r', closefd=False)
+    sys.stdout = open(1, 'w', closefd=False)
+    sys.stderr = open(2, 'w', closefd=False)
+
+    try:
+        CmdShiftLearn(content_repository=repository).start()
+    except KeyboardInterrupt:
+        print("\nExiting CmdShiftLearn...")
+    return 0
+
+
+def run_seats(seats):
+    """
+    Load the content once and serve one session per terminal.
+
+    Args:
+        seats: Terminal device paths (e.g. /dev/pts/3)
+    """
+    if not FORK_AVAILABLE:
+        print("Serving several terminals needs os.fork(); on this platform start one "
+              "CmdShiftLearn per terminal with the 'bundle' content backend instead.")
+        sys.exit(1)
+
+    host = PreforkHost(create_content_repository(load_config()))
+    host.preload()
+    print(f"Content preloaded in {host.preload_ms:.0f} ms; starting {len(seats)} sessions...")
+    for tty in seats:
+        host.spawn(run_seat, tty)
+    failed = [pid for pid, code in host.wait().items() if code]
+    sys.exit(1 if failed else 0)
+
 
 def main():
     """Run the CmdShiftLearn application."""
+    parser = argparse.ArgumentParser(description="CmdShiftLearn PowerShell learning platform")
+    parser.add_argument('--seat', action='append', default=[], metavar='TTY',
+                        help="Serve a session on this terminal (repeatable); the content is "
+                             "loaded once and shared by all sessions")
+    args = parser.parse_args()
+
+    if args.seat:
+        run_seats(args.seat)
+        return
+
     print("Starting CmdShiftLearn PowerShell learning platform...")
-    
+
     try:
         app = CmdShiftLearn()
         app.start()
@@ -3,9 +3,10 @@
 Test all available tutorials from the API
 """
 
+import asyncio
 import logging
 from api.auth import get_auth_header
-from api.tutorials import TutorialClient
+from api.tutorials import TutorialClient, AsyncTutorialClient
 
 # Configure logging
 logging.basicConfig(
@@ -14,6 +15,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger('test_all_tutorials')
 
+async def fetch_all_details(api_key, tutorial_ids):
+    """Fetch the details of every tutorial concurrently"""
+    async with AsyncTutorialClient(api_key) as async_client:
+        return await async_client.get_many(tutorial_ids)
+
 def test_all_tutorials():
     """Test retrieving and parsing all available tutorials"""
     
@@ -35,8 +41,9 @@ def test_all_tutorials():
     for i, tutorial in enumerate(tutorials, 1):
         print(f"{i}. {tutorial.get('id')} - {tutorial.get('title')}")
     
-    # For each tutorial, test retrieving the full details
+    # Retrieve the full details of every tutorial at once
     print("\nTesting each tutorial...")
+    details = asyncio.run(fetch_all_details(api_key, [t.get('id') for t in tutorials if t.get('id')]))
     
     success_count = 0
     failure_count = 0
@@ -45,8 +52,8 @@ def test_all_tutorials():
         tutorial_id = tutorial_meta.get('id')
         print(f"\nTesting tutorial: {tutorial_id}")
         
-        # Get the full tutorial
-        tutorial = client.get_tutorial_by_id(tutorial_id)
+        # Get the full tutorial (retrying serially, with local fallbacks, if the concurrent fetch failed)
+        tutorial = details.get(tutorial_id) or client.get_tutorial_by_id(tutorial_id)
         
         if tutorial:
             success_count += 1
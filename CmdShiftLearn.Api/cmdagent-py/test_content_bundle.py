@@ -0,0 +1,109 @@
+"""
+Test script for content bundles: build, load through the repository and integrity checks.
+"""
+
+import os
+import tempfile
+import yaml
+
+from content.bundle import ContentBundle, BundleError
+from content.models import to_plain
+from content.repository import ContentRepository
+
+TUTORIALS = [
+    {'id': f"tutorial_{number}", 'title': f"Tutorial {number}", 'difficulty': 'beginner',
+     'topics': ['files'], 'xpReward': 10 * number,
+     'steps': [{'id': f"step{step}", 'instructions': 'Use the pipeline', 'expected_command': f"Get-Item {step}"}
+               for step in range(3)]}
+    for number in range(4)
+]
+CHALLENGE = {'id': 'challenge_1', 'title': 'Challenge', 'difficulty': 'beginner', 'related_tutorials': ['tutorial_0']}
+
+
+def build(tmp):
+    content_dir = os.path.join(tmp, "content")
+    for kind, items in (('tutorials', TUTORIALS), ('challenges', [CHALLENGE])):
+        os.makedirs(os.path.join(content_dir, kind), exist_ok=True)
+        for item in items:
+            with open(os.path.join(content_dir, kind, f"{item['id']}.yaml"), 'w', encoding='utf-8') as f:
+                yaml.safe_dump(item, f)
+    source = ContentRepository(content_dir, use_cache=False, verbose=False)
+    catalog = source.read_catalog()
+    bundle_path = os.path.join(tmp, "content.bundle")
+    manifest = ContentBundle.build(catalog, bundle_path)
+    return source, bundle_path, manifest
+
+
+def test_round_trip_through_the_repository():
+    with tempfile.TemporaryDirectory() as tmp:
+        source, bundle_path, _ = build(tmp)
+        source.load_all_content()
+        repository = ContentRepository(bundle_path=bundle_path, use_cache=False, verbose=False)
+        repository.load_all_content()
+        assert sorted(repository.tutorials) == sorted(t['id'] for t in TUTORIALS)
+        header = repository.get_all_tutorials()[0]
+        assert header.get('steps') is None and header['step_count'] == 3
+        for tutorial in TUTORIALS:
+            assert to_plain(repository.get_tutorial(tutorial['id'])) == to_plain(source.get_tutorial(tutorial['id']))
+        assert to_plain(repository.get_challenge('challenge_1')) == to_plain(source.get_challenge('challenge_1'))
+
+
+def test_strings_are_shared_between_items():
+    with tempfile.TemporaryDirectory() as tmp:
+        _, bundle_path, manifest = build(tmp)
+        assert manifest['strings'] > 0
+        with ContentBundle(bundle_path) as bundle:
+            first = bundle.read('tutorials', 'tutorial_0')
+            second = bundle.read('tutorials', 'tutorial_1')
+            assert first['steps'][0]['instructions'] is second['steps'][0]['instructions']
+
+
+def test_hashes_are_stable_and_detect_tampering():
+    with tempfile.TemporaryDirectory() as tmp:
+        _, bundle_path, manifest = build(tmp)
+        rebuilt_path = os.path.join(tmp, "rebuilt.bundle")
+        ContentBundle.build(ContentRepository(os.path.join(tmp, "content"), use_cache=False,
+                                              verbose=False).read_catalog(), rebuilt_path)
+        with ContentBundle(bundle_path) as bundle, ContentBundle(rebuilt_path) as rebuilt:
+            assert bundle.content_hash == rebuilt.content_hash
+            assert bundle.item_hashes('tutorials') == rebuilt.item_hashes('tutorials')
+            assert bundle.verify() == []
+            offset = manifest['items']['tutorials']['tutorial_1'][0]
+
+        with open(bundle_path, 'r+b') as f:
+            f.seek(offset + 8)
+            byte = f.read(1)
+            f.seek(offset + 8)
+            f.write(bytes([byte[0] ^ 0xFF]))
+        with ContentBundle(bundle_path) as bundle:
+            assert bundle.verify() == ['tutorials/tutorial_1']
+            try:
+                bundle.read('tutorials', 'tutorial_1', verify=True)
+                assert False, "tampered item was read"
+            except BundleError:
+                pass
+
+
+def test_invalid_files_are_rejected():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "not.bundle")
+        with open(path, 'wb') as f:
+            f.write(b"not a bundle at all, just some bytes")
+        try:
+            ContentBundle(path)
+            assert False, "invalid bundle was opened"
+        except BundleError:
+            pass
+
+
+def main():
+    print("==== Testing content bundles ====")
+    test_round_trip_through_the_repository()
+    test_strings_are_shared_between_items()
+    test_hashes_are_stable_and_detect_tampering()
+    test_invalid_files_are_rejected()
+    print("\n==== Test completed! ====")
+
+
+if __name__ == "__main__":
+    main()
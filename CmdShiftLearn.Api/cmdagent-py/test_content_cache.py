@@ -0,0 +1,86 @@
+"""
+Test script for the content snapshot cache.
+"""
+
+import os
+import time
+import tempfile
+import yaml
+
+from content.models import to_plain
+from content.repository import ContentRepository
+
+TUTORIALS = 6
+
+
+def write_yaml(path, data, bump=0):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        yaml.safe_dump(data, f)
+    if bump:
+        # Make the change visible to mtime checks on coarse-grained file systems
+        stamp = time.time() + bump
+        os.utime(path, (stamp, stamp))
+
+
+def tutorial(number, title=None):
+    return {'id': f"tutorial_{number}", 'title': title or f"Tutorial {number}", 'difficulty': 'beginner',
+            'topics': ['files'], 'steps': [{'id': 'step1', 'command': f"Get-Item {number}"}]}
+
+
+def write_content(content_dir):
+    for number in range(TUTORIALS):
+        write_yaml(os.path.join(content_dir, "tutorials", "beginner", f"tutorial_{number}.yaml"), tutorial(number))
+    write_yaml(os.path.join(content_dir, "challenges", "challenge_1.yaml"),
+               {'id': 'challenge_1', 'title': 'Challenge', 'related_tutorials': ['tutorial_0']})
+
+
+def load(content_dir, cache_path):
+    repository = ContentRepository(content_dir, cache_path=cache_path, verbose=False)
+    repository.load_all_content()
+    return repository
+
+
+def test_warm_load_is_served_from_the_snapshot():
+    with tempfile.TemporaryDirectory() as tmp:
+        content_dir = os.path.join(tmp, "content")
+        cache_path = os.path.join(tmp, "cache", "content_snapshot.bin")
+        write_content(content_dir)
+
+        cold = load(content_dir, cache_path)
+        assert cold.load_stats['cache_misses'] == TUTORIALS + 1
+        assert os.path.exists(cache_path)
+
+        warm = load(content_dir, cache_path)
+        assert warm.load_stats['cache_hits'] == TUTORIALS + 1
+        assert warm.load_stats['cache_misses'] == 0
+        assert to_plain(warm.get_tutorial('tutorial_3')) == to_plain(cold.get_tutorial('tutorial_3'))
+
+
+def test_only_changed_files_are_parsed_again():
+    with tempfile.TemporaryDirectory() as tmp:
+        content_dir = os.path.join(tmp, "content")
+        cache_path = os.path.join(tmp, "cache", "content_snapshot.bin")
+        write_content(content_dir)
+        load(content_dir, cache_path)
+
+        # Touched without changing the bytes: still a hit
+        touched = os.path.join(content_dir, "tutorials", "beginner", "tutorial_1.yaml")
+        os.utime(touched, (time.time() + 5, time.time() + 5))
+        write_yaml(os.path.join(content_dir, "tutorials", "beginner", "tutorial_2.yaml"),
+                   tutorial(2, "Tutorial 2, edited"), bump=5)
+
+        repository = load(content_dir, cache_path)
+        assert repository.load_stats['cache_misses'] == 1
+        assert repository.get_tutorial('tutorial_2')['title'] == "Tutorial 2, edited"
+
+
+def main():
+    print("==== Testing the content cache ====")
+    test_warm_load_is_served_from_the_snapshot()
+    test_only_changed_files_are_parsed_again()
+    print("\n==== Test completed! ====")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Test script for the typed content models: pickling and round-trips to YAML.
+"""
+
+import os
+import pickle
+import tempfile
+import yaml
+
+from content.models import Tutorial, TutorialStep, to_plain
+from content.repository import ContentRepository
+
+TUTORIAL = {
+    'id': 'models_tutorial',
+    'title': 'Models',
+    'xpReward': 50,
+    'steps': [
+        {'id': 'step1', 'instructions': 'List the files', 'expected_command': 'Get-ChildItem'},
+        {'id': 'step2', 'content': 'Show the date', 'expectedCommand': 'Get-Date'},
+    ],
+    'author': 'someone',
+}
+
+
+def test_aliases_read_as_fields():
+    tutorial = Tutorial.from_dict(TUTORIAL)
+    step = tutorial['steps'][0]
+    assert step.command == 'Get-ChildItem'
+    assert step.get('expected_command') == step.get('command') == 'Get-ChildItem'
+    assert step.instructions == 'List the files'
+    assert tutorial.xp_reward == 50
+    assert tutorial['author'] == 'someone'
+
+
+def test_to_dict_keeps_source_keys():
+    tutorial = Tutorial.from_dict(TUTORIAL)
+    assert to_plain(tutorial) == TUTORIAL
+    canonical = to_plain(tutorial, canonical=True)
+    assert canonical['xp_reward'] == 50
+    assert canonical['steps'][0] == {'id': 'step1', 'content': 'List the files', 'command': 'Get-ChildItem'}
+
+
+def test_pickle_round_trip():
+    tutorial = Tutorial.from_dict(TUTORIAL)
+    copy = pickle.loads(pickle.dumps(tutorial, pickle.HIGHEST_PROTOCOL))
+    assert to_plain(copy) == TUTORIAL
+
+
+def test_pickled_state_is_keyed_by_field_name():
+    step = TutorialStep.from_dict({'id': 'step1', 'title': 'First', 'command': 'Get-Date'})
+    fields, extra, source_keys = step.__getstate__()
+    assert fields == {'id': 'step1', 'title': 'First', 'command': 'Get-Date'}
+
+    # A field the model no longer has survives as an extra key
+    fields['retired_field'] = 'kept'
+    restored = TutorialStep.__new__(TutorialStep)
+    restored.__setstate__((dict(reversed(list(fields.items()))), extra, source_keys))
+    assert restored.title == 'First' and restored.command == 'Get-Date'
+    assert restored['retired_field'] == 'kept'
+    assert 'retired_field' not in step
+
+
+def test_save_keeps_key_names():
+    with tempfile.TemporaryDirectory() as content_dir:
+        os.makedirs(os.path.join(content_dir, "tutorials"))
+        file_path = os.path.join(content_dir, "tutorials", "models_tutorial.yaml")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            yaml.safe_dump(TUTORIAL, f)
+
+        repository = ContentRepository(content_dir, use_cache=False, verbose=False)
+        repository.load_all_content()
+        tutorial = repository.get_tutorial('models_tutorial').copy()
+        tutorial['title'] = 'Models, edited'
+        assert repository.save_tutorial(tutorial)
+
+        with open(file_path, encoding='utf-8') as f:
+            saved = yaml.safe_load(f)
+        assert saved['title'] == 'Models, edited'
+        assert saved['steps'] == TUTORIAL['steps']
+        assert saved['xpReward'] == 50
+
+
+def main():
+    print("==== Testing content models ====")
+    test_aliases_read_as_fields()
+    test_to_dict_keeps_source_keys()
+    test_pickle_round_trip()
+    test_pickled_state_is_keyed_by_field_name()
+    test_save_keeps_key_names()
+    print("\n==== Test completed! ====")
+
+
+if __name__ == "__main__":
+    main()
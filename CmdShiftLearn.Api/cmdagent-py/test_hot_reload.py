@@ -0,0 +1,93 @@
+"""
+Test script for hot reloading of the content tree.
+"""
+
+import os
+import time
+import tempfile
+import yaml
+
+from content.repository import ContentRepository
+
+TUTORIALS = 6
+
+
+def write_yaml(path, data, bump=0):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        yaml.safe_dump(data, f)
+    if bump:
+        # Make the change visible to mtime checks on coarse-grained file systems
+        stamp = time.time() + bump
+        os.utime(path, (stamp, stamp))
+
+
+def tutorial(number, title=None):
+    return {'id': f"tutorial_{number}", 'title': title or f"Tutorial {number}", 'difficulty': 'beginner',
+            'topics': ['files'], 'steps': [{'id': 'step1', 'command': f"Get-Item {number}"}]}
+
+
+def write_content(content_dir):
+    for number in range(TUTORIALS):
+        write_yaml(os.path.join(content_dir, "tutorials", "beginner", f"tutorial_{number}.yaml"), tutorial(number))
+    write_yaml(os.path.join(content_dir, "challenges", "challenge_1.yaml"),
+               {'id': 'challenge_1', 'title': 'Challenge', 'related_tutorials': ['tutorial_0']})
+
+
+def test_apply_changes_publishes_a_new_generation():
+    with tempfile.TemporaryDirectory() as tmp:
+        content_dir = os.path.join(tmp, "content")
+        write_content(content_dir)
+        repository = ContentRepository(content_dir, use_cache=False, verbose=False)
+        repository.load_all_content()
+        before = repository.snapshot()
+
+        tutorial_dir = os.path.join(content_dir, "tutorials", "beginner")
+        edited = os.path.join(tutorial_dir, "tutorial_0.yaml")
+        added = os.path.join(tutorial_dir, "tutorial_new.yaml")
+        deleted = os.path.join(tutorial_dir, "tutorial_5.yaml")
+        write_yaml(edited, tutorial(0, "Tutorial 0, edited"), bump=5)
+        write_yaml(added, tutorial('new'))
+        os.remove(deleted)
+
+        result = repository.apply_changes([edited, added, deleted])
+        assert result == {'updated': 2, 'removed': 1}
+        assert repository.generation == before.generation + 1
+        assert repository.get_tutorial('tutorial_0')['title'] == "Tutorial 0, edited"
+        assert repository.get_tutorial('tutorial_new') is not None
+        assert repository.get_tutorial('tutorial_5') is None
+
+        # A reader holding the old generation keeps a consistent view
+        assert before.tutorials['tutorial_0']['title'] == "Tutorial 0"
+        assert 'tutorial_5' in before.tutorials and 'tutorial_new' not in before.tutorials
+
+
+def test_watcher_hot_reloads_edits():
+    with tempfile.TemporaryDirectory() as tmp:
+        content_dir = os.path.join(tmp, "content")
+        write_content(content_dir)
+        repository = ContentRepository(content_dir, use_cache=False, verbose=False)
+        repository.load_all_content()
+        repository.watch(interval=0.05)
+        try:
+            write_yaml(os.path.join(content_dir, "tutorials", "beginner", "tutorial_4.yaml"),
+                       tutorial(4, "Tutorial 4, live"), bump=5)
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                if repository.get_tutorial('tutorial_4')['title'] == "Tutorial 4, live":
+                    break
+                time.sleep(0.05)
+            assert repository.get_tutorial('tutorial_4')['title'] == "Tutorial 4, live"
+        finally:
+            repository.stop_watching()
+
+
+def main():
+    print("==== Testing content hot reload ====")
+    test_apply_changes_publishes_a_new_generation()
+    test_watcher_hot_reloads_edits()
+    print("\n==== Test completed! ====")
+
+
+if __name__ == "__main__":
+    main()
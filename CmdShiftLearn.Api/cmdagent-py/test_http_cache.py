@@ -0,0 +1,110 @@
+"""
+Test script for the HTTP response cache: revalidation and validator-less responses.
+"""
+
+import os
+import tempfile
+import httpx
+
+from api.http_cache import HttpCache
+from api.resilience import RetryPolicy
+from api.session import ApiSession
+
+URL = "https://api.example.test/api/tutorials"
+
+
+class FakeApi:
+    """Serve canned responses and record the requests that reach the 'server'."""
+
+    def __init__(self):
+        self.requests = []
+        self.body = b'[{"id": "tutorial_01"}]'
+        self.headers = {}
+        self.down = False
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if self.down:
+            raise httpx.ConnectError("API unreachable", request=request)
+        etag = self.headers.get('etag')
+        if etag and request.headers.get('if-none-match') == etag:
+            return httpx.Response(304, headers=self.headers)
+        return httpx.Response(200, headers=self.headers, content=self.body)
+
+
+def make_session(api, cache_dir):
+    session = ApiSession(cache=HttpCache(cache_dir), retry=RetryPolicy(attempts=1))
+    session._client = httpx.Client(transport=httpx.MockTransport(api))
+    session._pid = os.getpid()
+    return session
+
+
+def test_not_modified_is_served_from_cache():
+    api = FakeApi()
+    api.headers = {'etag': '"v1"', 'content-type': 'application/json'}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        session = make_session(api, cache_dir)
+        assert session.get(URL).json() == [{'id': 'tutorial_01'}]
+
+        response = session.get(URL)
+        assert api.requests[-1].headers['if-none-match'] == '"v1"'
+        assert response.status_code == 200
+        assert response.json() == [{'id': 'tutorial_01'}]
+        assert session.cache.stats['revalidated'] == 1
+
+        # A changed resource replaces the entry
+        api.body, api.headers = b'[]', {'etag': '"v2"'}
+        assert session.get(URL).json() == []
+        assert session.cache.lookup(URL).headers['etag'] == '"v2"'
+
+
+def test_fresh_response_skips_the_request():
+    api = FakeApi()
+    api.headers = {'cache-control': 'max-age=300'}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        session = make_session(api, cache_dir)
+        session.get(URL)
+        session.get(URL)
+        assert len(api.requests) == 1
+        assert session.cache.stats['fresh'] == 1
+
+
+def test_response_without_validators_is_kept_for_offline_use():
+    api = FakeApi()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        session = make_session(api, cache_dir)
+        session.get(URL)
+        entry = session.cache.lookup(URL)
+        assert entry is not None and entry.max_age == 0 and not entry.is_fresh()
+
+        # Always refetched, unconditionally, while the API is up
+        api.body = b'[{"id": "tutorial_02"}]'
+        assert session.get(URL).json() == [{'id': 'tutorial_02'}]
+        assert 'if-none-match' not in api.requests[-1].headers
+        assert len(api.requests) == 2
+
+        # The last-known copy is served when it is down
+        api.down = True
+        assert session.get(URL).json() == [{'id': 'tutorial_02'}]
+
+
+def test_no_store_is_not_cached():
+    api = FakeApi()
+    api.headers = {'cache-control': 'no-store', 'etag': '"v1"'}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        session = make_session(api, cache_dir)
+        session.get(URL)
+        assert session.cache.lookup(URL) is None
+
+
+def main():
+    print("==== Testing the HTTP response cache ====")
+    test_not_modified_is_served_from_cache()
+    test_fresh_response_skips_the_request()
+    test_response_without_validators_is_kept_for_offline_use()
+    test_no_store_is_not_cached()
+    print("\n==== Test completed! ====")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Test script for lazy tutorial loading: headers in memory, bodies on demand.
+"""
+
+import os
+import tempfile
+import tracemalloc
+import yaml
+
+from content.repository import ContentRepository
+
+TUTORIALS = 40
+STEPS = 30
+
+
+def write_content(content_dir):
+    """Write a content tree of tutorials with long step bodies."""
+    tutorial_dir = os.path.join(content_dir, "tutorials", "beginner")
+    os.makedirs(tutorial_dir)
+    for number in range(TUTORIALS):
+        steps = [{'id': f"step{step}", 'title': f"Step {step}",
+                  'instructions': f"Instructions for step {step}. " * 40,
+                  'expected_command': f"Get-Item {step}"}
+                 for step in range(STEPS)]
+        tutorial = {'id': f"tutorial_{number:02d}", 'title': f"Tutorial {number}",
+                    'difficulty': 'beginner', 'steps': steps}
+        with open(os.path.join(tutorial_dir, f"tutorial_{number:02d}.yaml"), 'w', encoding='utf-8') as f:
+            yaml.safe_dump(tutorial, f)
+
+
+def cached_bytes(repository):
+    """Total size of the parse results held by a repository's content cache."""
+    return sum(len(entry[3]) for entry in repository.cache.entries.values())
+
+
+def load(content_dir, cache_path, lazy, measure=False):
+    """Load a repository, optionally measuring the memory it keeps."""
+    if measure:
+        tracemalloc.start()
+    repository = ContentRepository(content_dir, cache_path=cache_path, lazy=lazy, verbose=False)
+    repository.load_all_content()
+    retained = tracemalloc.get_traced_memory()[0] if measure else 0
+    if measure:
+        tracemalloc.stop()
+    return repository, retained
+
+
+def test_lazy_cache_holds_headers_only():
+    with tempfile.TemporaryDirectory() as tmp:
+        content_dir = os.path.join(tmp, "content")
+        cache_path = os.path.join(tmp, "cache", "content_snapshot.bin")
+        write_content(content_dir)
+
+        eager, _ = load(content_dir, cache_path, lazy=False)
+        lazy, _ = load(content_dir, cache_path, lazy=True)
+        print(f"Cached parse results: eager {cached_bytes(eager)} bytes, lazy {cached_bytes(lazy)} bytes")
+        assert lazy.cache.cache_path != eager.cache.cache_path
+        assert cached_bytes(lazy) * 10 < cached_bytes(eager)
+
+        # Warm runs are served from the snapshot files
+        eager, eager_memory = load(content_dir, cache_path, lazy=False, measure=True)
+        lazy, lazy_memory = load(content_dir, cache_path, lazy=True, measure=True)
+        print(f"Memory after a cached load: eager {eager_memory} bytes, lazy {lazy_memory} bytes")
+        assert lazy.load_stats['cache_hits'] == TUTORIALS
+        assert lazy_memory * 3 < eager_memory
+
+
+def test_lazy_bodies_load_on_demand():
+    with tempfile.TemporaryDirectory() as tmp:
+        content_dir = os.path.join(tmp, "content")
+        cache_path = os.path.join(tmp, "cache", "content_snapshot.bin")
+        write_content(content_dir)
+        load(content_dir, cache_path, lazy=True)
+        repository, _ = load(content_dir, cache_path, lazy=True)
+
+        header = repository.get_all_tutorials()[0]
+        assert header.get('steps') is None
+        assert header['step_count'] == STEPS
+
+        entries = dict(repository.cache.entries)
+        tutorial = repository.get_tutorial(header['id'])
+        assert len(tutorial['steps']) == STEPS
+        assert tutorial['steps'][0]['command'].startswith("Get-Item")
+        # Opening a tutorial does not touch the shared cache
+        assert repository.cache.entries == entries
+
+        catalog = repository.read_catalog()
+        assert len(catalog['tutorials'][header['id']]['steps']) == STEPS
+
+
+def main():
+    print("==== Testing lazy tutorial loading ====")
+    test_lazy_cache_holds_headers_only()
+    test_lazy_bodies_load_on_demand()
+    print("\n==== Test completed! ====")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Test script for the local tutorial resolver: lookups through the repository and file changes.
+"""
+
+import os
+import time
+import tempfile
+import yaml
+
+from content.repository import ContentRepository
+from content.resolver import LocalTutorialResolver
+
+
+def write_tutorial(path, tutorial):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        yaml.safe_dump(tutorial, f)
+    # Make the change visible to mtime checks on coarse-grained file systems
+    stamp = time.time() + 1
+    os.utime(path, (stamp, stamp))
+
+
+def make_tree(content_dir):
+    tutorial_dir = os.path.join(content_dir, "tutorials")
+    write_tutorial(os.path.join(tutorial_dir, "beginner", "a_intro.yaml"),
+                   {'id': 'intro', 'title': 'Intro (beginner)', 'steps': []})
+    write_tutorial(os.path.join(tutorial_dir, "intermediate", "b_intro.yml"),
+                   {'id': 'intro', 'title': 'Intro (intermediate)', 'steps': []})
+    write_tutorial(os.path.join(tutorial_dir, "beginner", "files.yaml"),
+                   {'id': 'files', 'title': 'Files', 'steps': [{'id': 'step1', 'command': 'Get-ChildItem'}]})
+    return tutorial_dir
+
+
+def test_duplicates_resolve_like_a_full_load():
+    with tempfile.TemporaryDirectory() as content_dir:
+        make_tree(content_dir)
+        repository = ContentRepository(content_dir, use_cache=False, verbose=False)
+        repository.load_all_content()
+        resolver = LocalTutorialResolver(ContentRepository(content_dir, use_cache=False, verbose=False))
+        assert resolver.resolve('intro')['title'] == repository.get_tutorial('intro')['title'] == 'Intro (intermediate)'
+        assert resolver.locate('intro').name == 'b_intro.yml'
+        assert resolver.resolve('files')['steps'][0]['command'] == 'Get-ChildItem'
+        assert resolver.resolve('missing') is None
+
+
+def test_resolves_through_a_loaded_repository():
+    with tempfile.TemporaryDirectory() as content_dir:
+        make_tree(content_dir)
+        repository = ContentRepository(content_dir, use_cache=False, verbose=False)
+        repository.load_all_content()
+        resolver = LocalTutorialResolver(repository)
+        generation = repository.generation
+        assert resolver.resolve('files')['title'] == 'Files'
+        # Nothing changed, so nothing was loaded again
+        assert repository.generation == generation
+        assert resolver.stats['reloaded'] == 0
+
+
+def test_changed_files_are_reloaded():
+    with tempfile.TemporaryDirectory() as content_dir:
+        tutorial_dir = make_tree(content_dir)
+        resolver = LocalTutorialResolver(ContentRepository(content_dir, use_cache=False, verbose=False))
+        assert resolver.resolve('files')['title'] == 'Files'
+
+        write_tutorial(os.path.join(tutorial_dir, "beginner", "files.yaml"),
+                       {'id': 'files', 'title': 'Files, edited', 'steps': []})
+        assert resolver.resolve('files')['title'] == 'Files, edited'
+
+        write_tutorial(os.path.join(tutorial_dir, "advanced", "network.yaml"),
+                       {'id': 'network', 'title': 'Network', 'steps': []})
+        assert resolver.resolve('network')['title'] == 'Network'
+
+        os.remove(os.path.join(tutorial_dir, "beginner", "files.yaml"))
+        assert resolver.resolve('files') is None
+        assert [tutorial['id'] for _, tutorial in resolver.tutorials()] == ['network', 'intro']
+
+
+def main():
+    print("==== Testing the local tutorial resolver ====")
+    test_duplicates_resolve_like_a_full_load()
+    test_resolves_through_a_loaded_repository()
+    test_changed_files_are_reloaded()
+    print("\n==== Test completed! ====")
+
+
+if __name__ == "__main__":
+    main()
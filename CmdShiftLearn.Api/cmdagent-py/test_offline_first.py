@@ -0,0 +1,116 @@
+"""
+Test script for offline-first tutorials: cached answers, background refresh and outages.
+"""
+
+import os
+import tempfile
+import threading
+import httpx
+
+from api.http_cache import HttpCache
+from api.resilience import RetryPolicy
+from api.session import ApiSession
+from api.tutorials import TutorialClient
+
+CATALOG = [{'id': 'tutorial_01', 'title': 'First steps'}]
+TUTORIAL = {'id': 'tutorial_01', 'title': 'First steps', 'steps': [{'id': 'step1', 'command': 'Get-Date'}]}
+
+
+class FakeApi:
+    """A tutorials API without ETag, Last-Modified or Cache-Control, like the real backend."""
+
+    def __init__(self):
+        self.catalog = list(CATALOG)
+        self.requests = 0
+        self.down = False
+
+    def __call__(self, request):
+        self.requests += 1
+        if self.down:
+            raise httpx.ConnectError("API unreachable", request=request)
+        if request.url.path.endswith('/tutorials'):
+            return httpx.Response(200, json=self.catalog)
+        if request.url.path.endswith('/tutorials/tutorial_01'):
+            return httpx.Response(200, json=TUTORIAL)
+        return httpx.Response(404)
+
+
+def make_client(api, cache_dir):
+    session = ApiSession(cache=HttpCache(cache_dir), retry=RetryPolicy(attempts=1))
+    session._client = httpx.Client(transport=httpx.MockTransport(api))
+    session._pid = os.getpid()
+    return TutorialClient(api_key='test-key', session=session, offline_first=True)
+
+
+def wait_for_revalidation(client):
+    """Wait until the client's background revalidations have finished."""
+    for _ in range(250):
+        if not client._revalidations:
+            return
+        threading.Event().wait(0.02)
+    raise AssertionError("revalidation did not finish")
+
+
+def test_second_run_is_served_from_cache():
+    api = FakeApi()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        client = make_client(api, cache_dir)
+        assert client.get_tutorials() == CATALOG
+        assert client.cache_age is None
+
+        # A new client, as on the next start of the app
+        client = make_client(api, cache_dir)
+        updated = threading.Event()
+        client.on_update(lambda kind, tutorial_id, data: updated.set())
+        assert client.get_tutorials() == CATALOG
+        assert client.cache_age is not None and client.revalidating
+
+        # The catalog is unchanged, so the background refresh reports nothing
+        wait_for_revalidation(client)
+        assert api.requests == 2
+        assert not updated.is_set()
+
+
+def test_background_refresh_reports_changes():
+    api = FakeApi()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        make_client(api, cache_dir).get_tutorials()
+        api.catalog = CATALOG + [{'id': 'tutorial_02', 'title': 'Files'}]
+
+        client = make_client(api, cache_dir)
+        updates = []
+        updated = threading.Event()
+        client.on_update(lambda kind, tutorial_id, data: (updates.append((kind, data)), updated.set()))
+        assert client.get_tutorials() == CATALOG
+        assert updated.wait(5)
+        wait_for_revalidation(client)
+        assert updates == [('tutorials', api.catalog)]
+        assert client.get_tutorials() == api.catalog
+        wait_for_revalidation(client)
+
+
+def test_cached_content_survives_an_outage():
+    api = FakeApi()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        client = make_client(api, cache_dir)
+        client.get_tutorials()
+        client.get_tutorial_by_id('tutorial_01')
+
+        api.down = True
+        client = make_client(api, cache_dir)
+        assert client.get_tutorials() == CATALOG
+        assert client.get_cached_tutorial('tutorial_01') == TUTORIAL
+        assert client.get_tutorial_by_id('tutorial_01') == TUTORIAL
+        wait_for_revalidation(client)
+
+
+def main():
+    print("==== Testing offline-first tutorials ====")
+    test_second_run_is_served_from_cache()
+    test_background_refresh_reports_changes()
+    test_cached_content_survives_an_outage()
+    print("\n==== Test completed! ====")
+
+
+if __name__ == "__main__":
+    main()
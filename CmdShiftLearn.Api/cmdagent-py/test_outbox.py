@@ -0,0 +1,123 @@
+"""
+Test script for the progress outbox: coalescing, retries across restarts and rejections.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import tempfile
+import httpx
+
+from api.outbox import ProgressOutbox
+from api.resilience import RetryPolicy, CircuitBreaker
+from api.session import ApiSession
+
+API_KEY = "test-key"
+
+
+class FakeApi:
+    """Record delivered progress events; can be down or reject everything."""
+
+    def __init__(self, status=200):
+        self.status = status
+        self.down = False
+        self.received = []
+
+    def __call__(self, request):
+        if self.down:
+            raise httpx.ConnectError("API unreachable", request=request)
+        if self.status == 200:
+            self.received.append(json.loads(request.content))
+        return httpx.Response(self.status, text="invalid event" if self.status >= 400 else "")
+
+
+def make_outbox(api, db_path, retry=None):
+    session = ApiSession(retry=RetryPolicy(attempts=1), breaker=CircuitBreaker(100, 30.0))
+    session._client = httpx.Client(transport=httpx.MockTransport(api))
+    session._pid = os.getpid()
+    return ProgressOutbox(db_path, session, retry or RetryPolicy(base_delay=30.0, max_delay=30.0))
+
+
+def wait_for(condition, timeout=5.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+def test_events_are_delivered_in_the_background():
+    api = FakeApi()
+    with tempfile.TemporaryDirectory() as tmp:
+        outbox = make_outbox(api, os.path.join(tmp, "outbox.db"))
+        outbox.enqueue('tutorial-complete', 'files', {'tutorialId': 'files', 'xpEarned': 50}, API_KEY)
+        assert wait_for(lambda: outbox.pending() == 0)
+        assert api.received == [{'tutorialId': 'files', 'xpEarned': 50}]
+        outbox.close()
+
+
+def test_events_survive_a_restart():
+    api = FakeApi()
+    api.down = True
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "outbox.db")
+        outbox = make_outbox(api, db_path, RetryPolicy(base_delay=600.0, max_delay=600.0))
+        outbox.enqueue('tutorial-complete', 'files', {'tutorialId': 'files', 'xpEarned': 50}, API_KEY)
+        assert wait_for(lambda: outbox.stats['retried'] >= 1)
+
+        # Completing the tutorial again updates the queued event; the best result wins
+        outbox.enqueue('tutorial-complete', 'files', {'tutorialId': 'files', 'xpEarned': 20}, API_KEY)
+        assert outbox.pending() == 1 and outbox.stats['coalesced'] == 1
+        outbox.close()
+
+        api.down = False
+        outbox = make_outbox(api, db_path)
+        assert outbox.pending() == 1
+        outbox.register(API_KEY)
+        assert wait_for(lambda: outbox.pending() == 0)
+        assert api.received == [{'tutorialId': 'files', 'xpEarned': 50}]
+        outbox.close()
+
+
+def test_rejected_events_are_kept_aside():
+    api = FakeApi(status=400)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "outbox.db")
+        outbox = make_outbox(api, db_path)
+        outbox.enqueue('tutorial-complete', 'files', {'tutorialId': 'files'}, API_KEY)
+        assert wait_for(lambda: outbox.stats['rejected'] == 1)
+        assert outbox.pending() == 0
+        outbox.close()
+
+        with sqlite3.connect(db_path) as db:
+            status, error = db.execute("SELECT status, last_error FROM events").fetchone()
+        assert status == 'rejected' and error.startswith("400")
+
+
+def test_server_errors_are_retried():
+    api = FakeApi(status=503)
+    with tempfile.TemporaryDirectory() as tmp:
+        outbox = make_outbox(api, os.path.join(tmp, "outbox.db"), RetryPolicy(base_delay=0.05, max_delay=0.05))
+        outbox.enqueue('tutorial-complete', 'files', {'tutorialId': 'files', 'xpEarned': 10}, API_KEY)
+        assert wait_for(lambda: outbox.stats['retried'] >= 2)
+        assert outbox.pending() == 1
+
+        api.status = 200
+        assert wait_for(lambda: outbox.pending() == 0)
+        assert api.received == [{'tutorialId': 'files', 'xpEarned': 10}]
+        outbox.close()
+
+
+def main():
+    print("==== Testing the progress outbox ====")
+    test_events_are_delivered_in_the_background()
+    test_events_survive_a_restart()
+    test_rejected_events_are_kept_aside()
+    test_server_errors_are_retried()
+    print("\n==== Test completed! ====")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Test script for related content: per-generation indexes and concurrent readers.
+"""
+
+import os
+import tempfile
+import threading
+import yaml
+
+from content.repository import ContentRepository
+
+TUTORIALS = [
+    {'id': 'files_1', 'title': 'Files 1', 'difficulty': 'beginner', 'topics': ['files', 'navigation'], 'steps': []},
+    {'id': 'files_2', 'title': 'Files 2', 'difficulty': 'beginner', 'topics': ['files'], 'steps': []},
+    {'id': 'network_1', 'title': 'Network 1', 'difficulty': 'advanced', 'topics': ['network'], 'steps': []},
+    {'id': 'network_2', 'title': 'Network 2', 'difficulty': 'advanced', 'topics': ['network', 'dns'], 'steps': []},
+]
+
+
+def make_repository(content_dir):
+    """Write the sample tutorials and load them."""
+    os.makedirs(os.path.join(content_dir, "tutorials"))
+    for tutorial in TUTORIALS:
+        with open(os.path.join(content_dir, "tutorials", f"{tutorial['id']}.yaml"), 'w', encoding='utf-8') as f:
+            yaml.safe_dump(tutorial, f)
+    repository = ContentRepository(content_dir, use_cache=False, verbose=False)
+    repository.load_all_content()
+    return repository
+
+
+def related_ids(repository, tutorial_id):
+    return [tutorial['id'] for tutorial in repository.get_related_tutorials(tutorial_id)]
+
+
+def test_related_follows_topics():
+    with tempfile.TemporaryDirectory() as content_dir:
+        repository = make_repository(content_dir)
+        assert related_ids(repository, 'files_1') == ['files_2']
+        assert related_ids(repository, 'network_2') == ['network_1']
+
+
+def test_snapshot_keeps_its_related_index():
+    with tempfile.TemporaryDirectory() as content_dir:
+        repository = make_repository(content_dir)
+        old = repository.snapshot()
+        assert old.related('tutorials').get_related_ids('network_1') == ['network_2']
+
+        moved = dict(repository.get_tutorial('network_1'))
+        moved['topics'] = ['files']
+        moved['difficulty'] = 'beginner'
+        assert repository.save_tutorial(moved)
+
+        # The new generation sees the change, the one a reader holds does not
+        assert 'network_1' in related_ids(repository, 'files_2')
+        assert related_ids(repository, 'network_2') == []
+        assert old.related('tutorials').get_related_ids('network_1') == ['network_2']
+        assert repository.snapshot().related('tutorials') is not old.related('tutorials')
+
+
+def test_concurrent_readers_during_reloads():
+    with tempfile.TemporaryDirectory() as content_dir:
+        repository = make_repository(content_dir)
+        errors = []
+        done = threading.Event()
+
+        def read():
+            while not done.is_set():
+                try:
+                    snapshot = repository.snapshot()
+                    for tutorial_id in snapshot.tutorials:
+                        for other_id in snapshot.related('tutorials').get_related_ids(tutorial_id):
+                            assert other_id in snapshot.tutorials
+                except Exception as e:
+                    errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for round_number in range(30):
+            tutorial = dict(repository.get_tutorial('files_2'))
+            tutorial['topics'] = ['files'] if round_number % 2 else ['network']
+            repository.save_tutorial(tutorial)
+        done.set()
+        for reader in readers:
+            reader.join()
+        assert not errors, errors
+
+
+def main():
+    print("==== Testing related content ====")
+    test_related_follows_topics()
+    test_snapshot_keeps_its_related_index()
+    test_concurrent_readers_during_reloads()
+    print("\n==== Test completed! ====")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Test script for API resilience: retry backoff, deadlines and the circuit breaker.
+"""
+
+import os
+import time
+import httpx
+
+from api.resilience import RetryPolicy, CircuitBreaker, CircuitOpenError, DeadlineExceeded
+from api.session import ApiSession
+
+URL = "https://api.example.test/api/tutorials"
+
+
+class FlakyApi:
+    """Answer with a scripted sequence of status codes (or errors), then 200."""
+
+    def __init__(self, script=()):
+        self.script = list(script)
+        self.requests = 0
+
+    def __call__(self, request):
+        self.requests += 1
+        outcome = self.script.pop(0) if self.script else 200
+        if outcome == 'error':
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(outcome, json=[])
+
+
+def make_session(api, **kwargs):
+    session = ApiSession(**kwargs)
+    session._client = httpx.Client(transport=httpx.MockTransport(api))
+    session._pid = os.getpid()
+    return session
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=0.5, max_delay=1.0)
+    for attempt in range(6):
+        delays = [policy.backoff(attempt) for _ in range(50)]
+        assert all(0 <= delay <= min(1.0, 0.5 * 2 ** attempt) for delay in delays)
+        assert len(set(delays)) > 1
+
+
+def test_schedule_stays_within_the_deadline():
+    assert [attempt for attempt, _ in RetryPolicy(attempts=4).schedule()] == [0, 1, 2, 3]
+    assert list(RetryPolicy(attempts=4).schedule(deadline=0)) == []
+    remaining = [left for _, left in RetryPolicy(attempts=2, deadline=5.0).schedule()]
+    assert 0 < remaining[-1] <= remaining[0] <= 5.0
+
+
+def test_retryable_failures():
+    request = httpx.Request('GET', URL)
+    assert RetryPolicy.is_retryable(httpx.Response(503))
+    assert RetryPolicy.is_retryable(httpx.Response(429))
+    assert not RetryPolicy.is_retryable(httpx.Response(404))
+    assert not RetryPolicy.is_retryable(httpx.Response(200))
+    assert RetryPolicy.is_retryable(error=httpx.ConnectError("refused", request=request))
+    assert not RetryPolicy.is_retryable(error=CircuitOpenError(10))
+    assert not RetryPolicy.is_retryable(error=ValueError("bad json"))
+
+
+def test_breaker_opens_and_recovers():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.1)
+    breaker.before_call()
+    breaker.record_failure()
+    assert not breaker.is_open
+    breaker.record_failure()
+    assert breaker.is_open and breaker.retry_in > 0
+    try:
+        breaker.before_call()
+        assert False, "open breaker let a call through"
+    except CircuitOpenError:
+        pass
+
+    # Half-open: one trial call, a failure opens it again
+    time.sleep(0.15)
+    breaker.before_call()
+    try:
+        breaker.before_call()
+        assert False, "second trial call was let through"
+    except CircuitOpenError:
+        pass
+    breaker.record_failure()
+    assert breaker.is_open
+
+    time.sleep(0.15)
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.failures == 0
+
+
+def test_session_retries_transient_failures():
+    api = FlakyApi([503, 'error'])
+    session = make_session(api, retry=RetryPolicy(attempts=3, base_delay=0.01))
+    assert session.get(URL).status_code == 200
+    assert api.requests == 3
+    assert session.breaker.failures == 0
+
+
+def test_session_gives_up_after_its_attempts():
+    api = FlakyApi([503, 503, 503, 503])
+    session = make_session(api, retry=RetryPolicy(attempts=2, base_delay=0.01))
+    assert session.get(URL).status_code == 503
+    assert api.requests == 2
+    assert session.breaker.failures == 1
+
+
+def test_posts_are_not_retried():
+    api = FlakyApi([503])
+    session = make_session(api, retry=RetryPolicy(attempts=3, base_delay=0.01))
+    assert session.post(URL, json={}).status_code == 503
+    assert api.requests == 1
+
+
+def test_exhausted_deadline_fails_fast():
+    api = FlakyApi()
+    session = make_session(api)
+    try:
+        session.get(URL, deadline=0)
+        assert False, "request ran without a budget"
+    except DeadlineExceeded:
+        pass
+    assert api.requests == 0
+
+
+def test_open_breaker_skips_the_network():
+    api = FlakyApi(['error'] * 10)
+    session = make_session(api, retry=RetryPolicy(attempts=1), breaker=CircuitBreaker(2, 30.0))
+    for _ in range(2):
+        try:
+            session.get(URL)
+        except httpx.ConnectError:
+            pass
+    requests = api.requests
+    try:
+        session.get(URL)
+        assert False, "open breaker let a request through"
+    except CircuitOpenError as e:
+        assert e.retry_in > 0
+    assert api.requests == requests
+
+
+def test_server_errors_count_as_failures():
+    api = FlakyApi([500, 500, 404])
+    session = make_session(api, retry=RetryPolicy(attempts=3), breaker=CircuitBreaker(2, 30.0))
+    assert session.get(URL).status_code == 500
+    assert session.breaker.failures == 1
+    session.get(URL)
+    assert session.breaker.is_open
+    session.breaker.opened_at -= 30.0
+    assert session.get(URL).status_code == 404
+    assert session.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_unexpected_error_releases_the_trial_call():
+    def broken(request):
+        raise RuntimeError("bug in the transport")
+
+    breaker = CircuitBreaker(1, 0.0)
+    breaker.record_failure()
+    session = make_session(broken, breaker=breaker)
+    for _ in range(2):
+        try:
+            session.get(URL)
+            assert False, "error was swallowed"
+        except RuntimeError:
+            pass
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    session._client = httpx.Client(transport=httpx.MockTransport(FlakyApi()))
+    assert session.get(URL).status_code == 200
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def main():
+    print("==== Testing API resilience ====")
+    test_backoff_is_jittered_and_capped()
+    test_schedule_stays_within_the_deadline()
+    test_retryable_failures()
+    test_breaker_opens_and_recovers()
+    test_session_retries_transient_failures()
+    test_session_gives_up_after_its_attempts()
+    test_posts_are_not_retried()
+    test_exhausted_deadline_fails_fast()
+    test_open_breaker_skips_the_network()
+    test_server_errors_count_as_failures()
+    test_unexpected_error_releases_the_trial_call()
+    print("\n==== Test completed! ====")
+
+
+if __name__ == "__main__":
+    main()
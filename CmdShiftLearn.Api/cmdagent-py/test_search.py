@@ -0,0 +1,123 @@
+"""
+Test script for full-text search: ranking, filters and the persisted index.
+"""
+
+import os
+import time
+import tempfile
+import yaml
+
+from content.repository import ContentRepository
+from content.search import SearchIndex, tokenize
+
+TUTORIALS = [
+    {'id': 'processes', 'title': 'Managing Processes', 'difficulty': 'intermediate', 'topics': ['processes'],
+     'description': 'Find and stop processes',
+     'steps': [{'id': 'step1', 'instructions': 'Run Get-Process to list processes', 'command': 'Get-Process'}]},
+    {'id': 'files', 'title': 'Working with Files', 'difficulty': 'beginner', 'topics': ['files'],
+     'description': 'Copy and move files',
+     'steps': [{'id': 'step1', 'instructions': 'List files with Get-ChildItem', 'command': 'Get-ChildItem'}]},
+    {'id': 'services', 'title': 'Services', 'difficulty': 'intermediate', 'topics': ['services'],
+     'description': 'Services run as background processes',
+     'steps': [{'id': 'step1', 'instructions': 'Run Get-Service', 'command': 'Get-Service'},
+               {'id': 'step2', 'content': 'Restart the spooler', 'expectedCommand': 'Restart-Service Spooler'}]},
+]
+CHALLENGE = {'id': 'kill_process', 'title': 'Stop a process', 'difficulty': 'intermediate',
+             'topics': ['processes'], 'content': 'Stop the notepad process with Stop-Process'}
+
+
+def load(tmp, lazy=False):
+    repository = ContentRepository(os.path.join(tmp, "content"), lazy=lazy,
+                                   cache_path=os.path.join(tmp, "cache", "content_snapshot.bin"), verbose=False)
+    repository.load_all_content()
+    return repository
+
+
+def make_repository(tmp):
+    content_dir = os.path.join(tmp, "content")
+    for tutorial in TUTORIALS:
+        path = os.path.join(content_dir, "tutorials", f"{tutorial['id']}.yaml")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            yaml.safe_dump(tutorial, f)
+    os.makedirs(os.path.join(content_dir, "challenges"))
+    with open(os.path.join(content_dir, "challenges", "kill_process.yaml"), 'w', encoding='utf-8') as f:
+        yaml.safe_dump(CHALLENGE, f)
+    return load(tmp)
+
+
+def test_tokenize_keeps_compound_commands():
+    assert tokenize("Run Get-Process now") == ['run', 'get-process', 'get', 'process', 'now']
+
+
+def test_title_matches_rank_first():
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = make_repository(tmp)
+        results = repository.search("processes")
+        assert results[0]['id'] == 'processes'
+        assert {result['id'] for result in results} >= {'processes', 'services'}
+        assert repository.search("get-childitem")[0]['id'] == 'files'
+        assert repository.search("nothing matches this") == []
+
+
+def test_step_content_and_commands_are_indexed():
+    # Raw YAML steps as well as typed ones, eager and lazy
+    index = SearchIndex.build(('tutorial', tutorial) for tutorial in TUTORIALS)
+    assert [r['id'] for r in index.search("spooler")] == ['services']
+    with tempfile.TemporaryDirectory() as tmp:
+        eager = make_repository(tmp)
+        lazy = load(tmp, lazy=True)
+        for repository in (eager, lazy):
+            assert [r['id'] for r in repository.search("spooler")] == ['services']
+            assert [r['id'] for r in repository.search("restart-service")] == ['services']
+        assert lazy.get_search_index().doc_lengths == eager.get_search_index().doc_lengths
+
+
+def test_filters():
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = make_repository(tmp)
+        assert [r['id'] for r in repository.search("process", filters={'type': 'challenges'})] == ['kill_process']
+        assert all(r['type'] == 'tutorial' for r in repository.search("process", filters={'type': 'tutorial'}))
+        assert [r['id'] for r in repository.search("files", filters={'difficulty': 'intermediate'})] == []
+        assert [r['id'] for r in repository.search("processes", filters={'topic': 'services'})] == ['services']
+
+
+def test_index_is_persisted_until_content_changes():
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = make_repository(tmp)
+        repository.search("files")
+        index_path = os.path.join(tmp, "cache", "search_index.bin")
+        assert os.path.exists(index_path)
+        fingerprint = repository.get_search_index().fingerprint
+        assert SearchIndex.load(index_path, fingerprint) is not None
+
+        # An unchanged tree reuses the saved index instead of writing a new one
+        os.utime(index_path, (1, 1))
+        reloaded = load(tmp)
+        assert reloaded.get_search_index().fingerprint == fingerprint
+        assert os.stat(index_path).st_mtime == 1
+
+        # An edit changes the fingerprint and the results
+        path = os.path.join(tmp, "content", "tutorials", "services.yaml")
+        edited = dict(TUTORIALS[2], title='Windows Services and Daemons')
+        with open(path, 'w', encoding='utf-8') as f:
+            yaml.safe_dump(edited, f)
+        os.utime(path, (time.time() + 5, time.time() + 5))
+        reloaded.apply_changes([path])
+        assert reloaded.get_search_index().fingerprint != fingerprint
+        assert reloaded.search("daemons")[0]['id'] == 'services'
+        assert SearchIndex.load(index_path, fingerprint) is None
+
+
+def main():
+    print("==== Testing full-text search ====")
+    test_tokenize_keeps_compound_commands()
+    test_title_matches_rank_first()
+    test_step_content_and_commands_are_indexed()
+    test_filters()
+    test_index_is_persisted_until_content_changes()
+    print("\n==== Test completed! ====")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Test script for the SQLite content backend: import and parity with the YAML repository.
+"""
+
+import os
+import tempfile
+import yaml
+
+from content.models import to_plain
+from content.repository import ContentRepository
+from content.sql_repository import SqlContentRepository
+
+TUTORIALS = [
+    {'id': 'intro', 'title': 'Introduction', 'difficulty': 'beginner', 'level': 1, 'topics': ['basics'],
+     'steps': [{'id': 'step1', 'instructions': 'Show the date', 'command': 'Get-Date'},
+               {'id': 'step2', 'instructions': 'Show the location', 'command': 'Get-Location'}]},
+    {'id': 'files', 'title': 'Files', 'difficulty': 'beginner', 'level': 2, 'topics': ['files', 'basics'],
+     'prerequisites': ['intro'], 'certification_mappings': [{'cert_id': 'admin'}],
+     'steps': [{'id': 'step1', 'instructions': 'List files', 'command': 'Get-ChildItem'}]},
+    {'id': 'acl', 'title': 'Access Control', 'difficulty': 'beginner', 'level': 2, 'topics': ['files', 'security'],
+     'prerequisites': ['files'], 'steps': []},
+    {'id': 'processes', 'title': 'Processes', 'difficulty': 'Intermediate', 'level': 3, 'topics': ['processes'],
+     'steps': [{'id': 'step1', 'instructions': 'List processes', 'command': 'Get-Process'}]},
+]
+CHALLENGES = [
+    {'id': 'find_files', 'title': 'Find files', 'difficulty': 'beginner', 'topics': ['files'],
+     'related_tutorials': ['files'], 'content': 'Find every log file'},
+    {'id': 'lock_down', 'title': 'Lock down a folder', 'difficulty': 'beginner', 'topics': ['files', 'security'],
+     'related_tutorials': ['acl', 'files'], 'content': 'Remove inherited permissions'},
+    {'id': 'stop_process', 'title': 'Stop a process', 'difficulty': 'intermediate', 'topics': ['processes'],
+     'related_tutorials': ['processes'], 'content': 'Stop notepad'},
+]
+CERTIFICATION = {'id': 'admin', 'title': 'Administrator', 'tutorials': ['intro', 'files']}
+
+
+def write_content(content_dir):
+    def dump(kind, item):
+        os.makedirs(os.path.join(content_dir, kind), exist_ok=True)
+        with open(os.path.join(content_dir, kind, f"{item['id']}.yaml"), 'w', encoding='utf-8') as f:
+            yaml.safe_dump(item, f)
+    for tutorial in TUTORIALS:
+        dump('tutorials', tutorial)
+    for challenge in CHALLENGES:
+        dump('challenges', challenge)
+    dump('certifications', CERTIFICATION)
+
+
+def load_both(tmp):
+    content_dir = os.path.join(tmp, "content")
+    write_content(content_dir)
+    yaml_repository = ContentRepository(content_dir, use_cache=False, verbose=False)
+    yaml_repository.load_all_content()
+    sql_repository = SqlContentRepository(os.path.join(tmp, "content.db"), content_dir, verbose=False)
+    sql_repository.load_all_content()
+    return yaml_repository, sql_repository
+
+
+def ids(items):
+    return [item['id'] for item in items]
+
+
+def test_import_counts():
+    with tempfile.TemporaryDirectory() as tmp:
+        _, sql_repository = load_both(tmp)
+        assert sql_repository.count_content() == {'tutorials': 4, 'challenges': 3,
+                                                  'certifications': 1, 'skill_trees': 0}
+
+
+def test_items_match_the_yaml_repository():
+    with tempfile.TemporaryDirectory() as tmp:
+        yaml_repository, sql_repository = load_both(tmp)
+        for tutorial in TUTORIALS:
+            assert to_plain(sql_repository.get_tutorial(tutorial['id'])) == \
+                to_plain(yaml_repository.get_tutorial(tutorial['id']))
+        for challenge in CHALLENGES:
+            assert to_plain(sql_repository.get_challenge(challenge['id'])) == \
+                to_plain(yaml_repository.get_challenge(challenge['id']))
+        assert to_plain(sql_repository.get_certification('admin')) == to_plain(yaml_repository.get_certification('admin'))
+        assert to_plain(sql_repository.get_tutorial_step('intro', 1)) == to_plain(yaml_repository.get_tutorial_step('intro', 1))
+        assert sql_repository.get_tutorial('missing') is None
+
+
+def test_queries_match_the_yaml_repository():
+    with tempfile.TemporaryDirectory() as tmp:
+        yaml_repository, sql_repository = load_both(tmp)
+        ordered = [
+            lambda r: r.get_sorted_tutorials(),
+            lambda r: r.get_sorted_tutorials('beginner'),
+            lambda r: r.get_sorted_tutorials(certification='admin'),
+            lambda r: r.get_tutorial_path('beginner'),
+            lambda r: r.get_sorted_challenges(),
+            lambda r: r.get_related_tutorials('files'),
+            lambda r: r.get_similar_challenges('find_files'),
+        ]
+        for query in ordered:
+            assert ids(query(sql_repository)) == ids(query(yaml_repository))
+
+        unordered = [
+            lambda r: r.get_all_tutorials(),
+            lambda r: r.get_tutorials_by_difficulty('INTERMEDIATE'),
+            lambda r: r.get_tutorials_by_topic('files'),
+            lambda r: r.get_tutorials_by_level(2),
+            lambda r: r.get_tutorials_by_certification('admin'),
+            lambda r: r.get_challenges_by_difficulty('beginner'),
+            lambda r: r.get_related_challenges('files'),
+        ]
+        for query in unordered:
+            assert sorted(ids(query(sql_repository))) == sorted(ids(query(yaml_repository)))
+
+        assert sql_repository.search("processes")[0]['id'] == yaml_repository.search("processes")[0]['id']
+
+
+def test_edits_are_visible_to_queries():
+    with tempfile.TemporaryDirectory() as tmp:
+        _, sql_repository = load_both(tmp)
+        tutorial = dict(sql_repository.get_tutorial('processes'))
+        tutorial['topics'] = ['processes', 'files']
+        assert sql_repository.save_tutorial(tutorial)
+        assert 'processes' in ids(sql_repository.get_tutorials_by_topic('files'))
+
+        assert sql_repository.delete_tutorial('acl')
+        assert sql_repository.get_tutorial('acl') is None
+        assert 'acl' not in ids(sql_repository.get_tutorial_path('beginner'))
+
+
+def main():
+    print("==== Testing the SQLite content backend ====")
+    test_import_counts()
+    test_items_match_the_yaml_repository()
+    test_queries_match_the_yaml_repository()
+    test_edits_are_visible_to_queries()
+    print("\n==== Test completed! ====")
+
+
+if __name__ == "__main__":
+    main()
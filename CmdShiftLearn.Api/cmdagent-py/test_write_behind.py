@@ -0,0 +1,82 @@
+"""
+Test script for the write-behind queue: coalescing, read-back and retries.
+"""
+
+import os
+import time
+import tempfile
+import yaml
+
+from content.writer import WriteBehindQueue
+from content.repository import ContentRepository
+
+
+def read_yaml(file_path):
+    with open(file_path, encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def test_edits_are_coalesced():
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, "tutorial.yaml")
+        queue = WriteBehindQueue(delay=0.2)
+        for version in range(5):
+            queue.put(file_path, {'id': 'tutorial', 'version': version})
+        assert queue.pending(file_path) == {'id': 'tutorial', 'version': 4}
+        assert not os.path.exists(file_path)
+
+        time.sleep(0.6)
+        assert read_yaml(file_path)['version'] == 4
+        assert queue.pending(file_path) is None
+        assert queue.stats['written'] == 1 and queue.stats['coalesced'] == 4
+        queue.close()
+
+
+def test_failed_write_is_retried():
+    with tempfile.TemporaryDirectory() as tmp:
+        # A file where the directory should be makes the write fail
+        blocker = os.path.join(tmp, "tutorials")
+        open(blocker, 'w').close()
+        file_path = os.path.join(blocker, "tutorial.yaml")
+
+        queue = WriteBehindQueue(delay=0.05)
+        queue.put(file_path, {'id': 'tutorial'})
+        assert queue.flush() == 0
+        assert [str(path) for path in queue.failures()] == [file_path]
+        assert queue.pending(file_path) == {'id': 'tutorial'}
+
+        os.remove(blocker)
+        deadline = time.monotonic() + 5
+        while queue.failures() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not queue.failures()
+        assert read_yaml(file_path) == {'id': 'tutorial'}
+        queue.close()
+
+
+def test_repository_reads_queued_edits():
+    with tempfile.TemporaryDirectory() as content_dir:
+        os.makedirs(os.path.join(content_dir, "tutorials"))
+        repository = ContentRepository(content_dir, use_cache=False, verbose=False, write_delay=30)
+        repository.load_all_content()
+        repository.save_tutorial({'id': 'queued', 'title': 'Queued', 'steps': [{'id': 'one'}]})
+
+        file_path = os.path.join(content_dir, "tutorials", "queued.yaml")
+        assert not os.path.exists(file_path)
+        assert repository.get_tutorial('queued')['title'] == 'Queued'
+        assert repository.write_errors() == {}
+
+        repository.close()
+        assert read_yaml(file_path)['title'] == 'Queued'
+
+
+def main():
+    print("==== Testing the write-behind queue ====")
+    test_edits_are_coalesced()
+    test_failed_write_is_retried()
+    test_repository_reads_queued_edits()
+    print("\n==== Test completed! ====")
+
+
+if __name__ == "__main__":
+    main()
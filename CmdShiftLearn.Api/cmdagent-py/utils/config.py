@@ -6,7 +6,7 @@ import os
 import json
 from pathlib import Path
 
-__all__ = ['BASE_DIR', 'DATA_DIR', 'API_BASE_URL', 'API_VERSION',
+__all__ = ['BASE_DIR', 'DATA_DIR', 'API_BASE_URL', 'API_VERSION', 'OFFLINE_FIRST',
            'DEFAULT_POWERSHELL_TIMEOUT', 'APP_NAME', 'APP_VERSION', 'DEFAULT_USER_SETTINGS',
            'ensure_directories', 'create_default_config', 'load_config']
 
@@ -20,6 +20,10 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 API_BASE_URL = "https://cmdshiftlearnv2.onrender.com/api"
 API_VERSION = "v1"
 
+# Show the last known tutorials at once and revalidate them in the background
+# (opt in with CMDSHIFTLEARN_OFFLINE_FIRST=1)
+OFFLINE_FIRST = os.environ.get("CMDSHIFTLEARN_OFFLINE_FIRST", "").lower() in ("1", "true", "yes")
+
 # Default PowerShell settings
 DEFAULT_POWERSHELL_TIMEOUT = 10  # seconds
 